@@ -15,6 +15,7 @@
 
 # This file imports and registers all required modules for this add-on.
 
+import time
 import bpy
 import bpy.utils.previews       # Imported for loading layer texture previews as icons.
 from bpy.props import PointerProperty, CollectionProperty, EnumProperty, StringProperty, BoolProperty, IntProperty
@@ -30,10 +31,10 @@ from .core.texture_set_settings import RYMAT_texture_set_settings, RYMAT_OT_set_
 from .core.shaders import RYMAT_shader_name, RYMAT_shader_material_channel, RYMAT_shader_unlayered_property, RYMAT_shader_info, RYMAT_OT_set_shader, RYMAT_OT_new_shader, RYMAT_OT_save_shader, RYMAT_OT_delete_shader, RYMAT_OT_add_shader_channel, RYMAT_OT_delete_shader_channel, RYMAT_OT_create_shader_from_nodetree, RYMAT_OT_apply_default_shader, update_shader_list
 
 # Material Layers
-from .core.material_layers import RYMAT_layer_stack, RYMAT_layers, RYMAT_OT_add_material_layer,RYMAT_OT_add_decal_material_layer, RYMAT_OT_add_image_layer, RYMAT_OT_delete_layer, RYMAT_OT_duplicate_layer, RYMAT_OT_move_material_layer_up, RYMAT_OT_move_material_layer_down,RYMAT_OT_toggle_material_channel_preview, RYMAT_OT_toggle_hide_layer, RYMAT_OT_set_layer_projection,RYMAT_OT_change_material_channel_value_node, RYMAT_OT_isolate_material_channel,RYMAT_OT_show_compiled_material, RYMAT_OT_toggle_image_alpha_blending, RYMAT_OT_set_material_channel, RYMAT_OT_set_matchannel_crgba_output, RYMAT_OT_set_layer_blending_mode, RYMAT_OT_merge_with_layer_below, RYMAT_OT_add_material_channel_nodes, RYMAT_OT_delete_material_channel_nodes, refresh_layer_stack, shader_node_tree_update
+from .core.material_layers import RYMAT_layer_stack, RYMAT_layers, RYMAT_OT_add_material_layer,RYMAT_OT_add_decal_material_layer, RYMAT_OT_add_image_layer, RYMAT_OT_delete_layer, RYMAT_OT_duplicate_layer, RYMAT_OT_move_material_layer_up, RYMAT_OT_move_material_layer_down,RYMAT_OT_toggle_material_channel_preview, RYMAT_OT_toggle_hide_layer, RYMAT_OT_set_layer_projection,RYMAT_OT_change_material_channel_value_node, RYMAT_OT_isolate_material_channel,RYMAT_OT_show_compiled_material, RYMAT_OT_toggle_image_alpha_blending, RYMAT_OT_set_material_channel, RYMAT_OT_set_matchannel_crgba_output, RYMAT_OT_set_layer_blending_mode, RYMAT_OT_merge_with_layer_below, RYMAT_OT_add_material_channel_nodes, RYMAT_OT_delete_material_channel_nodes, RYMAT_OT_benchmark_layer_node_lookup, RYMAT_OT_benchmark_layer_construction, RYMAT_OT_validate_layer_stack, refresh_layer_stack, invalidate_layer_node_index, clear_triplanar_sync_state
 
 # Layer Masks
-from .core.layer_masks import RYMAT_mask_stack, RYMAT_masks, RYMAT_UL_mask_list, RYMAT_OT_move_layer_mask_up, RYMAT_OT_move_layer_mask_down, RYMAT_OT_duplicate_layer_mask, RYMAT_OT_delete_layer_mask, RYMAT_OT_add_empty_layer_mask, RYMAT_OT_add_black_layer_mask, RYMAT_OT_add_white_layer_mask, RYMAT_OT_add_linear_gradient_mask, RYMAT_OT_add_decal_mask, RYMAT_OT_add_ambient_occlusion_mask, RYMAT_OT_add_curvature_mask, RYMAT_OT_add_thickness_mask, RYMAT_OT_add_world_space_normals_mask,  RYMAT_OT_add_grunge_mask, RYMAT_OT_add_edge_wear_mask, RYMAT_OT_add_decal_mask, RYMAT_OT_set_mask_projection_uv, RYMAT_OT_set_mask_projection_triplanar, RYMAT_OT_set_mask_crgba_channel, RYMAT_OT_isolate_mask
+from .core.layer_masks import RYMAT_mask_stack, RYMAT_masks, RYMAT_UL_mask_list, RYMAT_OT_move_layer_mask_up, RYMAT_OT_move_layer_mask_down, RYMAT_OT_duplicate_layer_mask, RYMAT_OT_delete_layer_mask, RYMAT_OT_add_empty_layer_mask, RYMAT_OT_add_black_layer_mask, RYMAT_OT_add_white_layer_mask, RYMAT_OT_add_linear_gradient_mask, RYMAT_OT_add_decal_mask, RYMAT_OT_add_ambient_occlusion_mask, RYMAT_OT_add_curvature_mask, RYMAT_OT_add_island_id_mask, RYMAT_OT_add_thickness_mask, RYMAT_OT_add_world_space_normals_mask,  RYMAT_OT_add_grunge_mask, RYMAT_OT_add_edge_wear_mask, RYMAT_OT_add_decal_mask, RYMAT_OT_set_mask_projection_uv, RYMAT_OT_set_mask_projection_triplanar, RYMAT_OT_set_mask_crgba_channel, RYMAT_OT_isolate_mask
 
 # Material Filters
 from .core.material_filters import RYMAT_OT_add_material_filter, RYMAT_OT_delete_material_filter
@@ -42,7 +43,26 @@ from .core.material_filters import RYMAT_OT_add_material_filter, RYMAT_OT_delete
 from .core.material_slots import RYMAT_OT_add_material_slot, RYMAT_OT_remove_material_slot, RYMAT_OT_move_material_slot_up, RYMAT_OT_move_material_slot_down
 
 # Baking Mesh Maps
-from .core.mesh_map_baking import RYMAT_mesh_map_anti_aliasing, RYMAT_baking_settings, RYMAT_OT_batch_bake, RYMAT_OT_set_mesh_map_folder, RYMAT_OT_open_mesh_map_folder, RYMAT_OT_preview_mesh_map, RYMAT_OT_disable_mesh_map_preview, RYMAT_OT_delete_mesh_map, RYMAT_OT_create_baking_cage, RYMAT_OT_delete_baking_cage
+from .core.mesh_map_baking import RYMAT_mesh_map_anti_aliasing, RYMAT_baking_settings, RYMAT_OT_batch_bake, RYMAT_OT_set_mesh_map_folder, RYMAT_OT_open_mesh_map_folder, RYMAT_OT_preview_mesh_map, RYMAT_OT_disable_mesh_map_preview, RYMAT_OT_benchmark_bake_render_profile, RYMAT_OT_delete_mesh_map, RYMAT_OT_create_baking_cage, RYMAT_OT_delete_baking_cage
+
+# UV Rasterization
+from .core.uv_rasterization import RYMAT_OT_bake_island_id_map, RYMAT_OT_report_uv_coverage
+
+# Bake Post Processing
+from .core.bake_post_processing import shutdown_post_process_pool
+
+# Bake Isolation
+from .core import bake_isolation
+
+# Update Dispatching
+from .core import update_dispatcher
+
+# Layer Freezing
+from .core import layer_freezing
+from .core.layer_freezing import RYMAT_OT_freeze_layers, RYMAT_OT_unfreeze_layers, RYMAT_OT_rebake_frozen_layers, RYMAT_OT_freeze_mask, RYMAT_OT_rebake_frozen_masks, RYMAT_OT_unfreeze_mask
+
+# Shader Complexity
+from .core.shader_complexity import RYMAT_OT_profile_shader_complexity
 
 # Exporting
 from .core.export_textures import RYMAT_pack_textures, RYMAT_RGBA_pack_channels, RYMAT_texture_export_settings, RYMAT_texture_export_settings, RYMAT_texture_set_export_settings, RYMAT_OT_export, RYMAT_OT_set_export_folder, RYMAT_OT_open_export_folder, RYMAT_OT_set_export_template, RYMAT_OT_save_export_template, RYMAT_OT_refresh_export_template_list, RYMAT_OT_delete_export_template, RYMAT_OT_add_export_texture, RYMAT_OT_remove_export_texture, RYMAT_export_template_names, ExportTemplateMenu
@@ -86,10 +106,15 @@ classes = (
     RYMAT_OT_open_mesh_map_folder,
     RYMAT_OT_preview_mesh_map,
     RYMAT_OT_disable_mesh_map_preview,
+    RYMAT_OT_benchmark_bake_render_profile,
     RYMAT_OT_delete_mesh_map,
     RYMAT_OT_create_baking_cage,
     RYMAT_OT_delete_baking_cage,
 
+    # UV Rasterization
+    RYMAT_OT_bake_island_id_map,
+    RYMAT_OT_report_uv_coverage,
+
     # Exporting
     RYMAT_pack_textures,
     RYMAT_RGBA_pack_channels,
@@ -144,6 +169,20 @@ classes = (
     RYMAT_OT_merge_with_layer_below,
     RYMAT_OT_add_material_channel_nodes,
     RYMAT_OT_delete_material_channel_nodes,
+    RYMAT_OT_benchmark_layer_node_lookup,
+    RYMAT_OT_benchmark_layer_construction,
+    RYMAT_OT_validate_layer_stack,
+
+    # Layer Freezing
+    RYMAT_OT_freeze_layers,
+    RYMAT_OT_unfreeze_layers,
+    RYMAT_OT_rebake_frozen_layers,
+    RYMAT_OT_freeze_mask,
+    RYMAT_OT_rebake_frozen_masks,
+    RYMAT_OT_unfreeze_mask,
+
+    # Shader Complexity
+    RYMAT_OT_profile_shader_complexity,
 
     # Layer Masks
     RYMAT_mask_stack, 
@@ -162,6 +201,7 @@ classes = (
     RYMAT_OT_add_decal_mask,
     RYMAT_OT_add_ambient_occlusion_mask, 
     RYMAT_OT_add_curvature_mask, 
+    RYMAT_OT_add_island_id_mask,
     RYMAT_OT_add_thickness_mask, 
     RYMAT_OT_add_world_space_normals_mask,
     RYMAT_OT_set_mask_projection_uv,
@@ -232,6 +272,16 @@ classes = (
 @persistent
 def depsgraph_change_handler(scene, depsgraph):
 
+    # Skip updates while a bake job is isolated, the layer stack is refreshed when baking finishes.
+    if bake_isolation.is_bake_isolated():
+        bake_isolation.skip_handler_call('DEPSGRAPH_UPDATES')
+        return
+    start_time = time.time()
+
+    # Mark frozen layers as out of date when they're edited, so they're shown live and re-baked.
+    layer_freezing.detect_frozen_layer_edits(depsgraph)
+    layer_freezing.detect_frozen_mask_edits(depsgraph)
+
     # Variable to ensure the active material callback is only called once per depsgraph update.
     triggered_active_material_callback = False
     for update in depsgraph.updates:
@@ -247,12 +297,28 @@ def depsgraph_change_handler(scene, depsgraph):
                         triggered_active_material_callback = True
 
         # Run updates when a shader nodetree change is detected.
+        # Shader nodetree updates are sent continuously while editing node values, the dispatcher runs the update once after they stop.
         if update.id.name == "Shader Nodetree":
-            shader_node_tree_update()
+            update_dispatcher.request_update('TRIPLANAR_SYNC', 'SHADER_NODETREE_UPDATE')
+
+    bake_isolation.record_handler_time('DEPSGRAPH_UPDATES', time.time() - start_time)
+
+@persistent
+def undo_redo_handler(scene):
+    # Undo and redo reload Blender data, node groups stored in the layer node index are no longer valid.
+    invalidate_layer_node_index()
+    clear_triplanar_sync_state()
+    layer_freezing.clear_frozen_mask_flags()
 
 # Mark load handlers as persistent so they are not called again when loading a new blend file.
 @persistent
 def load_handler(dummy):
+    invalidate_layer_node_index()
+    clear_triplanar_sync_state()
+    layer_freezing.clear_frozen_mask_flags()
+
+    # Bake jobs don't continue into a loaded file, end isolation left active by a bake that never reached its teardown.
+    bake_isolation.reset_bake_isolation()
 
     # Add an app handler to run updates for add-on properties when properties on the active object are changed.
     bpy.app.handlers.depsgraph_update_post.clear()
@@ -355,6 +421,10 @@ def register():
     # Add a load handler to run functions when a Blender file is loaded.
     bpy.app.handlers.load_post.append(load_handler)
 
+    # Add undo and redo handlers to clear references to Blender data that are invalidated by undoing and redoing.
+    bpy.app.handlers.undo_post.append(undo_redo_handler)
+    bpy.app.handlers.redo_post.append(undo_redo_handler)
+
 def unregister():
     for cls in classes:
         bpy.utils.unregister_class(cls)
@@ -369,5 +439,24 @@ def unregister():
     if bpy.app.timers.is_registered(auto_save_images):
         bpy.app.timers.unregister(auto_save_images)
 
+    # Discard updates waiting to be run by the update dispatcher.
+    update_dispatcher.clear_requested_updates()
+
+    # Cancel re-baking frozen layers and masks.
+    layer_freezing.cancel_frozen_layer_rebake()
+    layer_freezing.cancel_frozen_mask_rebake()
+
+    # End bake isolation, so viewport shading changed for an unfinished bake is restored.
+    bake_isolation.end_bake_isolation()
+
+    # Remove undo and redo handlers, so they aren't left registered against the unloaded add-on, or added twice when it's enabled again.
+    if undo_redo_handler in bpy.app.handlers.undo_post:
+        bpy.app.handlers.undo_post.remove(undo_redo_handler)
+    if undo_redo_handler in bpy.app.handlers.redo_post:
+        bpy.app.handlers.redo_post.remove(undo_redo_handler)
+
+    # Wait for mesh maps still being saved by worker threads.
+    shutdown_post_process_pool()
+
 if __name__ == "__main__":
     register()
\ No newline at end of file
@@ -0,0 +1,166 @@
+# This file contains functions for denoising baked images with Blender's bundled OpenImageDenoise, using a temporary compositor node tree.
+
+import time
+import numpy as np
+import bpy
+from ..core import blender_addon_utils as bau
+from ..core import debug_logging
+from ..core import uv_rasterization
+from ..core import bake_post_processing
+
+# Name of the temporary scene used to run the denoising compositor node tree.
+DENOISE_SCENE_NAME = "RY_Denoise"
+
+# Names of temporary images used as guide passes for denoising.
+DENOISE_NORMAL_GUIDE_NAME = "RY_DenoiseNormalGuide"
+DENOISE_ALBEDO_GUIDE_NAME = "RY_DenoiseAlbedoGuide"
+
+# Name of the image Blender writes compositor viewer node results to.
+VIEWER_IMAGE_NAME = "Viewer Node"
+
+
+def is_denoising_available():
+    '''Returns true if this build of Blender includes OpenImageDenoise.'''
+    return bpy.app.build_options.openimagedenoise
+
+def create_guide_image(image_name, pixels):
+    '''Creates a temporary float image from a (height, width, 4) pixel array for use as a denoising guide pass.'''
+    height, width = pixels.shape[:2]
+    guide_image = bau.create_data_image(image_name, width, height, alpha_channel=True, thirty_two_bit=True, data=True)
+    guide_image.colorspace_settings.name = 'Non-Color'
+    guide_image.pixels.foreach_set(pixels.reshape(-1))
+    return guide_image
+
+def get_normal_guide_pixels(normal_image, width, height):
+    '''Returns normal guide pixels from a baked world space normal image, converted from 0 - 1 color values to -1 - 1 normals and resampled to the provided resolution.'''
+    normal_pixels = bake_post_processing.read_image_pixels(normal_image)
+    normal_pixels = bake_post_processing.resample_pixels(normal_pixels, width, height)
+    guide_pixels = np.ones((height, width, 4), dtype=np.float32)
+    guide_pixels[:, :, :3] = normal_pixels[:, :, :3] * 2.0 - 1.0
+    return guide_pixels
+
+def get_albedo_guide_pixels(mesh_object, width, height, material_index=-1):
+    '''Returns albedo guide pixels marking pixels covered by UVs as white, so denoising preserves UV island edges. Returns None if the object has no UV map.'''
+    texel_map = uv_rasterization.get_texel_map(mesh_object, width, height)
+    if texel_map == None:
+        return None
+    coverage_mask = uv_rasterization.get_uv_coverage_mask(texel_map, material_index)
+    guide_pixels = np.ones((height, width, 4), dtype=np.float32)
+    guide_pixels[:, :, :3] = coverage_mask[:, :, np.newaxis]
+    return guide_pixels
+
+def create_denoise_scene(image, normal_guide_image, albedo_guide_image):
+    '''Creates a temporary scene with a compositor node tree that denoises the provided image using the provided (optional) guide images.'''
+    width, height = image.size
+    denoise_scene = bpy.data.scenes.new(DENOISE_SCENE_NAME)
+    denoise_scene.render.engine = 'BLENDER_WORKBENCH'
+    denoise_scene.render.resolution_x = width
+    denoise_scene.render.resolution_y = height
+    denoise_scene.render.resolution_percentage = 100
+    denoise_scene.render.use_compositing = True
+    denoise_scene.render.use_sequencer = False
+    denoise_scene.view_settings.view_transform = 'Standard'
+
+    # A camera is required to render the scene, even though only the compositor is used.
+    camera_data = bpy.data.cameras.new(DENOISE_SCENE_NAME)
+    camera_object = bpy.data.objects.new(DENOISE_SCENE_NAME, camera_data)
+    denoise_scene.collection.objects.link(camera_object)
+    denoise_scene.camera = camera_object
+
+    denoise_scene.use_nodes = True
+    node_tree = denoise_scene.node_tree
+    node_tree.nodes.clear()
+
+    image_node = node_tree.nodes.new('CompositorNodeImage')
+    image_node.image = image
+
+    denoise_node = node_tree.nodes.new('CompositorNodeDenoise')
+    denoise_node.prefilter = 'ACCURATE'
+    denoise_node.use_hdr = False
+    node_tree.links.new(image_node.outputs.get('Image'), denoise_node.inputs.get('Image'))
+
+    # Guide passes help the denoiser preserve edges in the baked data, OpenImageDenoise requires an albedo guide to use a normal guide.
+    if albedo_guide_image:
+        albedo_node = node_tree.nodes.new('CompositorNodeImage')
+        albedo_node.image = albedo_guide_image
+        node_tree.links.new(albedo_node.outputs.get('Image'), denoise_node.inputs.get('Albedo'))
+
+        if normal_guide_image:
+            normal_node = node_tree.nodes.new('CompositorNodeImage')
+            normal_node.image = normal_guide_image
+            node_tree.links.new(normal_node.outputs.get('Image'), denoise_node.inputs.get('Normal'))
+
+    composite_node = node_tree.nodes.new('CompositorNodeComposite')
+    viewer_node = node_tree.nodes.new('CompositorNodeViewer')
+    node_tree.links.new(denoise_node.outputs.get('Image'), composite_node.inputs.get('Image'))
+    node_tree.links.new(denoise_node.outputs.get('Image'), viewer_node.inputs.get('Image'))
+    return denoise_scene
+
+def remove_denoise_scene():
+    '''Removes the temporary denoising scene, camera and guide images if they exist.'''
+    denoise_scene = bpy.data.scenes.get(DENOISE_SCENE_NAME)
+    if denoise_scene:
+        bpy.data.scenes.remove(denoise_scene)
+
+    camera_object = bpy.data.objects.get(DENOISE_SCENE_NAME)
+    if camera_object:
+        bpy.data.objects.remove(camera_object)
+
+    camera_data = bpy.data.cameras.get(DENOISE_SCENE_NAME)
+    if camera_data:
+        bpy.data.cameras.remove(camera_data)
+
+    for guide_image_name in (DENOISE_NORMAL_GUIDE_NAME, DENOISE_ALBEDO_GUIDE_NAME):
+        guide_image = bpy.data.images.get(guide_image_name)
+        if guide_image:
+            bpy.data.images.remove(guide_image)
+
+def denoise_image(image, mesh_object, normal_image=None, material_index=-1):
+    '''Denoises the pixels of the provided baked image in place using OpenImageDenoise. UV coverage of the provided object and an optional baked world space normal image are used as guide passes. Returns true if the image was denoised.'''
+    if not is_denoising_available():
+        debug_logging.log("Skipped denoising {0}, this build of Blender doesn't include OpenImageDenoise.".format(image.name), message_type='WARNING')
+        return False
+
+    start_time = time.time()
+    width, height = image.size
+
+    # Create guide images at the resolution of the baked image.
+    albedo_guide_image = None
+    albedo_guide_pixels = get_albedo_guide_pixels(mesh_object, width, height, material_index)
+    if albedo_guide_pixels is not None:
+        albedo_guide_image = create_guide_image(DENOISE_ALBEDO_GUIDE_NAME, albedo_guide_pixels)
+
+    normal_guide_image = None
+    if normal_image and normal_image != image:
+        normal_guide_image = create_guide_image(DENOISE_NORMAL_GUIDE_NAME, get_normal_guide_pixels(normal_image, width, height))
+
+    # Remove the viewer image left by previous compositor renders, so its pixels can't be mistaken for the denoised result.
+    viewer_image = bpy.data.images.get(VIEWER_IMAGE_NAME)
+    if viewer_image:
+        bpy.data.images.remove(viewer_image)
+
+    # Run the compositor and copy the denoised viewer pixels back into the image.
+    denoised = False
+    create_denoise_scene(image, normal_guide_image, albedo_guide_image)
+    try:
+        render_result = bpy.ops.render.render(scene=DENOISE_SCENE_NAME)
+        viewer_image = bpy.data.images.get(VIEWER_IMAGE_NAME)
+        if 'FINISHED' in render_result and viewer_image and tuple(viewer_image.size) == (width, height):
+            denoised_pixels = np.empty(width * height * 4, dtype=np.float32)
+            viewer_image.pixels.foreach_get(denoised_pixels)
+            denoised_pixels = denoised_pixels.reshape(height, width, 4)
+
+            # Keep the original alpha channel, only color channels are denoised.
+            image_pixels = bake_post_processing.read_image_pixels(image)
+            color_channel_count = min(3, image.channels)
+            image_pixels[:, :, :color_channel_count] = denoised_pixels[:, :, :color_channel_count]
+            image.pixels.foreach_set(image_pixels.reshape(-1))
+            denoised = True
+        else:
+            debug_logging.log("Compositor didn't output denoised pixels for {0}, the image was not denoised.".format(image.name), message_type='WARNING')
+    finally:
+        remove_denoise_scene()
+
+    if denoised:
+        debug_logging.log("Denoised {0} in {1} seconds.".format(image.name, round(time.time() - start_time, 3)))
+    return denoised
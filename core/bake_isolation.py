@@ -0,0 +1,114 @@
+# This file contains functions to isolate bake jobs from viewport redraws, depsgraph update handlers and timers that would otherwise compete with Cycles for CPU time while baking.
+
+import time
+from contextlib import contextmanager
+import bpy
+from ..core import debug_logging
+
+# Weight given to the newest measurement when averaging the time taken by handlers.
+HANDLER_TIME_SMOOTHING = 0.2
+
+_bake_isolation_active = False
+_bake_isolation_job_name = ""
+_bake_isolation_start_time = 0
+_original_viewport_shading = []
+_skipped_handler_calls = {}
+_average_handler_times = {}
+
+
+def is_bake_isolated():
+    '''Returns true if a bake job is running in isolation, handlers and timers should skip their work while this is true.'''
+    return _bake_isolation_active
+
+def record_handler_time(handler_name, handler_time):
+    '''Records the time (in seconds) a handler took to run, used to estimate time saved by skipping the handler while baking.'''
+    average_handler_time = _average_handler_times.get(handler_name)
+    if average_handler_time == None:
+        _average_handler_times[handler_name] = handler_time
+    else:
+        _average_handler_times[handler_name] = average_handler_time + (handler_time - average_handler_time) * HANDLER_TIME_SMOOTHING
+
+def skip_handler_call(handler_name):
+    '''Counts a handler call skipped because a bake job is running in isolation.'''
+    _skipped_handler_calls[handler_name] = _skipped_handler_calls.get(handler_name, 0) + 1
+
+def set_viewports_to_solid_shading():
+    '''Switches all 3D viewports in all windows to solid shading, remembering their original shading so it can be restored.'''
+    _original_viewport_shading.clear()
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type != 'VIEW_3D':
+                continue
+            for space in area.spaces:
+                if space.type == 'VIEW_3D' and space.shading.type != 'SOLID':
+                    _original_viewport_shading.append((window.screen.name, area.x, area.y, space.shading.type))
+                    space.shading.type = 'SOLID'
+
+def restore_viewport_shading():
+    '''Restores the shading of 3D viewports switched to solid shading while baking. Viewports that no longer exist are skipped.'''
+    for screen_name, area_x, area_y, shading_type in _original_viewport_shading:
+        screen = bpy.data.screens.get(screen_name)
+        if screen == None:
+            continue
+        for area in screen.areas:
+            if area.type == 'VIEW_3D' and area.x == area_x and area.y == area_y:
+                area.spaces.active.shading.type = shading_type
+                area.tag_redraw()
+    _original_viewport_shading.clear()
+
+def begin_bake_isolation(job_name):
+    '''Isolates the bake job with the provided name by switching 3D viewports to solid shading, and suspending the add-on's depsgraph update handler and image auto-saving until the bake ends.'''
+    global _bake_isolation_active, _bake_isolation_job_name, _bake_isolation_start_time
+    if _bake_isolation_active:
+        return
+
+    set_viewports_to_solid_shading()
+    _skipped_handler_calls.clear()
+    _bake_isolation_job_name = job_name
+    _bake_isolation_start_time = time.time()
+    _bake_isolation_active = True
+    debug_logging.log("Isolated bake job: {0} ({1} viewport(s) switched to solid shading).".format(job_name, len(_original_viewport_shading)), sub_process=True)
+
+def end_bake_isolation():
+    '''Restores viewport shading and resumes handlers suspended for the isolated bake job, then logs the estimated time saved by isolating the bake.'''
+    global _bake_isolation_active
+    if not _bake_isolation_active:
+        return
+
+    _bake_isolation_active = False
+    restore_viewport_shading()
+
+    # Estimate the time saved from skipped handler calls using the average time each handler took when it last ran.
+    # Time saved by not redrawing material preview shading can't be measured, so it's not included in the estimate.
+    bake_time = time.time() - _bake_isolation_start_time
+    time_saved = 0
+    for handler_name, skipped_calls in _skipped_handler_calls.items():
+        time_saved += skipped_calls * _average_handler_times.get(handler_name, 0)
+
+    skipped_calls_text = ", ".join("{0} {1}".format(skipped_calls, handler_name.lower().replace('_', ' ')) for handler_name, skipped_calls in _skipped_handler_calls.items())
+    if skipped_calls_text == "":
+        skipped_calls_text = "no handler calls"
+
+    debug_logging.log("Bake isolation for {0} ended after {1} seconds, skipped {2}, estimated time saved: {3} seconds (excluding viewport redraws).".format(
+        _bake_isolation_job_name,
+        round(bake_time, 2),
+        skipped_calls_text,
+        round(time_saved, 3)
+    ))
+    _skipped_handler_calls.clear()
+
+def reset_bake_isolation():
+    '''Ends bake isolation without restoring viewport shading, used when viewports it would restore no longer belong to the open blend file (i.e after loading a file).'''
+    global _bake_isolation_active
+    _bake_isolation_active = False
+    _original_viewport_shading.clear()
+    _skipped_handler_calls.clear()
+
+@contextmanager
+def end_bake_isolation_on_error():
+    '''Ends bake isolation if the wrapped code raises an error, so the add-on's handlers aren't left suspended for the rest of the session by a bake that failed without reaching its teardown.'''
+    try:
+        yield
+    except Exception:
+        end_bake_isolation()
+        raise
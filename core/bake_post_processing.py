@@ -0,0 +1,136 @@
+# This file contains a worker pool that resamples, pads and encodes baked images to PNG files without blocking Blender's user interface.
+# Workers only handle numpy arrays and files, Blender data can only be read and edited from the main thread.
+
+import os
+import time
+import zlib
+import struct
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import bpy
+from ..core import uv_rasterization
+
+# Number of threads used to post-process baked images. Numpy and zlib release the GIL for most of the work so a few threads run in parallel.
+POST_PROCESS_WORKER_COUNT = max(1, min(4, (os.cpu_count() or 2) - 1))
+
+# Zlib compression level used when encoding PNG files.
+PNG_COMPRESSION_LEVEL = 6
+
+# PNG color types for 1, 3 and 4 channel images.
+PNG_COLOR_TYPES = {1: 0, 3: 2, 4: 6}
+
+_post_process_pool = None
+
+
+#----------------------------- IMAGE PROCESSING FUNCTIONS -----------------------------#
+
+
+def read_image_pixels(image):
+    '''Returns a copy of the pixels of the provided image as a (height, width, channels) float32 array.'''
+    width, height = image.size
+    pixels = np.empty(width * height * image.channels, dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    return pixels.reshape(height, width, image.channels)
+
+def resample_pixels_axis(pixels, output_count, axis):
+    '''Resamples pixels along one axis to the provided pixel count using linear interpolation between pixel centers.'''
+    input_count = pixels.shape[axis]
+    if input_count == output_count:
+        return pixels
+
+    positions = (np.arange(output_count, dtype=np.float32) + 0.5) * (input_count / output_count) - 0.5
+    positions = np.clip(positions, 0, input_count - 1)
+    lower_indices = np.floor(positions).astype(np.int32)
+    upper_indices = np.minimum(lower_indices + 1, input_count - 1)
+
+    weight_shape = [1] * pixels.ndim
+    weight_shape[axis] = output_count
+    weights = (positions - lower_indices).reshape(weight_shape)
+    lower_pixels = np.take(pixels, lower_indices, axis=axis)
+    return lower_pixels + (np.take(pixels, upper_indices, axis=axis) - lower_pixels) * weights
+
+def resample_pixels(pixels, output_width, output_height):
+    '''Resamples a (height, width, channels) pixel array to the provided resolution using bilinear interpolation.'''
+    pixels = resample_pixels_axis(pixels, output_height, 0)
+    return resample_pixels_axis(pixels, output_width, 1).astype(np.float32, copy=False)
+
+def get_png_chunk(chunk_type, chunk_data):
+    '''Returns a PNG chunk with the provided type and data.'''
+    return struct.pack(">I", len(chunk_data)) + chunk_type + chunk_data + struct.pack(">I", zlib.crc32(chunk_type + chunk_data) & 0xffffffff)
+
+def encode_png(pixels, filepath, channels=3, bit_depth=8):
+    '''Encodes a (height, width, channels) float pixel array into an 8 or 16-bit PNG file. Pixel values are written without color management.'''
+    height, width = pixels.shape[:2]
+
+    # Blender stores pixels from the bottom row up, PNG files store rows from the top down.
+    rows = np.clip(pixels[::-1, :, :channels], 0.0, 1.0)
+
+    # 16-bit PNG files store samples as big-endian unsigned shorts, rows are filtered as bytes either way.
+    if bit_depth == 16:
+        rows = (rows * 65535.0 + 0.5).astype(">u2").view(np.uint8)
+    else:
+        rows = (rows * 255.0 + 0.5).astype(np.uint8)
+    row_length = width * channels * (bit_depth // 8)
+    rows = rows.reshape(height, row_length)
+
+    # Each row is stored as the difference from the row above (PNG 'Up' filter), which compresses smooth mesh map gradients well.
+    filtered_rows = np.empty((height, row_length + 1), dtype=np.uint8)
+    filtered_rows[:, 0] = 2
+    filtered_rows[0, 1:] = rows[0]
+    filtered_rows[1:, 1:] = rows[1:] - rows[:-1]
+
+    png_header = struct.pack(">IIBBBBB", width, height, bit_depth, PNG_COLOR_TYPES[channels], 0, 0, 0)
+    png_data = b"".join((
+        b"\x89PNG\r\n\x1a\n",
+        get_png_chunk(b"IHDR", png_header),
+        get_png_chunk(b"IDAT", zlib.compress(filtered_rows.tobytes(), PNG_COMPRESSION_LEVEL)),
+        get_png_chunk(b"IEND", b"")
+    ))
+
+    # Write to a temporary file first so a partially written image is never loaded.
+    temp_filepath = filepath + ".tmp"
+    with open(temp_filepath, "wb") as png_file:
+        png_file.write(png_data)
+    os.replace(temp_filepath, filepath)
+
+def post_process_image(pixels, output_width, output_height, coverage_mask, padding, filepath, channels, bit_depth=8):
+    '''Resamples, pads UV islands and encodes the provided pixels to a PNG file. This runs on a worker thread, so it must not access Blender data. Returns the time taken in seconds.'''
+    start_time = time.time()
+    pixels = resample_pixels(pixels, output_width, output_height)
+    if coverage_mask is not None:
+        uv_rasterization.pad_uv_islands(pixels, coverage_mask, padding)
+    encode_png(pixels, filepath, channels, bit_depth)
+    return time.time() - start_time
+
+
+#----------------------------- WORKER POOL FUNCTIONS -----------------------------#
+
+
+def get_post_process_pool():
+    '''Returns the worker pool used to post-process baked images, creating it if it doesn't exist.'''
+    global _post_process_pool
+    if _post_process_pool == None:
+        _post_process_pool = ThreadPoolExecutor(max_workers=POST_PROCESS_WORKER_COUNT, thread_name_prefix="RYMAT_PostProcess")
+    return _post_process_pool
+
+def shutdown_post_process_pool():
+    '''Waits for all queued post-processing to finish and shuts down the worker pool.'''
+    global _post_process_pool
+    if _post_process_pool != None:
+        _post_process_pool.shutdown(wait=True)
+        _post_process_pool = None
+
+def submit_image_post_process(image, output_width, output_height, coverage_mask=None, padding=0):
+    '''Copies the pixels out of the provided image and queues them to be resampled, padded and saved to the image's file path on a worker thread. Returns a future for the post-processing job.'''
+    pixels = read_image_pixels(image)
+    filepath = bpy.path.abspath(image.filepath)
+    channels = 4 if image.depth in (32, 128) else 3
+
+    # Float images (i.e normal and world space normal mesh maps) are saved as 16-bit PNG files so their precision isn't reduced to 8 bits, which causes visible banding.
+    bit_depth = 16 if image.is_float else 8
+    return get_post_process_pool().submit(post_process_image, pixels, output_width, output_height, coverage_mask, padding, filepath, channels, bit_depth)
+
+def load_post_processed_image(image):
+    '''Loads the post-processed image file back into the provided image, replacing its (generated) pixels.'''
+    image.source = 'FILE'
+    image.reload()
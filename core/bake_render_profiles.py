@@ -0,0 +1,92 @@
+# This file contains render setting profiles applied while baking. Profiles disable Cycles features that don't change baked results, which reduces bake times.
+
+import bpy
+from ..core import debug_logging
+
+# Light path settings shared by all bake profiles, defined as (settings owner, property name, value).
+# Emission, diffuse color and normal bakes don't trace light paths (ambient occlusion and bevel nodes trace their own rays),
+# so bounces, caustics, adaptive sampling and denoising only add work to these bakes.
+MINIMAL_LIGHT_PATH_SETTINGS = [
+    ('CYCLES', 'max_bounces', 0),
+    ('CYCLES', 'diffuse_bounces', 0),
+    ('CYCLES', 'glossy_bounces', 0),
+    ('CYCLES', 'transmission_bounces', 0),
+    ('CYCLES', 'volume_bounces', 0),
+    ('CYCLES', 'transparent_max_bounces', 0),
+    ('CYCLES', 'caustics_reflective', False),
+    ('CYCLES', 'caustics_refractive', False),
+    ('CYCLES', 'use_adaptive_sampling', False),
+    ('CYCLES', 'use_denoising', False),
+    ('CYCLES', 'use_fast_gi', False),
+
+    # Bake materials make every face emissive, building a light tree for them is wasted time.
+    ('CYCLES', 'use_light_tree', False),
+
+    # Keep scene data (BVH) in memory between bakes, so batched bakes of the same objects don't rebuild it.
+    ('RENDER', 'use_persistent_data', True),
+    ('RENDER', 'threads_mode', 'AUTO'),
+    ('CYCLES', 'use_auto_tile', True)
+]
+
+BAKE_RENDER_PROFILES = {
+    'EMIT': MINIMAL_LIGHT_PATH_SETTINGS,
+    'NORMAL': MINIMAL_LIGHT_PATH_SETTINGS,
+    'DIFFUSE': MINIMAL_LIGHT_PATH_SETTINGS + [
+        ('BAKE', 'use_pass_direct', False),
+        ('BAKE', 'use_pass_indirect', False),
+        ('BAKE', 'use_pass_color', True)
+    ]
+}
+
+# Tile sizes used when baking on CPU and GPU render devices.
+# Smaller tiles limit memory used by each CPU thread, GPUs bake fastest with tiles large enough to keep the device busy.
+CPU_BAKE_TILE_SIZE = 1024
+GPU_BAKE_TILE_SIZE = 2048
+
+
+def get_render_settings_owner(owner_name):
+    '''Returns the scene data block render settings with the provided owner name are stored in.'''
+    scene = bpy.context.scene
+    match owner_name:
+        case 'CYCLES':
+            return scene.cycles
+        case 'RENDER':
+            return scene.render
+        case 'BAKE':
+            return scene.render.bake
+
+def get_bake_render_profile(bake_type):
+    '''Returns the render settings profile for the provided Cycles bake type.'''
+    bake_render_profile = list(BAKE_RENDER_PROFILES.get(bake_type, MINIMAL_LIGHT_PATH_SETTINGS))
+    if bpy.context.scene.cycles.device == 'CPU':
+        bake_render_profile.append(('CYCLES', 'tile_size', CPU_BAKE_TILE_SIZE))
+    else:
+        bake_render_profile.append(('CYCLES', 'tile_size', GPU_BAKE_TILE_SIZE))
+    return bake_render_profile
+
+def apply_render_settings(render_settings, original_render_settings):
+    '''Applies the provided render settings, defined as (settings owner, property name, value). Original values are stored in the provided dictionary the first time each setting is changed, so they can be restored after baking.'''
+    for owner_name, property_name, value in render_settings:
+        settings_owner = get_render_settings_owner(owner_name)
+
+        # Skip settings that don't exist in this version of Blender.
+        if not hasattr(settings_owner, property_name):
+            continue
+
+        original_render_settings.setdefault((owner_name, property_name), getattr(settings_owner, property_name))
+        setattr(settings_owner, property_name, value)
+
+def apply_bake_render_profile(bake_type, original_render_settings):
+    '''Applies the render settings profile for the provided Cycles bake type. Original values are stored in the provided dictionary, so they can be restored after baking.'''
+    apply_render_settings(get_bake_render_profile(bake_type), original_render_settings)
+    debug_logging.log("Applied {0} bake render profile.".format(bake_type), sub_process=True)
+
+def restore_render_settings(original_render_settings):
+    '''Restores render settings changed by applying render settings or bake render profiles.'''
+    for setting_key, value in original_render_settings.items():
+        owner_name, property_name = setting_key
+        setattr(get_render_settings_owner(owner_name), property_name, value)
+
+    if len(original_render_settings) > 0:
+        debug_logging.log("Restored original render settings.", sub_process=True)
+    original_render_settings.clear()
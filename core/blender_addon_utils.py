@@ -224,6 +224,24 @@ def append_material(material_name, append_missing=True):
     else:
         return material
 
+def append_materials(material_names):
+    '''Appends all missing materials with the provided names from the asset blend file for this add-on using a single library load. Returns the number of materials that were appended.'''
+    missing_material_names = [name for name in material_names if bpy.data.materials.get(name) == None]
+    if len(missing_material_names) <= 0:
+        return 0
+
+    old_node_groups = [group for group in bpy.data.node_groups]
+
+    blend_assets_path = get_blend_assets_path()
+    with bpy.data.libraries.load(blend_assets_path, link=False) as (data_from, data_to):
+        data_to.materials = [name for name in missing_material_names if name in data_from.materials]
+
+    # After loading, the library fills data_to with the appended materials (None for any that failed to load).
+    appended_materials = [material for material in data_to.materials if material != None]
+
+    cleanse_duplicated_node_groups(old_node_groups, cleanse_node_groups=True, cleanse_materials=True)
+    return len(appended_materials)
+
 def append_image(image_name):
     '''Appends the specified texture from the blend asset file for this add-on.'''
     image = bpy.data.images.get(image_name)
@@ -2,6 +2,9 @@ import bpy
 import datetime
 from .. import preferences
 
+# Messages logged while logging is deferred, printed together when deferred messages are flushed.
+_deferred_messages = None
+
 def log(message, message_type='INFO', sub_process=False):
     '''Prints the given message to Blender's console window. This function helps log functions called by this add-on for debugging purposes.'''
     addon_preferences = bpy.context.preferences.addons[preferences.ADDON_NAME].preferences
@@ -18,10 +21,32 @@ def log(message, message_type='INFO', sub_process=False):
     
     if sub_process:
         if addon_preferences.log_sub_operations:
-            print(logged_message)
+            print_logged_message(logged_message)
     else:
         if addon_preferences.log_main_operations:
-            print(logged_message)
+            print_logged_message(logged_message)
+
+def print_logged_message(logged_message):
+    '''Prints the logged message, or stores it to be printed later if logging is deferred.'''
+    if _deferred_messages != None:
+        _deferred_messages.append(logged_message)
+    else:
+        print(logged_message)
+
+def begin_deferred_logging():
+    '''Stores logged messages instead of printing them until deferred messages are flushed.'''
+    global _deferred_messages
+    if _deferred_messages == None:
+        _deferred_messages = []
+
+def flush_deferred_logging():
+    '''Prints all messages logged while logging was deferred, and resumes printing logged messages immediately.'''
+    global _deferred_messages
+    if _deferred_messages != None:
+        deferred_messages = _deferred_messages
+        _deferred_messages = None
+        if len(deferred_messages) > 0:
+            print("\n".join(deferred_messages))
 
 def log_status(message, self, type='ERROR'):
     '''Prints the given message to Blender's console window and displays the message in Blender's status bar.'''
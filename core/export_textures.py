@@ -16,6 +16,10 @@ from ..core import debug_logging
 from ..core import blender_addon_utils as bau
 from ..core import material_layers
 from ..core import shaders
+from ..core import uv_rasterization
+from ..core import bake_denoising
+from ..core import bake_render_profiles
+from ..core import bake_isolation
 from ..preferences import ADDON_NAME
 
 
@@ -336,6 +340,13 @@ NORMAL_BAKE_CHANNELS = [
     'NORMAL_HEIGHT-MIX'
 ]
 
+# List of channels that are never denoised, denoising would soften surface detail stored in these channels.
+DENOISE_EXCLUDED_CHANNELS = [
+    'NORMAL',
+    'NORMAL_HEIGHT-MIX',
+    'HEIGHT'
+]
+
 
 #----------------------------- CHANNEL PACKING / IMAGE EDITING FUNCTIONS -----------------------------#
 
@@ -359,7 +370,7 @@ def enumerate_color_channel(color_channel):
         case 'A':
             return 3
 
-def channel_pack(pack_textures, input_packing, output_packing, image_name_format, color_bit_depth, file_format, export_colorspace):
+def channel_pack(pack_textures, input_packing, output_packing, image_name_format, color_bit_depth, file_format, export_colorspace, material_index=-1):
     '''Channel packs the provided images into RGBA channels of a single image. Accepts None.'''
 
     # Create an array of output pixels using the first valid input texture.
@@ -398,6 +409,14 @@ def channel_pack(pack_textures, input_packing, output_packing, image_name_format
                 output_pixels[channel_index::4] = 1.0
             else:
                 output_pixels[channel_index::4] = 0.0
+
+    # Pad UV islands once on the packed output, instead of having Cycles bake a margin for each channel.
+    baking_settings = bpy.context.scene.rymat_baking_settings
+    if baking_settings.post_bake_padding:
+        texel_map = uv_rasterization.get_texel_map(bpy.context.active_object, w, h)
+        if texel_map:
+            coverage_mask = uv_rasterization.get_uv_coverage_mask(texel_map, material_index)
+            uv_rasterization.pad_uv_islands(output_pixels.reshape(h, w, 4), coverage_mask, baking_settings.uv_padding)
         
     # If an alpha image is provided create an image with alpha.
     has_alpha = False
@@ -469,8 +488,8 @@ def invert_image(image, invert_r = False, invert_g = False, invert_b = False, in
     else:
         debug_logging.log("Error: No image provided to invert.")
 
-def channel_pack_textures(texture_set_name):
-    '''Creates channel packed textures using pre-baked textures.'''
+def channel_pack_textures(texture_set_name, material_index=-1):
+    '''Creates channel packed textures using pre-baked textures. If a material index is provided, only UV islands using the material are padded.'''
 
     # Cycle through all defined export textures and channel pack them.
     texture_export_settings = bpy.context.scene.rymat_texture_export_settings
@@ -541,7 +560,8 @@ def channel_pack_textures(texture_set_name):
             image_name_format=export_texture.name_format,
             color_bit_depth=export_texture.bit_depth,
             file_format=export_texture.image_format,
-            export_colorspace=export_texture.colorspace
+            export_colorspace=export_texture.colorspace,
+            material_index=material_index
         )
 
     # Delete temp material channel bake images, they are no longer needed because they are packed into new textures now.
@@ -741,6 +761,23 @@ def bake_material_channel(material_channel_name, single_texture_set=False):
     
     return export_image.name
 
+def denoise_baked_material_channel(bake_image, material_channel_name):
+    '''Denoises the provided baked material channel image if denoising is enabled for exporting. Normal and height channels are never denoised as it would soften surface detail.'''
+    texture_export_settings = bpy.context.scene.rymat_texture_export_settings
+    if not texture_export_settings.denoise:
+        return
+    
+    if material_channel_name.upper() in DENOISE_EXCLUDED_CHANNELS:
+        return
+
+    # Only use UV coverage of the active material when exporting a texture set per material.
+    material_index = -1
+    if texture_export_settings.export_mode != 'SINGLE_TEXTURE_SET':
+        material_index = bpy.context.active_object.active_material_index
+
+    normal_guide_image = mesh_map_baking.get_meshmap_image(bpy.context.active_object.name, 'WORLD_SPACE_NORMALS')
+    bake_denoising.denoise_image(bake_image, bpy.context.active_object, normal_guide_image, material_index)
+
 def add_bake_texture_nodes():
     '''Adds a bake texture node to all materials in all material slots on the active object.'''
 
@@ -876,6 +913,7 @@ class RYMAT_texture_set_export_settings(PropertyGroup):
     normal_map_mode: EnumProperty(name="Normal Map Mode", items=NORMAL_MAP_MODE, default='OPEN_GL')
     export_mode: EnumProperty(name="Export Active Material", items=EXPORT_MODE, description="Exports only the active material using the defined export settings", default='SINGLE_TEXTURE_SET')
     samples: IntProperty(name="Samples", default=32, description="Sample count for baking export textures. Higher counts result in exported textures that are baked from materials that rely on sampling (blurred materials, procedural materials) being less noisy.")
+    denoise: BoolProperty(name="Denoise", default=False, description="Denoises baked material channels (excluding normal and height channels) with OpenImageDenoise before they're channel packed. This allows exporting with fewer samples while still producing smooth textures from materials that rely on sampling")
 
 class RYMAT_export_template_names(PropertyGroup):
     name: bpy.props.StringProperty()
@@ -893,6 +931,7 @@ class RYMAT_OT_export(Operator):
     _original_render_engine_name = ""
     _bake_image_name = ""
     _start_bake_time = 0
+    _original_render_settings = {}
 
     # Users must have an object selected to call this operator.
     @ classmethod
@@ -900,6 +939,11 @@ class RYMAT_OT_export(Operator):
         return bau.verify_addon_active_material(context)
     
     def modal(self, context, event):
+        with bake_isolation.end_bake_isolation_on_error():
+            return self.update_bake(context, event)
+
+    def update_bake(self, context, event):
+        '''Handles the provided modal event, starting the next bake when the running bake job finishes.'''
         if event.type in {'ESC'}:
             self.cancel(context)
             return {'CANCELLED'}
@@ -913,6 +957,7 @@ class RYMAT_OT_export(Operator):
                 bake_image = bpy.data.images.get(self._bake_image_name)
                 if bake_image != None:
                     if not bake_image.packed_file:
+                        denoise_baked_material_channel(bake_image, self._texture_channels_to_bake[self._texture_channel_index])
                         bake_image.pack()
                         debug_logging.log("Baked - (texture channel - active material): {0} - {1}".format(self._bake_image_name, bpy.context.active_object.active_material.name))
                 
@@ -933,7 +978,7 @@ class RYMAT_OT_export(Operator):
 
                         # Channel pack baked textures after baking each material unless we are baking to a single texture set.
                         if texture_export_settings.export_mode != 'SINGLE_TEXTURE_SET':
-                            channel_pack_textures(bpy.context.active_object.active_material.name)
+                            channel_pack_textures(bpy.context.active_object.active_material.name, bpy.context.active_object.active_material_index)
 
                         # Move to baking the next material.
                         bpy.context.active_object.active_material_index += 1
@@ -955,7 +1000,7 @@ class RYMAT_OT_export(Operator):
                         if texture_export_settings.export_mode == 'SINGLE_TEXTURE_SET':
                             channel_pack_textures(bpy.context.active_object.name)
                         else:
-                            channel_pack_textures(bpy.context.active_object.active_material.name)
+                            channel_pack_textures(bpy.context.active_object.active_material.name, bpy.context.active_object.active_material_index)
                         
                         # De-isolating materials directly after their finished baking will cause errors.
                         # De-isolate all materials at the end of baking.
@@ -992,9 +1037,6 @@ class RYMAT_OT_export(Operator):
 
         # Pause auto updating for add-on properties, they will cause errors while baking.
         bpy.context.scene.pause_auto_updates = True
-        
-        # Set the viewport shading mode to 'Material' so users can monitor the baking process.
-        bpy.context.space_data.shading.type = 'MATERIAL'
 
         # Compile a list of material channels that require baking based on settings.
         self._texture_channels_to_bake = get_texture_channel_bake_list()
@@ -1046,13 +1088,25 @@ class RYMAT_OT_export(Operator):
 
         # Apply baking settings for exporting textures.
         baking_settings = bpy.context.scene.rymat_baking_settings
-        bpy.context.scene.render.bake.margin = baking_settings.uv_padding
+        bpy.context.scene.render.bake.margin = mesh_map_baking.get_bake_margin(baking_settings)
         bpy.context.scene.render.bake.use_selected_to_active = False
         bpy.context.scene.cycles.samples = texture_export_settings.samples
 
+        # Disable Cycles features that don't change baked material channels.
+        self._original_render_settings = {}
+        if baking_settings.use_bake_render_profiles:
+            bake_render_profiles.apply_bake_render_profile('DIFFUSE', self._original_render_settings)
+
         # Force save all textures (unsaved textures will be cleared and not bake properly).
         bau.force_save_all_textures()
 
+        # Isolate baking from viewport redraws and add-on handlers,
+        # or set the viewport shading mode to 'Material' so users can monitor the baking process.
+        if baking_settings.use_bake_isolation:
+            bake_isolation.begin_bake_isolation("texture export")
+        else:
+            bpy.context.space_data.shading.type = 'MATERIAL'
+
         # Add a timer to provide periodic timer events.
         wm = context.window_manager
         self._timer = wm.event_timer_add(0.5, window=context.window)
@@ -1067,11 +1121,13 @@ class RYMAT_OT_export(Operator):
             wm = context.window_manager
             wm.event_timer_remove(self._timer)
 
+        bake_render_profiles.restore_render_settings(self._original_render_settings)
         bpy.context.scene.render.engine = self._original_render_engine_name
         remove_bake_texture_nodes()
         delete_bake_node()
         material_layers.refresh_layer_stack()
         bpy.context.scene.pause_auto_updates = False
+        bake_isolation.end_bake_isolation()
         self.report({'INFO'}, "Exporting textures was manually cancelled.")
 
     def finish(self, context):
@@ -1080,11 +1136,13 @@ class RYMAT_OT_export(Operator):
             wm = context.window_manager
             wm.event_timer_remove(self._timer)
 
+        bake_render_profiles.restore_render_settings(self._original_render_settings)
         bpy.context.scene.render.engine = self._original_render_engine_name
         remove_bake_texture_nodes()
         delete_bake_node()
         material_layers.refresh_layer_stack()
         bpy.context.scene.pause_auto_updates = False
+        bake_isolation.end_bake_isolation()
 
         # Log the completion exporting textures.
         end_bake_time = time.time()
@@ -8,10 +8,12 @@ from ..core import texture_set_settings as tss
 from ..core import debug_logging
 from ..core import blender_addon_utils as bau
 from ..core import shaders
+from ..core import bake_isolation
 from .. import preferences
 import random
 import os
 import shutil
+import time
 
 def get_random_image_id():
     '''Generates a random image id number.'''
@@ -83,8 +85,13 @@ def auto_save_images():
     if addon_preferences.auto_save_images:
 
         # To avoid errors with saving and baking textures at the same time, only run auto-save when there is no baking in progress.
-        if not bpy.app.is_job_running('OBJECT_BAKE'):
+        if bake_isolation.is_bake_isolated():
+            bake_isolation.skip_handler_call('AUTO_SAVES')
+
+        elif not bpy.app.is_job_running('OBJECT_BAKE'):
+            start_time = time.time()
             save_all_textures()
+            bake_isolation.record_handler_time('AUTO_SAVES', time.time() - start_time)
             debug_logging.log("Auto-saved all images.", message_type='INFO', sub_process=False)
 
         # Return the time until the auto-save should be called again.
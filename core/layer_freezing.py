@@ -0,0 +1,1156 @@
+# This file contains functions and operators for freezing layers and masks. Freezing bakes the result of all layers below a layer, or the value of a procedural mask, into cache images that replace them until they're edited.
+
+import time
+import hashlib
+import bpy
+from bpy.types import Operator
+from bpy.props import BoolProperty, IntProperty
+from ..core import material_layers
+from ..core import layer_masks
+from ..core import export_textures
+from ..core import mesh_map_baking
+from ..core import bake_render_profiles
+from ..core import bake_isolation
+from ..core import update_dispatcher
+from ..core import blender_addon_utils as bau
+from ..core import texture_set_settings as tss
+from ..core import debug_logging
+
+# Name of the custom property frozen layer data is stored in on materials.
+FROZEN_LAYERS_KEY = "rymat_frozen_layers"
+
+# Time (in seconds) to wait after a frozen layer was last edited before re-baking frozen layers.
+# Frozen layers are shown live while they're edited, re-baking only starts once edits stop.
+FROZEN_LAYER_REBAKE_DELAY = 2.0
+
+# Frozen layers are baked using the bake color pass, which traces no light, a few samples are enough to anti-alias texels.
+FROZEN_LAYER_BAKE_SAMPLES = 4
+
+# Name formats for nodes and images that hold frozen layer caches.
+FROZEN_CACHE_NODE_NAME = "FROZEN_LAYERS_{0}"
+FROZEN_CACHE_IMAGE_NAME = "{0}_Frozen_{1}"
+FROZEN_MASK_IMAGE_NAME = "{0}_Frozen"
+
+# Masks that sample a single image are already as fast as a frozen mask, so they can't be frozen.
+UNFREEZABLE_MASK_TYPES = ('IMAGE_MASK', 'DECAL_MASK')
+
+# Names of custom properties stored on frozen mask nodes, for the node and output the frozen mask value came from and a hash of the mask parameters it was baked with.
+FROZEN_MASK_SOURCE_KEY = "rymat_mask_source"
+FROZEN_MASK_HASH_KEY = "rymat_mask_hash"
+
+# Nodes in mask node trees that don't change the baked mask value, they're excluded from mask parameter hashes.
+FROZEN_MASK_EXCLUDED_NODES = ('MASK_MIX', 'GROUP_OUTPUT', 'FROZEN_MASK', 'FROZEN_MASK_UV')
+
+_rebake_material_name = ""
+_rebake_mask_material_name = ""
+_frozen_image_names = {}
+_frozen_mask_materials = {}
+
+
+#----------------------------- FROZEN LAYER DATA -----------------------------#
+
+
+def format_frozen_cache_image_name(material_name, material_channel_name):
+    '''Returns the name of the image the provided material channel of frozen layers is cached in.'''
+    return FROZEN_CACHE_IMAGE_NAME.format(material_name, material_channel_name)
+
+def get_frozen_layer_data(material):
+    '''Returns the frozen layer data stored in the provided material, or None if the material has no frozen layers.'''
+    if material == None:
+        return None
+    return material.get(FROZEN_LAYERS_KEY)
+
+def write_frozen_layer_data(material, layer_ids, material_channel_names, state):
+    '''Stores the IDs of frozen layers, their visibility, the material channels cached for them and the state of their cache in the provided material.'''
+    layer_states = [int(bau.get_node_active(material_layers.find_material_layer_node(material, 'LAYER', i))) for i in range(0, len(layer_ids))]
+    material[FROZEN_LAYERS_KEY] = {
+        'layer_ids': list(layer_ids),
+        'layer_states': layer_states,
+        'channels': list(material_channel_names),
+        'state': state
+    }
+    _frozen_image_names.pop(material.name, None)
+
+def set_frozen_layer_state(material, state):
+    '''Sets the state of the frozen layer cache stored in the provided material.'''
+    frozen_layer_data = get_frozen_layer_data(material)
+    if frozen_layer_data != None:
+        frozen_layer_data['state'] = state
+
+def get_frozen_layer_count(material):
+    '''Returns the number of layers at the bottom of the provided material's layer stack replaced by frozen layer cache images. Returns 0 if the material has no frozen layers, or its frozen layer cache is out of date.'''
+    frozen_layer_data = get_frozen_layer_data(material)
+    if frozen_layer_data == None or frozen_layer_data['state'] != 'FROZEN':
+        return 0
+    return len(frozen_layer_data['layer_ids'])
+
+def is_layer_frozen(material, layer_index):
+    '''Returns true if the layer at the provided index is replaced by frozen layer cache images.'''
+    return layer_index < get_frozen_layer_count(material)
+
+def validate_frozen_layers(material):
+    '''Checks frozen layers in the provided material are still at the bottom of the layer stack with the visibility they were frozen with, and their cache nodes exist. Frozen layers that changed are marked as out of date and re-baked. Returns the number of frozen layers.'''
+    frozen_layer_count = get_frozen_layer_count(material)
+    if frozen_layer_count <= 0:
+        return 0
+
+    frozen_layer_data = get_frozen_layer_data(material)
+    layer_ids, mask_ids = material_layers.read_layer_stack_metadata(material)
+    if layer_ids[:frozen_layer_count] != list(frozen_layer_data['layer_ids']):
+        mark_frozen_layers_stale(material, "frozen layers were added, deleted or moved")
+        return 0
+
+    for i in range(0, frozen_layer_count):
+        layer_node = material_layers.find_material_layer_node(material, 'LAYER', i)
+        if int(bau.get_node_active(layer_node)) != frozen_layer_data['layer_states'][i]:
+            mark_frozen_layers_stale(material, "a frozen layer was hidden or shown")
+            return 0
+
+    for material_channel_name in frozen_layer_data['channels']:
+        cache_output_node, output_name = get_frozen_cache_output(material, material_channel_name)
+        if cache_output_node == None:
+            mark_frozen_layers_stale(material, "frozen layer cache nodes are missing")
+            return 0
+
+    return frozen_layer_count
+
+def get_frozen_cache_output(material, material_channel_name):
+    '''Returns the node and output name frozen layers are cached in for the provided material channel, (None, "") if the material channel isn't cached. The normal material channel is a tangent space normal map color in the layer stack, so its cache image is linked to layers like any other material channel.'''
+    cache_node = material.node_tree.nodes.get(FROZEN_CACHE_NODE_NAME.format(material_channel_name))
+    if cache_node == None:
+        return None, ""
+    return cache_node, 'Color'
+
+def get_frozen_cache_output_nodes(material):
+    '''Returns all nodes in the provided material frozen layer caches are linked to the layer stack from.'''
+    frozen_layer_data = get_frozen_layer_data(material)
+    if frozen_layer_data == None:
+        return []
+
+    cache_output_nodes = []
+    for material_channel_name in frozen_layer_data['channels']:
+        cache_output_node, output_name = get_frozen_cache_output(material, material_channel_name)
+        if cache_output_node:
+            cache_output_nodes.append(cache_output_node)
+    return cache_output_nodes
+
+def get_frozen_cache_links(material, unfrozen_layer_nodes, shader_node, material_channels):
+    '''Returns the links required to connect frozen layer caches to the first active unfrozen layer (or the shader node when there are none), as a set of (output node name, output name, input node name, input name).'''
+    cache_links = set()
+    frozen_layer_data = get_frozen_layer_data(material)
+    if frozen_layer_data == None:
+        return cache_links
+
+    next_node = shader_node
+    for layer_node in unfrozen_layer_nodes:
+        if bau.get_node_active(layer_node):
+            next_node = layer_node
+            break
+    if next_node == None:
+        return cache_links
+
+    for channel in material_channels:
+        if channel.name not in frozen_layer_data['channels']:
+            continue
+        cache_output_node, output_name = get_frozen_cache_output(material, channel.name)
+        if cache_output_node and next_node.inputs.get(channel.name):
+            cache_links.add((cache_output_node.name, output_name, next_node.name, channel.name))
+    return cache_links
+
+
+#----------------------------- FROZEN LAYER UPDATES -----------------------------#
+
+
+def get_frozen_image_names(material, frozen_layer_data):
+    '''Returns the names of images used by frozen layers and their masks, the names are cached until frozen layers are re-baked.'''
+    frozen_image_names = _frozen_image_names.get(material.name)
+    if frozen_image_names == None:
+        frozen_image_names = set()
+        for layer_id in frozen_layer_data['layer_ids']:
+            layer_index = material_layers.find_layer_index(material, layer_id)
+            if layer_index == -1:
+                continue
+
+            node_trees = [material_layers.find_layer_node_tree(material, layer_index)]
+            for mask_index in range(0, len(material_layers.get_layer_mask_ids(material, layer_index))):
+                node_trees.append(layer_masks.find_mask_node_tree(material, layer_index, mask_index))
+
+            for node_tree in node_trees:
+                if node_tree == None:
+                    continue
+                for node in node_tree.nodes:
+                    if node.bl_static_type == 'TEX_IMAGE' and node.image:
+                        frozen_image_names.add(node.image.name)
+
+                    # Masks sample mesh maps through the material's shared mesh map node group.
+                    if node.name == 'MESH_MAPS' and node.node_tree:
+                        frozen_image_names.update(mesh_map_node.image.name for mesh_map_node in node.node_tree.nodes if mesh_map_node.bl_static_type == 'TEX_IMAGE' and mesh_map_node.image)
+        _frozen_image_names[material.name] = frozen_image_names
+    return frozen_image_names
+
+def detect_frozen_layer_edits(depsgraph):
+    '''Marks frozen layers in the active material as out of date if the provided depsgraph contains updates to a frozen layer's node tree, its masks, or an image it uses.'''
+    active_object = bpy.context.view_layer.objects.active
+    if active_object == None or active_object.active_material == None:
+        return
+
+    active_material = active_object.active_material
+    if get_frozen_layer_count(active_material) <= 0:
+        return
+
+    # Layer node trees are named using the material name and layer ID, mask node trees add the mask ID to the layer node tree name.
+    frozen_layer_data = get_frozen_layer_data(active_material)
+    frozen_node_tree_prefixes = tuple(material_layers.format_layer_group_node_name(active_material.name, layer_id) for layer_id in frozen_layer_data['layer_ids'])
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.ShaderNodeTree) and update.id.name.startswith(frozen_node_tree_prefixes):
+            mark_frozen_layers_stale(active_material, "frozen layer {0} was edited".format(update.id.name))
+            return
+        if isinstance(update.id, bpy.types.Image) and update.id.name in get_frozen_image_names(active_material, frozen_layer_data):
+            mark_frozen_layers_stale(active_material, "image {0} used by a frozen layer was edited".format(update.id.name))
+            return
+
+def mark_frozen_layers_stale(material, reason):
+    '''Marks the frozen layer cache of the provided material as out of date, frozen layers are shown live until they're re-baked.'''
+    set_frozen_layer_state(material, 'STALE')
+    _frozen_image_names.pop(material.name, None)
+    update_dispatcher.request_update('FROZEN_LAYERS', 'FROZEN_LAYER_EDIT')
+    debug_logging.log("Frozen layers in {0} are out of date: {1}.".format(material.name, reason), sub_process=True)
+
+def update_frozen_layers():
+    '''Relinks frozen layers in the active material so they're shown live if their cache is out of date, and schedules re-baking them.'''
+    if bau.verify_material_operation_context(display_message=False) == False:
+        return
+
+    active_material = bpy.context.active_object.active_material
+    frozen_layer_data = get_frozen_layer_data(active_material)
+    if frozen_layer_data == None or frozen_layer_data['state'] != 'STALE':
+        return
+
+    material_layers.link_layer_group_nodes(None)
+    schedule_frozen_layer_rebake(active_material)
+
+def schedule_frozen_layer_rebake(material):
+    '''Re-bakes frozen layers in the provided material once frozen layers stop being edited for the re-bake delay.'''
+    global _rebake_material_name
+    _rebake_material_name = material.name
+    if bpy.app.timers.is_registered(rebake_frozen_layers):
+        bpy.app.timers.unregister(rebake_frozen_layers)
+    bpy.app.timers.register(rebake_frozen_layers, first_interval=FROZEN_LAYER_REBAKE_DELAY)
+
+def rebake_frozen_layers():
+    '''Re-bakes out of date frozen layers in the active material, this is called by a timer after frozen layers stop being edited.'''
+
+    # Wait for running bake jobs and operations that pause auto updates to finish before re-baking.
+    if bpy.app.is_job_running('OBJECT_BAKE') or getattr(bpy.context.scene, "pause_auto_updates", False):
+        return FROZEN_LAYER_REBAKE_DELAY
+
+    # Frozen layers of inactive materials stay out of date, they can be re-baked manually.
+    active_object = bpy.context.view_layer.objects.active
+    if active_object == None or active_object.active_material == None or active_object.active_material.name != _rebake_material_name:
+        return None
+
+    # Wait until the active object can be baked, e.g. until it leaves edit mode.
+    if get_cache_bake_error() != "":
+        return FROZEN_LAYER_REBAKE_DELAY
+
+    if not invoke_in_viewport(bpy.ops.rymat.rebake_frozen_layers):
+        debug_logging.log("Unable to re-bake frozen layers, no 3D viewport is open.", message_type='WARNING')
+    return None
+
+def invoke_in_viewport(operator, **properties):
+    '''Invokes the provided operator in the context of the first open 3D viewport, timers run without a window so modal bake operators can't be invoked from them directly. Returns false if no 3D viewport is open.'''
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type != 'VIEW_3D':
+                continue
+            region = next((region for region in area.regions if region.type == 'WINDOW'), None)
+            with bpy.context.temp_override(window=window, area=area, region=region):
+                operator('INVOKE_DEFAULT', **properties)
+            return True
+    return False
+
+def cancel_frozen_layer_rebake():
+    '''Cancels re-baking frozen layers if a re-bake is scheduled.'''
+    if bpy.app.timers.is_registered(rebake_frozen_layers):
+        bpy.app.timers.unregister(rebake_frozen_layers)
+    _frozen_image_names.clear()
+    _frozen_mask_materials.clear()
+
+
+#----------------------------- FROZEN LAYER BAKING -----------------------------#
+
+
+def get_cache_bake_error():
+    '''Returns a message explaining why cache images can't be baked in the current context, or an empty string if they can.'''
+    active_object = bpy.context.view_layer.objects.active
+    if active_object == None:
+        return "No active object to bake."
+    if active_object.mode != 'OBJECT':
+        return "The active object must be in object mode to bake."
+    if not active_object.select_get():
+        return "The active object must be selected to bake."
+    return ""
+
+def begin_cache_bake(operator, context, job_name):
+    '''Adds temporary bake nodes, applies bake settings for baking cache images, and adds a timer that sends the provided modal operator periodic timer events. Settings that are changed are stored in the operator so they can be restored.'''
+    operator._start_bake_time = time.time()
+
+    # Pause auto updating for add-on properties, they will cause errors while baking.
+    bpy.context.scene.pause_auto_updates = True
+
+    # Add a temporary texture node to the material setup to bake to.
+    material_layers.add_bake_texture_nodes()
+
+    # Remember the original render engine so we can reset it after baking.
+    operator._original_render_engine_name = bpy.context.scene.render.engine
+    bpy.context.scene.render.engine = 'CYCLES'
+
+    # Apply baking settings, original values are stored so they're restored after baking.
+    # Cache images are baked from the diffuse color pass, which only includes color when direct and indirect light passes are off.
+    baking_settings = bpy.context.scene.rymat_baking_settings
+    operator._original_render_settings = {}
+    bake_render_profiles.apply_render_settings([
+        ('BAKE', 'margin', mesh_map_baking.get_bake_margin(baking_settings)),
+        ('BAKE', 'use_selected_to_active', False),
+        ('BAKE', 'use_clear', True),
+        ('BAKE', 'use_pass_direct', False),
+        ('BAKE', 'use_pass_indirect', False),
+        ('CYCLES', 'samples', FROZEN_LAYER_BAKE_SAMPLES)
+    ], operator._original_render_settings)
+
+    # Disable Cycles features that don't change baked material channels.
+    if baking_settings.use_bake_render_profiles:
+        bake_render_profiles.apply_bake_render_profile('DIFFUSE', operator._original_render_settings)
+
+    # Force save all textures (unsaved textures will be cleared and not bake properly).
+    # Automatic re-bakes run every time edits pause, they don't write every texture to disk.
+    if not operator.rebake:
+        bau.force_save_all_textures()
+
+    # Isolate baking from viewport redraws and add-on handlers.
+    if baking_settings.use_bake_isolation:
+        bake_isolation.begin_bake_isolation(job_name)
+
+    # Add a timer to provide periodic timer events.
+    wm = context.window_manager
+    operator._timer = wm.event_timer_add(0.1, window=context.window)
+    wm.modal_handler_add(operator)
+
+def end_cache_bake(operator, context):
+    '''Removes temporary bake nodes and restores all render and bake settings changed for baking cache images with the provided modal operator.'''
+    if operator._timer:
+        wm = context.window_manager
+        wm.event_timer_remove(operator._timer)
+
+    material_layers.remove_bake_texture_nodes()
+    export_textures.delete_bake_node()
+    material_layers.relink_shader_node()
+    bake_render_profiles.restore_render_settings(operator._original_render_settings)
+    bpy.context.scene.render.engine = operator._original_render_engine_name
+    bpy.context.scene.pause_auto_updates = False
+    bake_isolation.end_bake_isolation()
+
+def bake_cache_image(material, image_name, output_socket, bake_type='DIFFUSE', thirty_two_bit=True):
+    '''Creates a non-color image with the provided name, then starts baking the provided output socket in the provided material to it. Returns the created image, or None if baking failed to start.'''
+    if bake_type == 'NORMAL':
+        background_color = (0.735337, 0.735337, 1.0, 1.0)
+    else:
+        background_color = (0.0, 0.0, 0.0, 1.0)
+
+    cache_image = bau.create_image(
+        new_image_name=image_name,
+        image_width=tss.get_texture_width(),
+        image_height=tss.get_texture_height(),
+        base_color=background_color,
+        generate_type='BLANK',
+        alpha_channel=False,
+        thirty_two_bit=thirty_two_bit,
+        add_unique_id=False,
+        delete_existing=True
+    )
+    cache_image.colorspace_settings.name = 'Non-Color'
+
+    # Add the cache image to the bake texture node.
+    material_nodes = material.node_tree.nodes
+    image_node = material_nodes.get('BAKE_IMAGE')
+    image_node.image = cache_image
+    image_node.select = True
+    material_nodes.active = image_node
+
+    # Link the output socket to the bake node.
+    node_tree = material.node_tree
+    bake_node = export_textures.get_bake_node()
+    material_output = node_tree.nodes.get('MATERIAL_OUTPUT')
+    if bake_type == 'NORMAL':
+        bau.safe_node_link(output_socket, bake_node.inputs.get('Normal'), node_tree)
+    else:
+        bau.safe_node_link(output_socket, bake_node.inputs.get('Color'), node_tree)
+    node_tree.links.new(bake_node.outputs[0], material_output.inputs[0])
+
+    # Remove the blank image if baking fails to start, so it's never used as a cache.
+    try:
+        bake_result = bpy.ops.object.bake('INVOKE_DEFAULT', type=bake_type)
+    except RuntimeError as error:
+        debug_logging.log("Unable to bake {0}: {1}".format(image_name, error), message_type='ERROR')
+        bake_result = {'CANCELLED'}
+
+    if 'CANCELLED' in bake_result:
+        bpy.data.images.remove(cache_image)
+        return None
+    return cache_image
+
+def is_cache_bake_successful(image_name):
+    '''Returns true if the cache image with the provided name was baked once its bake job has finished. Baking marks images as modified, blank images left by bakes that failed while running are unmodified.'''
+    cache_image = bpy.data.images.get(image_name)
+    return cache_image != None and (cache_image.is_dirty or cache_image.packed_file != None)
+
+def get_frozen_material_channels(material, frozen_layer_count):
+    '''Returns the names of material channels that have nodes in any of the layers that would be frozen.'''
+    shader_info = bpy.context.scene.rymat_shader_info
+    frozen_material_channels = []
+    for channel in shader_info.material_channels:
+        for i in range(0, frozen_layer_count):
+            layer_node_tree = material_layers.find_layer_node_tree(material, i)
+            if layer_node_tree and material_layers.check_channel_nodes_exist(channel.name, layer_node_tree):
+                frozen_material_channels.append(channel.name)
+                break
+    return frozen_material_channels
+
+def bake_frozen_material_channel(material, material_channel_name, top_layer_index):
+    '''Bakes the result of all layers up to and including the provided layer for the provided material channel into a cache image. Returns the name of the cache image, or an empty string if baking failed to start.'''
+    top_layer_node = material_layers.find_material_layer_node(material, 'LAYER', top_layer_index)
+    if bau.format_static_matchannel_name(material_channel_name) == 'NORMAL':
+        bake_type = 'NORMAL'
+    else:
+        bake_type = 'DIFFUSE'
+
+    cache_image = bake_cache_image(
+        material,
+        format_frozen_cache_image_name(material.name, material_channel_name),
+        top_layer_node.outputs.get(material_channel_name),
+        bake_type
+    )
+    if cache_image == None:
+        return ""
+    return cache_image.name
+
+def create_frozen_cache_nodes(material, material_channel_names, top_layer_index):
+    '''Creates (or updates) image texture nodes that read frozen layer cache images for the provided material channels, and removes cache nodes for material channels that are no longer cached.'''
+    nodes = material.node_tree.nodes
+    export_uv_map_node = material_layers.get_material_layer_node('EXPORT_UV_MAP')
+    top_layer_node = material_layers.find_material_layer_node(material, 'LAYER', top_layer_index)
+    location_x = top_layer_node.location[0] if top_layer_node else 0
+    remove_frozen_cache_nodes(material, keep_material_channels=material_channel_names)
+
+    for i, material_channel_name in enumerate(material_channel_names):
+        cache_node = nodes.get(FROZEN_CACHE_NODE_NAME.format(material_channel_name))
+        if cache_node == None:
+            cache_node = nodes.new('ShaderNodeTexImage')
+            cache_node.name = FROZEN_CACHE_NODE_NAME.format(material_channel_name)
+            cache_node.label = cache_node.name
+            cache_node.width = 300
+        cache_node.location = (location_x, 600 + i * 300)
+        cache_node.image = bpy.data.images.get(format_frozen_cache_image_name(material.name, material_channel_name))
+        if export_uv_map_node:
+            material.node_tree.links.new(export_uv_map_node.outputs[0], cache_node.inputs[0])
+
+def remove_frozen_cache_nodes(material, keep_material_channels=[]):
+    '''Removes frozen layer cache nodes from the provided material, except nodes for the provided material channels.'''
+    nodes = material.node_tree.nodes
+    keep_node_names = [FROZEN_CACHE_NODE_NAME.format(material_channel_name) for material_channel_name in keep_material_channels]
+
+    for node in [node for node in nodes if node.name.startswith(FROZEN_CACHE_NODE_NAME.format(""))]:
+        if node.name not in keep_node_names:
+            nodes.remove(node)
+
+def unfreeze_layers(material):
+    '''Removes frozen layer caches from the provided material, so all layers are shown live again.'''
+    frozen_layer_data = get_frozen_layer_data(material)
+    if frozen_layer_data == None:
+        return
+
+    # Cache images are found through their cache nodes, image names aren't updated when materials are renamed.
+    cache_images = [node.image for node in material.node_tree.nodes if node.name.startswith(FROZEN_CACHE_NODE_NAME.format("")) and getattr(node, "image", None)]
+    remove_frozen_cache_nodes(material)
+    for cache_image in cache_images:
+        bpy.data.images.remove(cache_image)
+    del material[FROZEN_LAYERS_KEY]
+    _frozen_image_names.pop(material.name, None)
+
+
+#----------------------------- MASK FREEZING -----------------------------#
+
+
+def format_frozen_mask_image_name(mask_node_tree_name):
+    '''Returns the name of the image the value of the mask with the provided node tree name is frozen in.'''
+    return FROZEN_MASK_IMAGE_NAME.format(mask_node_tree_name)
+
+def is_mask_freezable(material, layer_index, mask_index):
+    '''Returns true if the mask at the provided index can be frozen to a texture.'''
+    mask_type_node = layer_masks.find_mask_node(material, 'MASK_TYPE', layer_index, mask_index)
+    if mask_type_node == None or mask_type_node.label in UNFREEZABLE_MASK_TYPES:
+        return False
+    mask_mix_node = layer_masks.find_mask_node(material, 'MASK_MIX', layer_index, mask_index)
+    return mask_mix_node != None and len(mask_mix_node.inputs[7].links) > 0
+
+def is_mask_frozen(material, layer_index, mask_index):
+    '''Returns true if the mask at the provided index has been frozen to a texture, frozen masks are shown live while they're out of date.'''
+    return layer_masks.find_mask_node(material, 'FROZEN_MASK', layer_index, mask_index) != None
+
+def has_frozen_masks(material):
+    '''Returns true if any mask in the provided material is frozen. The result is cached per material until masks are frozen or unfrozen, or layers and masks are added, removed or moved.'''
+    frozen_masks_exist = _frozen_mask_materials.get(material.name)
+    if frozen_masks_exist == None:
+        frozen_masks_exist = False
+        for layer_index in range(0, material_layers.count_layers(material)):
+            for mask_index in range(0, len(material_layers.get_layer_mask_ids(material, layer_index))):
+                if is_mask_frozen(material, layer_index, mask_index):
+                    frozen_masks_exist = True
+                    break
+            if frozen_masks_exist:
+                break
+        _frozen_mask_materials[material.name] = frozen_masks_exist
+    return frozen_masks_exist
+
+def clear_frozen_mask_flags(material=None):
+    '''Clears the cached flag that records if the provided material has frozen masks, or the flags of all materials if no material is provided.'''
+    if material == None:
+        _frozen_mask_materials.clear()
+    else:
+        _frozen_mask_materials.pop(material.name, None)
+
+def get_frozen_mask_source(mask_node_tree):
+    '''Returns the output socket that outputs the live value of the provided mask, this is the output linked to the mask mix node when the mask isn't frozen.'''
+    frozen_mask_node = mask_node_tree.nodes.get('FROZEN_MASK')
+    if frozen_mask_node:
+        source_node_name, source_output_identifier = frozen_mask_node.get(FROZEN_MASK_SOURCE_KEY, ("", ""))
+        source_node = mask_node_tree.nodes.get(source_node_name)
+        if source_node == None:
+            return None
+        return next((output for output in source_node.outputs if output.identifier == source_output_identifier), None)
+
+    mask_mix_node = mask_node_tree.nodes.get('MASK_MIX')
+    if mask_mix_node == None or len(mask_mix_node.inputs[7].links) <= 0:
+        return None
+    return mask_mix_node.inputs[7].links[0].from_socket
+
+def format_node_parameter(value):
+    '''Returns a node property or socket value in a format that can be hashed consistently.'''
+    if isinstance(value, bpy.types.ID):
+        return value.name
+    if isinstance(value, set):
+        return tuple(sorted(value))
+    if hasattr(value, "__len__") and not isinstance(value, str):
+        return tuple(format_node_parameter(v) for v in value)
+    if isinstance(value, float):
+        return round(value, 6)
+    return value
+
+def get_node_parameters(node):
+    '''Returns the values of all properties, unlinked inputs, color ramp and curve points of the provided node.'''
+    node_parameters = [node.name, node.bl_idname, node.mute]
+    base_property_names = bpy.types.ShaderNode.bl_rna.properties.keys()
+    for node_property in node.bl_rna.properties:
+        if node_property.identifier in base_property_names or node_property.type == 'COLLECTION':
+            continue
+        value = getattr(node, node_property.identifier, None)
+        if node_property.type == 'POINTER' and not isinstance(value, bpy.types.ID):
+            continue
+        node_parameters.append((node_property.identifier, format_node_parameter(value)))
+
+    for input in node.inputs:
+        if not input.is_linked and hasattr(input, "default_value"):
+            node_parameters.append((input.identifier, format_node_parameter(input.default_value)))
+
+    color_ramp = getattr(node, "color_ramp", None)
+    if color_ramp:
+        node_parameters.append((color_ramp.interpolation, [(round(element.position, 6), format_node_parameter(element.color)) for element in color_ramp.elements]))
+
+    mapping = getattr(node, "mapping", None)
+    if mapping and hasattr(mapping, "curves"):
+        node_parameters.append([[format_node_parameter(point.location) for point in curve.points] for curve in mapping.curves])
+    return node_parameters
+
+def get_mask_parameter_hash(material, layer_index, mask_index):
+    '''Returns a hash of all parameters that change the value of the mask at the provided index, including node properties, links, mask group node inputs, bake hashes of mesh maps the mask uses, the texture set resolution and export UV map.'''
+    mask_node = layer_masks.find_mask_node(material, 'MASK', layer_index, mask_index)
+    mask_node_tree = layer_masks.find_mask_node_tree(material, layer_index, mask_index)
+    export_uv_map_node = material_layers.get_material_layer_node('EXPORT_UV_MAP')
+
+    mask_parameters = [
+        tss.get_texture_width(),
+        tss.get_texture_height(),
+        export_uv_map_node.uv_map if export_uv_map_node else ""
+    ]
+
+    # Mask inputs are linked from previous masks and the material, only unlinked inputs are parameters of this mask.
+    for input in mask_node.inputs:
+        if not input.is_linked and hasattr(input, "default_value"):
+            mask_parameters.append((input.identifier, format_node_parameter(input.default_value)))
+
+    for node in sorted(mask_node_tree.nodes, key=lambda node: node.name):
+        if node.name not in FROZEN_MASK_EXCLUDED_NODES:
+            mask_parameters.append(get_node_parameters(node))
+
+    for link in mask_node_tree.links:
+        if link.from_node.name in FROZEN_MASK_EXCLUDED_NODES or link.to_node.name in FROZEN_MASK_EXCLUDED_NODES:
+            continue
+        mask_parameters.append((link.from_node.name, link.from_socket.identifier, link.to_node.name, link.to_socket.identifier))
+
+    # Re-baked mesh maps keep their image names, their bake hashes change when they're baked with different geometry or settings.
+    for mesh_map_type in mesh_map_baking.MESH_MAP_TYPES:
+        mesh_map_texture_node = material_layers.get_mask_mesh_map_texture_node(material, layer_index, mask_index, mesh_map_type)
+        if mesh_map_texture_node and mesh_map_texture_node.image:
+            mask_parameters.append((mesh_map_type, mesh_map_baking.read_mesh_map_bake_hash(mesh_map_texture_node.image.name)))
+
+    mask_hash = hashlib.sha1()
+    mask_hash.update(repr(mask_parameters).encode('utf-8'))
+    return mask_hash.hexdigest()
+
+def is_frozen_mask_current(material, layer_index, mask_index):
+    '''Returns true if the mask at the provided index is frozen, its frozen image exists and it was baked with the mask's current parameters.'''
+    frozen_mask_node = layer_masks.find_mask_node(material, 'FROZEN_MASK', layer_index, mask_index)
+    if frozen_mask_node == None or frozen_mask_node.image == None:
+        return False
+    return frozen_mask_node.get(FROZEN_MASK_HASH_KEY, "") == get_mask_parameter_hash(material, layer_index, mask_index)
+
+def link_frozen_mask(material, layer_index, mask_index, use_frozen_image):
+    '''Links the frozen image (or the live mask value) of the mask at the provided index to the mask mix node. Returns true if links were changed.'''
+    mask_node_tree = layer_masks.find_mask_node_tree(material, layer_index, mask_index)
+    mask_mix_node = mask_node_tree.nodes.get('MASK_MIX')
+    frozen_mask_node = mask_node_tree.nodes.get('FROZEN_MASK')
+    if use_frozen_image:
+        output_socket = frozen_mask_node.outputs.get('Color')
+    else:
+        output_socket = get_frozen_mask_source(mask_node_tree)
+    if output_socket == None or mask_mix_node == None:
+        return False
+
+    mix_links = mask_mix_node.inputs[7].links
+    if len(mix_links) > 0 and mix_links[0].from_socket == output_socket:
+        return False
+    mask_node_tree.links.new(output_socket, mask_mix_node.inputs[7])
+    return True
+
+def create_frozen_mask_nodes(material, layer_index, mask_index, mask_hash):
+    '''Creates (or updates) the image texture node that reads the frozen image of the mask at the provided index, then links it in place of the live mask value.'''
+    mask_node_tree = layer_masks.find_mask_node_tree(material, layer_index, mask_index)
+    nodes = mask_node_tree.nodes
+    source_socket = get_frozen_mask_source(mask_node_tree)
+    mask_mix_node = nodes.get('MASK_MIX')
+
+    frozen_mask_node = nodes.get('FROZEN_MASK')
+    if frozen_mask_node == None:
+        frozen_mask_node = nodes.new('ShaderNodeTexImage')
+        frozen_mask_node.name = 'FROZEN_MASK'
+        frozen_mask_node.label = frozen_mask_node.name
+        frozen_mask_node.location = (mask_mix_node.location[0] - 300, mask_mix_node.location[1] + 400)
+    frozen_mask_node[FROZEN_MASK_SOURCE_KEY] = (source_socket.node.name, source_socket.identifier)
+    frozen_mask_node[FROZEN_MASK_HASH_KEY] = mask_hash
+    frozen_mask_node.image = bpy.data.images.get(format_frozen_mask_image_name(mask_node_tree.name))
+
+    # Frozen masks are baked to the export UV map.
+    frozen_mask_uv_node = nodes.get('FROZEN_MASK_UV')
+    if frozen_mask_uv_node == None:
+        frozen_mask_uv_node = nodes.new('ShaderNodeUVMap')
+        frozen_mask_uv_node.name = 'FROZEN_MASK_UV'
+        frozen_mask_uv_node.label = frozen_mask_uv_node.name
+        frozen_mask_uv_node.location = (frozen_mask_node.location[0] - 200, frozen_mask_node.location[1])
+    export_uv_map_node = material_layers.get_material_layer_node('EXPORT_UV_MAP')
+    if export_uv_map_node:
+        frozen_mask_uv_node.uv_map = export_uv_map_node.uv_map
+    mask_node_tree.links.new(frozen_mask_uv_node.outputs[0], frozen_mask_node.inputs[0])
+
+    link_frozen_mask(material, layer_index, mask_index, use_frozen_image=True)
+    _frozen_mask_materials[material.name] = True
+
+def unfreeze_mask(material, layer_index, mask_index):
+    '''Relinks the live value of the mask at the provided index, then removes its frozen image and nodes.'''
+    mask_node_tree = layer_masks.find_mask_node_tree(material, layer_index, mask_index)
+    if mask_node_tree == None or mask_node_tree.nodes.get('FROZEN_MASK') == None:
+        return
+
+    link_frozen_mask(material, layer_index, mask_index, use_frozen_image=False)
+
+    # The frozen image is found through the frozen mask node, image names aren't updated when mask node trees are renamed.
+    frozen_mask_image = mask_node_tree.nodes.get('FROZEN_MASK').image
+    for node_name in ('FROZEN_MASK', 'FROZEN_MASK_UV'):
+        node = mask_node_tree.nodes.get(node_name)
+        if node:
+            mask_node_tree.nodes.remove(node)
+    if frozen_mask_image:
+        bpy.data.images.remove(frozen_mask_image)
+    clear_frozen_mask_flags(material)
+
+def get_stale_frozen_masks(material):
+    '''Returns (layer index, mask index) for all frozen masks in the provided material that are out of date.'''
+    stale_frozen_masks = []
+    for layer_index in range(0, material_layers.count_layers(material)):
+        for mask_index in range(0, len(material_layers.get_layer_mask_ids(material, layer_index))):
+            if is_mask_frozen(material, layer_index, mask_index) and not is_frozen_mask_current(material, layer_index, mask_index):
+                stale_frozen_masks.append((layer_index, mask_index))
+    return stale_frozen_masks
+
+def bake_frozen_mask(material, layer_index, mask_index):
+    '''Starts baking the live value of the mask at the provided index into its frozen image. The mask group output is linked to the live mask value while baking, call end_frozen_mask_bake once the bake finishes. Returns the name of the frozen image, or an empty string if baking failed to start.'''
+    mask_node = layer_masks.find_mask_node(material, 'MASK', layer_index, mask_index)
+    mask_node_tree = mask_node.node_tree
+    group_output_node = mask_node_tree.nodes.get('GROUP_OUTPUT')
+    mask_node_tree.links.new(get_frozen_mask_source(mask_node_tree), group_output_node.inputs[0])
+
+    # Masks are grayscale values, bake them to 8-bit images to use a quarter of the memory of 32-bit cache images.
+    frozen_mask_image = bake_cache_image(material, format_frozen_mask_image_name(mask_node_tree.name), mask_node.outputs[0], thirty_two_bit=False)
+    if frozen_mask_image == None:
+        return ""
+    return frozen_mask_image.name
+
+def end_frozen_mask_bake(material, layer_index, mask_index):
+    '''Relinks the mask mix node to the mask group output after baking the mask at the provided index.'''
+    mask_node_tree = layer_masks.find_mask_node_tree(material, layer_index, mask_index)
+    if mask_node_tree == None:
+        return
+    mask_mix_node = mask_node_tree.nodes.get('MASK_MIX')
+    group_output_node = mask_node_tree.nodes.get('GROUP_OUTPUT')
+    if mask_mix_node and group_output_node:
+        mask_node_tree.links.new(mask_mix_node.outputs[0], group_output_node.inputs[0])
+
+def detect_frozen_mask_edits(depsgraph):
+    '''Requests checking frozen masks in the active material for edits if the provided depsgraph contains updates to the node tree of a frozen mask.'''
+    active_object = bpy.context.view_layer.objects.active
+    if active_object == None or active_object.active_material == None:
+        return
+
+    # Skip looking up nodes in updated node trees when the active material has no frozen masks.
+    if not has_frozen_masks(active_object.active_material):
+        return
+
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.ShaderNodeTree) and update.id.nodes.get('FROZEN_MASK'):
+            update_dispatcher.request_update('FROZEN_MASKS', 'FROZEN_MASK_EDIT')
+            return
+
+def update_frozen_masks():
+    '''Shows frozen masks in the active material live if their parameters changed since they were baked, and schedules re-baking them.'''
+    if bau.verify_material_operation_context(display_message=False) == False:
+        return
+
+    active_material = bpy.context.active_object.active_material
+    stale_frozen_masks = get_stale_frozen_masks(active_material)
+    for layer_index, mask_index in stale_frozen_masks:
+        if link_frozen_mask(active_material, layer_index, mask_index, use_frozen_image=False):
+            debug_logging.log("Frozen mask {0} in layer {1} is out of date.".format(mask_index, layer_index), sub_process=True)
+
+    if len(stale_frozen_masks) > 0:
+        schedule_frozen_mask_rebake(active_material)
+
+def schedule_frozen_mask_rebake(material):
+    '''Re-bakes out of date frozen masks in the provided material once masks stop being edited for the re-bake delay.'''
+    global _rebake_mask_material_name
+    _rebake_mask_material_name = material.name
+    if bpy.app.timers.is_registered(rebake_frozen_masks):
+        bpy.app.timers.unregister(rebake_frozen_masks)
+    bpy.app.timers.register(rebake_frozen_masks, first_interval=FROZEN_LAYER_REBAKE_DELAY)
+
+def rebake_frozen_masks():
+    '''Re-bakes out of date frozen masks in the active material, this is called by a timer after frozen masks stop being edited.'''
+    if bpy.app.is_job_running('OBJECT_BAKE') or getattr(bpy.context.scene, "pause_auto_updates", False):
+        return FROZEN_LAYER_REBAKE_DELAY
+
+    active_object = bpy.context.view_layer.objects.active
+    if active_object == None or active_object.active_material == None or active_object.active_material.name != _rebake_mask_material_name:
+        return None
+
+    # Wait until the active object can be baked, e.g. until it leaves edit mode.
+    if get_cache_bake_error() != "":
+        return FROZEN_LAYER_REBAKE_DELAY
+
+    if not invoke_in_viewport(bpy.ops.rymat.rebake_frozen_masks):
+        debug_logging.log("Unable to re-bake frozen masks, no 3D viewport is open.", message_type='WARNING')
+    return None
+
+def cancel_frozen_mask_rebake():
+    '''Cancels re-baking frozen masks if a re-bake is scheduled.'''
+    if bpy.app.timers.is_registered(rebake_frozen_masks):
+        bpy.app.timers.unregister(rebake_frozen_masks)
+
+
+#----------------------------- OPERATORS -----------------------------#
+
+
+class RYMAT_OT_freeze_layers(Operator):
+    bl_idname = "rymat.freeze_layers"
+    bl_label = "Freeze Layers Below"
+    bl_description = "Bakes all layers below the selected layer into cache images that replace them in the layer stack, which reduces shader compile times and improves viewport performance. Frozen layers can still be edited, they're shown live while edited, then automatically re-baked"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    rebake: BoolProperty(default=False, options={'HIDDEN'})
+
+    _timer = None
+    _bake_channel_index = -1
+    _frozen_material_channels = []
+    _frozen_layer_ids = []
+    _top_layer_index = -1
+    _bake_image_name = ""
+    _original_render_engine_name = ""
+    _original_render_settings = {}
+    _start_bake_time = 0
+
+    # Users must have an object selected to call this operator.
+    @ classmethod
+    def poll(cls, context):
+        return bau.verify_addon_active_material(context)
+
+    def modal(self, context, event):
+        with bake_isolation.end_bake_isolation_on_error():
+            return self.update_bake(context, event)
+
+    def update_bake(self, context, event):
+        '''Handles the provided modal event, starting the next bake when the running bake job finishes.'''
+        if event.type in {'ESC'}:
+            self.cancel(context)
+            return {'CANCELLED'}
+
+        if event.type == 'TIMER':
+
+            # If baking still isn't finished, abort until the next timer event.
+            if bpy.app.is_job_running('OBJECT_BAKE'):
+                return {'PASS_THROUGH'}
+
+            # If an image was baked, pack it in the blend files data.
+            if self._bake_channel_index >= 0:
+                if not is_cache_bake_successful(self._bake_image_name):
+                    self.stop(context, "Baking frozen layer cache {0} failed, frozen layers are shown live.".format(self._bake_image_name), 'ERROR')
+                    return {'CANCELLED'}
+
+                bake_image = bpy.data.images.get(self._bake_image_name)
+                if not bake_image.packed_file:
+                    bake_image.pack()
+                    debug_logging.log("Baked frozen layer cache: {0}".format(self._bake_image_name))
+
+            # Start baking the next material channel.
+            if self._bake_channel_index < len(self._frozen_material_channels) - 1:
+                self._bake_channel_index += 1
+                active_material = bpy.context.active_object.active_material
+                material_channel_name = self._frozen_material_channels[self._bake_channel_index]
+                self._bake_image_name = bake_frozen_material_channel(active_material, material_channel_name, self._top_layer_index)
+                if self._bake_image_name == "":
+                    self.stop(context, "Unable to start baking the frozen layer cache for {0}, frozen layers are shown live.".format(material_channel_name), 'ERROR')
+                    return {'CANCELLED'}
+
+            # Finish if there are no more material channels to bake.
+            else:
+                self.finish(context)
+                return {'FINISHED'}
+
+        # Pass events through so the interface stays usable while layers are baked.
+        return {'PASS_THROUGH'}
+
+    def execute(self, context):
+        active_material = bpy.context.active_object.active_material
+
+        # To avoid errors don't start baking if there is somehow already a bake job running.
+        if bpy.app.is_job_running('OBJECT_BAKE') == True:
+            debug_logging.log_status("Bake job already in process, cancel or wait until the bake is finished before starting another.", self)
+            return {'FINISHED'}
+
+        cache_bake_error = get_cache_bake_error()
+        if cache_bake_error != "":
+            debug_logging.log_status(cache_bake_error, self, type='ERROR')
+            return {'CANCELLED'}
+
+        # Freeze all layers below the selected layer, or re-bake layers that are already frozen.
+        if self.rebake:
+            frozen_layer_data = get_frozen_layer_data(active_material)
+            if frozen_layer_data == None:
+                return {'FINISHED'}
+
+            # Layers that were moved above or deleted are no longer frozen, frozen layers end at the highest remaining frozen layer.
+            frozen_layer_count = 0
+            for layer_id in frozen_layer_data['layer_ids']:
+                layer_index = material_layers.find_layer_index(active_material, layer_id)
+                if layer_index != -1:
+                    frozen_layer_count = max(frozen_layer_count, layer_index + 1)
+        else:
+            frozen_layer_count = bpy.context.scene.rymat_layer_stack.selected_layer_index
+
+        if frozen_layer_count <= 0:
+            unfreeze_layers(active_material)
+            material_layers.link_layer_group_nodes(self)
+            debug_logging.log_status("No layers below the selected layer to freeze.", self, type='INFO')
+            return {'FINISHED'}
+
+        # The top visible frozen layer outputs the result of all frozen layers.
+        self._top_layer_index = -1
+        for i in range(frozen_layer_count - 1, -1, -1):
+            if bau.get_node_active(material_layers.find_material_layer_node(active_material, 'LAYER', i)):
+                self._top_layer_index = i
+                break
+
+        self._frozen_material_channels = get_frozen_material_channels(active_material, frozen_layer_count)
+        if self._top_layer_index < 0 or len(self._frozen_material_channels) <= 0:
+            unfreeze_layers(active_material)
+            material_layers.link_layer_group_nodes(self)
+            debug_logging.log_status("No visible material channels in layers below the selected layer to freeze.", self, type='INFO')
+            return {'FINISHED'}
+
+        # Link all layers live while baking, so the bake includes every frozen layer.
+        layer_ids, mask_ids = material_layers.read_layer_stack_metadata(active_material)
+        self._frozen_layer_ids = layer_ids[:frozen_layer_count]
+        write_frozen_layer_data(active_material, self._frozen_layer_ids, self._frozen_material_channels, 'BAKING')
+        material_layers.link_layer_group_nodes(self)
+        debug_logging.log("Freezing {0} layers, baking material channels: {1}".format(frozen_layer_count, self._frozen_material_channels))
+
+        self._bake_channel_index = -1
+        self._bake_image_name = ""
+        begin_cache_bake(self, context, "freezing layers")
+
+        # Baking will start automatically when the timer hits the first event.
+        return {'RUNNING_MODAL'}
+
+    def cancel(self, context):
+        self.stop(context, "Freezing layers was cancelled by the user.", 'INFO')
+
+    def stop(self, context, message, message_type):
+        '''Stops baking before all material channels are baked. Frozen layers that were being re-baked stay out of date and are shown live, new frozen layers are removed.'''
+        end_cache_bake(self, context)
+
+        active_material = bpy.context.active_object.active_material
+        if self.rebake:
+            set_frozen_layer_state(active_material, 'STALE')
+        else:
+            unfreeze_layers(active_material)
+
+            # Cache images baked before stopping aren't used by cache nodes yet.
+            for material_channel_name in self._frozen_material_channels[:self._bake_channel_index + 1]:
+                cache_image = bpy.data.images.get(format_frozen_cache_image_name(active_material.name, material_channel_name))
+                if cache_image:
+                    bpy.data.images.remove(cache_image)
+        material_layers.link_layer_group_nodes(self)
+        debug_logging.log_status(message, self, type=message_type)
+
+    def finish(self, context):
+        end_cache_bake(self, context)
+
+        # Replace frozen layers with their cache images in the layer stack.
+        active_material = bpy.context.active_object.active_material
+        create_frozen_cache_nodes(active_material, self._frozen_material_channels, self._top_layer_index)
+        write_frozen_layer_data(active_material, self._frozen_layer_ids, self._frozen_material_channels, 'FROZEN')
+        links_changed = material_layers.link_layer_group_nodes(self)
+
+        total_bake_time = time.time() - self._start_bake_time
+        debug_logging.log_status("Froze {0} layers ({1} material channels, {2} links changed), total time: {3} seconds.".format(
+            len(self._frozen_layer_ids),
+            len(self._frozen_material_channels),
+            links_changed,
+            round(total_bake_time, 1)
+        ), self, type='INFO')
+
+class RYMAT_OT_rebake_frozen_layers(RYMAT_OT_freeze_layers):
+    bl_idname = "rymat.rebake_frozen_layers"
+    bl_label = "Re-bake Frozen Layers"
+    bl_description = "Re-bakes out of date frozen layers in the active material. This is run automatically after frozen layers stop being edited, so it isn't added to the undo history"
+    bl_options = {'INTERNAL'}
+
+    rebake: BoolProperty(default=True, options={'HIDDEN'})
+
+class RYMAT_OT_unfreeze_layers(Operator):
+    bl_idname = "rymat.unfreeze_layers"
+    bl_label = "Unfreeze Layers"
+    bl_description = "Removes frozen layer cache images from the active material, so all layers are shown live again"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    # Users must have an object selected to call this operator.
+    @ classmethod
+    def poll(cls, context):
+        return bau.verify_addon_active_material(context)
+
+    def execute(self, context):
+        active_material = bpy.context.active_object.active_material
+        cancel_frozen_layer_rebake()
+        unfreeze_layers(active_material)
+        material_layers.link_layer_group_nodes(self)
+        return {'FINISHED'}
+
+class RYMAT_OT_freeze_mask(Operator):
+    bl_idname = "rymat.freeze_mask"
+    bl_label = "Freeze Mask"
+    bl_description = "Bakes the value of the mask to a grayscale texture at the texture set resolution, which replaces the mask's procedural nodes. Frozen masks are shown live while edited, then automatically re-baked"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    mask_index: IntProperty(default=-1, options={'HIDDEN'})
+    rebake: BoolProperty(default=False, options={'HIDDEN'})
+
+    _timer = None
+    _bake_masks = []
+    _bake_mask_index = -1
+    _bake_image_name = ""
+    _original_mask_mute = False
+    _original_render_engine_name = ""
+    _original_render_settings = {}
+    _start_bake_time = 0
+
+    # Users must have an object selected to call this operator.
+    @ classmethod
+    def poll(cls, context):
+        return bau.verify_addon_active_material(context)
+
+    def modal(self, context, event):
+        with bake_isolation.end_bake_isolation_on_error():
+            return self.update_bake(context, event)
+
+    def update_bake(self, context, event):
+        '''Handles the provided modal event, starting the next bake when the running bake job finishes.'''
+        if event.type in {'ESC'}:
+            self.cancel(context)
+            return {'CANCELLED'}
+
+        if event.type == 'TIMER':
+
+            # If baking still isn't finished, abort until the next timer event.
+            if bpy.app.is_job_running('OBJECT_BAKE'):
+                return {'PASS_THROUGH'}
+
+            # If a mask was baked, pack it in the blend files data and replace the live mask with it.
+            active_material = bpy.context.active_object.active_material
+            if self._bake_mask_index >= 0:
+                if not is_cache_bake_successful(self._bake_image_name):
+                    self.stop(context, "Baking frozen mask {0} failed, the mask is shown live.".format(self._bake_image_name), 'ERROR')
+                    return {'CANCELLED'}
+
+                layer_index, mask_index, mask_hash = self._bake_masks[self._bake_mask_index]
+                self.end_mask_bake(active_material)
+                bake_image = bpy.data.images.get(self._bake_image_name)
+                if not bake_image.packed_file:
+                    bake_image.pack()
+                create_frozen_mask_nodes(active_material, layer_index, mask_index, mask_hash)
+                debug_logging.log("Baked frozen mask: {0}".format(self._bake_image_name))
+
+            # Start baking the next mask.
+            if self._bake_mask_index < len(self._bake_masks) - 1:
+                self._bake_mask_index += 1
+                layer_index, mask_index, mask_hash = self._bake_masks[self._bake_mask_index]
+
+                # Muted masks output the previous mask, unmute the mask while baking so its own value is baked.
+                mask_node = layer_masks.find_mask_node(active_material, 'MASK', layer_index, mask_index)
+                self._original_mask_mute = mask_node.mute
+                mask_node.mute = False
+                self._bake_image_name = bake_frozen_mask(active_material, layer_index, mask_index)
+                if self._bake_image_name == "":
+                    self.stop(context, "Unable to start baking frozen mask {0} in layer {1}, the mask is shown live.".format(mask_index, layer_index), 'ERROR')
+                    return {'CANCELLED'}
+
+            # Finish if there are no more masks to bake.
+            else:
+                self.finish(context)
+                return {'FINISHED'}
+
+        # Pass events through so the interface stays usable while masks are baked.
+        return {'PASS_THROUGH'}
+
+    def execute(self, context):
+        active_material = bpy.context.active_object.active_material
+
+        # To avoid errors don't start baking if there is somehow already a bake job running.
+        if bpy.app.is_job_running('OBJECT_BAKE') == True:
+            debug_logging.log_status("Bake job already in process, cancel or wait until the bake is finished before starting another.", self)
+            return {'FINISHED'}
+
+        cache_bake_error = get_cache_bake_error()
+        if cache_bake_error != "":
+            debug_logging.log_status(cache_bake_error, self, type='ERROR')
+            return {'CANCELLED'}
+
+        # Re-bake out of date frozen masks, or freeze the specified mask.
+        if self.rebake:
+            bake_masks = get_stale_frozen_masks(active_material)
+        else:
+            selected_layer_index = bpy.context.scene.rymat_layer_stack.selected_layer_index
+            mask_index = self.mask_index
+            if mask_index < 0:
+                mask_index = bpy.context.scene.rymat_mask_stack.selected_index
+
+            if not is_mask_freezable(active_material, selected_layer_index, mask_index):
+                debug_logging.log_status("Image and decal masks already sample a single texture, they can't be frozen.", self, type='INFO')
+                return {'FINISHED'}
+
+            # Skip baking masks that were already baked with their current parameters.
+            if is_frozen_mask_current(active_material, selected_layer_index, mask_index):
+                link_frozen_mask(active_material, selected_layer_index, mask_index, use_frozen_image=True)
+                debug_logging.log_status("Mask is already frozen with its current parameters.", self, type='INFO')
+                return {'FINISHED'}
+            bake_masks = [(selected_layer_index, mask_index)]
+
+        if len(bake_masks) <= 0:
+            return {'FINISHED'}
+
+        # Hashes are recorded before baking, edits made while baking leave the frozen mask out of date so it's re-baked.
+        self._bake_masks = [(layer_index, mask_index, get_mask_parameter_hash(active_material, layer_index, mask_index)) for layer_index, mask_index in bake_masks]
+        self._bake_mask_index = -1
+        self._bake_image_name = ""
+        debug_logging.log("Freezing {0} masks.".format(len(self._bake_masks)))
+        begin_cache_bake(self, context, "freezing masks")
+
+        # Baking will start automatically when the timer hits the first event.
+        return {'RUNNING_MODAL'}
+
+    def end_mask_bake(self, active_material):
+        '''Relinks the mask that was being baked to its group output, and restores its visibility.'''
+        layer_index, mask_index, mask_hash = self._bake_masks[self._bake_mask_index]
+        end_frozen_mask_bake(active_material, layer_index, mask_index)
+        mask_node = layer_masks.find_mask_node(active_material, 'MASK', layer_index, mask_index)
+        if mask_node:
+            mask_node.mute = self._original_mask_mute
+
+    def cancel(self, context):
+        self.stop(context, "Freezing masks was cancelled by the user.", 'INFO')
+
+    def stop(self, context, message, message_type):
+        '''Stops baking before all masks are baked, and removes the partly baked frozen image of the mask that was being baked. A frozen mask that was being re-baked stays out of date and is shown live, a mask that was being frozen is unfrozen.'''
+        active_material = bpy.context.active_object.active_material
+        if self._bake_mask_index >= 0:
+            layer_index, mask_index, mask_hash = self._bake_masks[self._bake_mask_index]
+            self.end_mask_bake(active_material)
+            if not self.rebake:
+                unfreeze_mask(active_material, layer_index, mask_index)
+            bake_image = bpy.data.images.get(self._bake_image_name)
+            if bake_image:
+                bpy.data.images.remove(bake_image)
+        end_cache_bake(self, context)
+        layer_masks.refresh_mask_slots()
+        debug_logging.log_status(message, self, type=message_type)
+
+    def finish(self, context):
+        end_cache_bake(self, context)
+        layer_masks.refresh_mask_slots()
+        total_bake_time = time.time() - self._start_bake_time
+        debug_logging.log_status("Froze {0} masks, total time: {1} seconds.".format(len(self._bake_masks), round(total_bake_time, 1)), self, type='INFO')
+
+class RYMAT_OT_rebake_frozen_masks(RYMAT_OT_freeze_mask):
+    bl_idname = "rymat.rebake_frozen_masks"
+    bl_label = "Re-bake Frozen Masks"
+    bl_description = "Re-bakes out of date frozen masks in the active material. This is run automatically after frozen masks stop being edited, so it isn't added to the undo history"
+    bl_options = {'INTERNAL'}
+
+    rebake: BoolProperty(default=True, options={'HIDDEN'})
+
+class RYMAT_OT_unfreeze_mask(Operator):
+    bl_idname = "rymat.unfreeze_mask"
+    bl_label = "Unfreeze Mask"
+    bl_description = "Removes the frozen texture from the mask, so its procedural nodes are evaluated live again"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    mask_index: IntProperty(default=-1, options={'HIDDEN'})
+
+    # Users must have an object selected to call this operator.
+    @ classmethod
+    def poll(cls, context):
+        return bau.verify_addon_active_material(context)
+
+    def execute(self, context):
+        active_material = bpy.context.active_object.active_material
+        selected_layer_index = bpy.context.scene.rymat_layer_stack.selected_layer_index
+        mask_index = self.mask_index
+        if mask_index < 0:
+            mask_index = bpy.context.scene.rymat_mask_stack.selected_index
+        unfreeze_mask(active_material, selected_layer_index, mask_index)
+        return {'FINISHED'}
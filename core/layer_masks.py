@@ -6,6 +6,33 @@ from ..core import texture_set_settings as tss
 from ..core import material_layers
 from ..core import blender_addon_utils as bau
 from ..core import debug_logging
+from ..core import uv_rasterization
+from ..core import layer_freezing
+
+# Names of nodes within mask node trees accessed with get_mask_node, node name formats can include the node number ({number}).
+MASK_NODE_NAMES = {
+    'GROUP_INPUT': 'GROUP_INPUT',
+    'GROUP_OUTPUT': 'GROUP_OUTPUT',
+    'MASK_TYPE': 'MASK_TYPE',
+    'MASK_MIX': 'MASK_MIX',
+    'FILTER': 'FILTER',
+    'PROJECTION': 'PROJECTION',
+    'DECAL_COORDINATES': 'DECAL_COORDINATES',
+    'DECAL_OFFSET': 'DECAL_OFFSET',
+    'TRIPLANAR_BLEND': 'TRIPLANAR_BLEND',
+    'TEXTURE': 'TEXTURE_{number}',
+    'BLUR': 'BLUR',
+    'AMBIENT_OCCLUSION': 'AMBIENT_OCCLUSION',
+    'CURVATURE': 'CURVATURE',
+    'THICKNESS': 'THICKNESS',
+    'NORMALS': 'NORMALS',
+    'WORLD_SPACE_NORMALS': 'WORLD_SPACE_NORMALS',
+    'SEPARATE_RGB': 'SEPARATE_RGB',
+    'FROZEN_MASK': 'FROZEN_MASK',
+    'FROZEN_MASK_UV': 'FROZEN_MASK_UV',
+    'MESH_MAPS': 'MESH_MAPS',
+    'MESH_MAP_UV': 'MESH_MAP_UV'
+}
 
 def update_selected_mask_index(self, context):
     '''Updates properties when the selected mask slot is changed.'''
@@ -15,40 +42,50 @@ def update_selected_mask_index(self, context):
     if mask_texture_node:
         bau.set_texture_paint_image(mask_texture_node.image)
 
-def parse_mask_layer_index(mask_group_node_name):
-    '''Return the mask's layer index by parsing the mask group node name. Returns -1 if there is no active object.'''
-    active_object = bpy.context.active_object
-    if active_object:
-        active_material = active_object.active_material
-        if active_material:
-            indicies = mask_group_node_name[len(active_object.name):]
-            indicies = indicies.split('_')
-            return int(indicies[1])
-    return -1
-
-def parse_mask_index(mask_group_node_name):
-    '''Return the mask's index by parsing the mask group node name. Returns -1 if there is no active object.'''
-    active_object = bpy.context.active_object
-    if active_object:
-        active_material = active_object.active_material
-        if active_material:
-            indicies = mask_group_node_name[len(active_object.name):]
-            indicies = indicies.split('_')
-            return int(indicies[2])
-    return -1
-
-def format_mask_name(layer_index, mask_index, material_name=""):
-    '''Returns a properly formatted name for a mask node created with this add-on.'''
+def format_mask_name(layer_key, mask_key, material_name=""):
+    '''Returns a properly formatted name for a mask node created with this add-on. Masks are named using their layer and mask ID, or their layer and mask index for new masks that aren't added to the layer stack yet.'''
     if material_name == "":
         material_name = bpy.context.active_object.active_material.name
-    return "{0}_{1}_{2}".format(material_name, str(layer_index), str(mask_index))
+    return "{0}_{1}_{2}".format(material_name, str(layer_key), str(mask_key))
 
 def get_mask_node_tree(layer_index, mask_index, active_material_name=""):
     '''Returns the mask node tree / node group at the provided layer and mask index.'''
     if active_material_name == "":
-        active_material_name = bpy.context.active_object.active_material.name
-    mask_node_tree_name = format_mask_name(layer_index, mask_index, active_material_name)
-    return bpy.data.node_groups.get(mask_node_tree_name)
+        active_material = bpy.context.active_object.active_material
+    else:
+        active_material = bpy.data.materials.get(active_material_name)
+        if active_material == None:
+            return bpy.data.node_groups.get(format_mask_name(layer_index, mask_index, active_material_name))
+    return find_mask_node_tree(active_material, layer_index, mask_index)
+
+def find_mask_node_tree(material, layer_index, mask_index, use_index=True):
+    '''Returns the mask node tree for the specified layer and mask index in the provided material, found through the material's layer node index unless use_index is false.'''
+    node_index = material_layers.get_layer_node_index(material)
+    layer_key = material_layers.get_layer_key(material, layer_index)
+    mask_key = material_layers.get_mask_key(material, layer_index, mask_index)
+    if layer_key == None or mask_key == None:
+        return None
+    return material_layers.get_indexed_node_group(node_index, (layer_index, mask_index), lambda: format_mask_name(layer_key, mask_key, material.name), use_index)
+
+def find_mask_node(material, node_name, layer_index, mask_index, node_number=1, get_changed=False, use_index=True):
+    '''Returns the desired mask node from the provided material if it exists.'''
+    if node_name == 'MASK':
+        if get_changed:
+            return material.node_tree.nodes.get(format_mask_name(layer_index, mask_index, material.name) + "~")
+        layer_key = material_layers.get_layer_key(material, layer_index)
+        mask_key = material_layers.get_mask_key(material, layer_index, mask_index)
+        if layer_key == None or mask_key == None:
+            return None
+        return material.node_tree.nodes.get(format_mask_name(layer_key, mask_key, material.name))
+
+    mask_node_name_format = MASK_NODE_NAMES.get(node_name)
+    if mask_node_name_format == None:
+        return None
+
+    node_tree = find_mask_node_tree(material, layer_index, mask_index, use_index)
+    if node_tree:
+        return node_tree.nodes.get(mask_node_name_format.format(number=node_number))
+    return None
 
 def get_mask_node(node_name, layer_index, mask_index, node_number=1, get_changed=False):
     if bpy.context.active_object == None:
@@ -58,131 +95,7 @@ def get_mask_node(node_name, layer_index, mask_index, node_number=1, get_changed
     if active_material == None:
         return None
 
-    match node_name:
-        case 'MASK':
-            mask_node_name = format_mask_name(layer_index, mask_index)
-            if get_changed:
-                mask_node_name += "~"
-            return active_material.node_tree.nodes.get(mask_node_name)
-
-        case 'GROUP_INPUT':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('GROUP_INPUT')
-            return None     
-
-        case 'GROUP_OUTPUT':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('GROUP_OUTPUT')
-            return None    
-
-        case 'MASK_TYPE':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('MASK_TYPE')
-            return None     
-
-        case 'MASK_MIX':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('MASK_MIX')
-            return None
-
-        case 'FILTER':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('FILTER')
-            return None
-
-        case 'PROJECTION':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('PROJECTION')
-            return None
-
-        case 'DECAL_COORDINATES':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('DECAL_COORDINATES')
-            return None
-
-        case 'DECAL_OFFSET':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('DECAL_OFFSET')
-            return None
-
-        case 'TRIPLANAR_BLEND':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('TRIPLANAR_BLEND')
-            return None
-
-        case 'TEXTURE':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get("TEXTURE_{0}".format(node_number))
-            return None
-        
-        case 'BLUR':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('BLUR')
-            return None        
-
-        case 'AMBIENT_OCCLUSION':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('AMBIENT_OCCLUSION')
-            return None
-
-        case 'CURVATURE':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('CURVATURE')
-            return None
-        
-        case 'THICKNESS':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('THICKNESS')
-            return None
-        
-        case 'NORMALS':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('NORMALS')
-            return None
-        
-        case 'WORLD_SPACE_NORMALS':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('WORLD_SPACE_NORMALS')
-            return None
-        
-        case 'SEPARATE_RGB':
-            mask_group_node_name = format_mask_name(layer_index, mask_index)
-            node_tree = bpy.data.node_groups.get(mask_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('SEPARATE_RGB')
-            return None
+    return find_mask_node(active_material, node_name, layer_index, mask_index, node_number, get_changed)
 
 def get_mask_type(layer_index, mask_index):
     '''Returns the mask type by returning the label of the mask type node from the mask group node.'''
@@ -193,7 +106,17 @@ def get_mask_type(layer_index, mask_index):
         return 'UNDEFINED'
 
 def count_masks(layer_index, material_name=""):
-    '''Counts the total number of masks for the specified material by applied to the specified layer by counting existing material node groups in the blend data.'''
+    '''Counts the total number of masks for the specified material by applied to the specified layer, read from the layer stack metadata stored in the material. Falls back to counting mask node groups named using layer and mask indices in the blend data, for materials saved before layers had IDs.'''
+    if material_name != "":
+        material = bpy.data.materials.get(material_name)
+    else:
+        material = getattr(bpy.context.active_object, "active_material", None)
+
+    if material and material.node_tree:
+        layer_mask_ids = material_layers.get_layer_mask_ids(material, layer_index)
+        if layer_mask_ids != None:
+            return len(layer_mask_ids)
+
     mask_count = 0
 
     # If a specific material name is provided, count for the material name.
@@ -214,14 +137,7 @@ def add_mask_slot():
     masks = bpy.context.scene.rymat_masks
     mask_stack = bpy.context.scene.rymat_mask_stack
 
-    mask_slot = masks.add()
-
-    # This allows the layer slot array index to be found using the name of the layer slot as a key.
-    # Assign a random, unique number to the layer slot. 
-    unique_random_slot_id = str(random.randrange(0, 999999))
-    while masks.find(unique_random_slot_id) != -1:
-        unique_random_slot_id = str(random.randrange(0, 999999))
-    mask_slot.name = unique_random_slot_id
+    masks.add()
 
     # If there is no layer selected, move the layer to the top of the stack.
     if bpy.context.scene.rymat_mask_stack.selected_index < 0:
@@ -239,8 +155,16 @@ def add_mask_slot():
         mask_stack.layer_index = move_to_index
         bpy.context.scene.rymat_mask_stack.selected_index = max(0, min(bpy.context.scene.rymat_mask_stack.selected_index + 1, len(masks) - 1))
 
+    sync_mask_slot_names(masks, move_to_index)
     return bpy.context.scene.rymat_mask_stack.selected_index
 
+def sync_mask_slot_names(masks, start_index=0):
+    '''Names mask slots using their index in the mask stack, starting from the provided slot index. Slot names are deterministic, so adding mask slots doesn't need to search for unused random names.'''
+    for i in range(start_index, len(masks)):
+        slot_name = str(i)
+        if masks[i].name != slot_name:
+            masks[i].name = slot_name
+
 def add_layer_mask(type, self):
     '''Adds a mask of the specified type to the selected material layer.'''
 
@@ -381,7 +305,8 @@ def add_layer_mask(type, self):
             reindex_masks('ADDED_MASK', selected_layer_index, new_mask_slot_index)
             organize_mask_nodes()
             link_mask_nodes(selected_layer_index)
-            material_layers.apply_mesh_maps()
+            material_layers.bind_mask_mesh_maps(active_material, selected_layer_index, new_mask_slot_index)
+            material_layers.update_mesh_map_node_group(active_material)
 
             # Add a default grunge texture to the mask.
             default_grunge_texture = bau.append_image('DefaultGrunge')
@@ -403,7 +328,8 @@ def add_layer_mask(type, self):
             reindex_masks('ADDED_MASK', selected_layer_index, new_mask_slot_index)
             organize_mask_nodes()
             link_mask_nodes(selected_layer_index)
-            material_layers.apply_mesh_maps()
+            material_layers.bind_mask_mesh_maps(active_material, selected_layer_index, new_mask_slot_index)
+            material_layers.update_mesh_map_node_group(active_material)
 
             # Add a default grunge texture to the mask.
             default_grunge_texture = bau.append_image('DefaultGrunge')
@@ -413,6 +339,30 @@ def add_layer_mask(type, self):
                     
             debug_logging.log("Added edge wear mask.")
 
+        case 'ISLAND_ID':
+            default_node_group = bau.append_group_node("RY_ImageMask", never_auto_delete=True)
+            default_node_group.name = format_mask_name(selected_layer_index, new_mask_slot_index) + "~"
+
+            new_mask_group_node = active_material.node_tree.nodes.new('ShaderNodeGroup')
+            new_mask_group_node.node_tree = default_node_group
+            new_mask_group_node.name = format_mask_name(selected_layer_index, new_mask_slot_index) + "~"
+            new_mask_group_node.label = "Island ID Mask"
+
+            reindex_masks('ADDED_MASK', selected_layer_index, new_mask_slot_index)
+            organize_mask_nodes()
+            link_mask_nodes(selected_layer_index)
+
+            # Use the existing UV island ID map for the active object, or create one if it doesn't exist.
+            active_object = bpy.context.active_object
+            island_map_image = bpy.data.images.get(uv_rasterization.get_island_id_map_name(active_object.name))
+            if island_map_image == None:
+                island_map_image = uv_rasterization.create_island_id_map(active_object, tss.get_texture_width(), tss.get_texture_height())
+
+            texture_node = get_mask_node('TEXTURE', selected_layer_index, new_mask_slot_index)
+            if texture_node and island_map_image:
+                texture_node.image = island_map_image
+            debug_logging.log("Added UV island ID mask.")
+
         # Mesh maps masks.
         case _:
             mesh_map_mask_name = type.replace('_', ' ')
@@ -430,7 +380,8 @@ def add_layer_mask(type, self):
             reindex_masks('ADDED_MASK', selected_layer_index, new_mask_slot_index)
             organize_mask_nodes()
             link_mask_nodes(selected_layer_index)
-            material_layers.apply_mesh_maps()
+            material_layers.bind_mask_mesh_maps(active_material, selected_layer_index, new_mask_slot_index)
+            material_layers.update_mesh_map_node_group(active_material)
 
             # For world space normals mask, masking using the blue (z or up) channel is more frequently used
             # apply that as the default.
@@ -492,6 +443,7 @@ def delete_layer_mask(self):
         if mask_node.node_tree:
             bpy.data.node_groups.remove(mask_node.node_tree)
         active_material.node_tree.nodes.remove(mask_node)
+    material_layers.invalidate_layer_node_index("deleted layer mask")
 
     reindex_masks('DELETED_MASK', selected_layer_index, selected_mask_index)
     organize_mask_nodes()
@@ -508,86 +460,55 @@ def move_mask(direction, self):
     if bau.verify_material_operation_context(self) == False:
         return
 
+    # Masks are identified by their ID, so moving a mask only swaps the mask's position in the layer's mask order, mask nodes aren't renamed.
+    active_material = bpy.context.active_object.active_material
     masks = bpy.context.scene.rymat_masks
     selected_layer_index = bpy.context.scene.rymat_layer_stack.selected_layer_index
+    selected_mask_index = bpy.context.scene.rymat_mask_stack.selected_index
 
     match direction:
         case 'UP':
-            # Swap the mask node and node tree index for the selected mask node with the mask above it (if one exists).
-            selected_mask_index = bpy.context.scene.rymat_mask_stack.selected_index
-
             if selected_mask_index < len(masks) - 1:
-                mask_node = get_mask_node('MASK', selected_layer_index, selected_mask_index)
-                mask_node.name += "~"
-                mask_node.node_tree.name += "~"
-
-                above_mask_node = get_mask_node('MASK', selected_layer_index, selected_mask_index + 1)
-                above_mask_node.name = format_mask_name(selected_layer_index, selected_mask_index)
-                above_mask_node.node_tree.name = above_mask_node.name
-
-                mask_node.name = format_mask_name(selected_layer_index, selected_mask_index + 1)
-                mask_node.node_tree.name = mask_node.name
-
+                material_layers.swap_mask_ids(active_material, selected_layer_index, selected_mask_index, selected_mask_index + 1)
                 bpy.context.scene.rymat_mask_stack.selected_index = selected_mask_index + 1
-
                 debug_logging.log("Moved mask up on the mask stack.")
 
         case 'DOWN':
-            # Swap the mask node and node tree index for the selected mask node with the mask below it (if one exists).
-            selected_mask_index = bpy.context.scene.rymat_mask_stack.selected_index
-
             if selected_mask_index - 1 >= 0:
-                mask_node = get_mask_node('MASK', selected_layer_index, selected_mask_index)
-                mask_node.name += "~"
-                mask_node.node_tree.name += "~"
-
-                above_mask_node = get_mask_node('MASK', selected_layer_index, selected_mask_index - 1)
-                above_mask_node.name = format_mask_name(selected_layer_index, selected_mask_index)
-                above_mask_node.node_tree.name = above_mask_node.name
-
-                mask_node.name = format_mask_name(selected_layer_index, selected_mask_index - 1)
-                mask_node.node_tree.name = mask_node.name
-
+                material_layers.swap_mask_ids(active_material, selected_layer_index, selected_mask_index, selected_mask_index - 1)
                 bpy.context.scene.rymat_mask_stack.selected_index = selected_mask_index - 1
-
                 debug_logging.log("Moved mask down on the mask stack.")
 
+    material_layers.invalidate_layer_node_index("moved layer mask")
     organize_mask_nodes()
     link_mask_nodes(selected_layer_index)
     
 def reindex_masks(change_made, layer_index, affected_mask_index):
-    '''Reindexes mask nodes and node trees. This should be called after a change is made that effects the mask stack order (adding, duplicating, deleting a mask).'''
+    '''Updates the mask order of the layer at the provided index after a change is made that effects the mask stack (adding, duplicating, deleting a mask). Masks are identified by their ID, so existing mask nodes are never renamed.'''
+    active_material = bpy.context.active_object.active_material
     match change_made:
         case 'ADDED_MASK':
-            # Increase the layer index for all layer group nodes and their node trees that exist above the affected layer.
-            total_masks = len(bpy.context.scene.rymat_masks)
-            for i in range(total_masks, affected_mask_index, -1):
-                mask_node = get_mask_node('MASK', layer_index, i - 1)
-                if mask_node:
-                    mask_index = parse_mask_index(mask_node.name)
-                    mask_node_name = format_mask_name(layer_index, mask_index + 1)
-                    mask_node.name = mask_node_name
-                    mask_node.node_tree.name = mask_node_name
-
+            # Assign an ID to the new mask group node, and name it and its node tree using the layer and mask ID.
             new_mask_node = get_mask_node('MASK', layer_index, affected_mask_index, get_changed=True)
             if new_mask_node:
-                mask_node_name = format_mask_name(layer_index, affected_mask_index)
-                new_mask_node.name = mask_node_name
-                new_mask_node.node_tree.name = mask_node_name
+                mask_id = material_layers.insert_mask_id(active_material, layer_index, affected_mask_index, new_mask_node)
+                if mask_id != None:
+                    mask_node_name = format_mask_name(material_layers.get_layer_key(active_material, layer_index), mask_id)
+                    new_mask_node.name = mask_node_name
+                    new_mask_node.node_tree.name = mask_node_name
             debug_logging.log("Re-indexed masks for a new added / duplicated mask.")
 
         case 'DELETED_MASK':
-            # Reduce the layer index for all layer group nodes and their nodes trees that exist above the affected layer.
-            mask_count = len(bpy.context.scene.rymat_masks)
-            for i in range(affected_mask_index + 1, mask_count):
-                mask_node = get_mask_node('MASK', layer_index, i)
-                mask_index = parse_mask_index(mask_node.name)
-                mask_node.name = format_mask_name(layer_index, mask_index - 1)
-                mask_node.node_tree.name = mask_node.name
+            material_layers.remove_mask_id(active_material, layer_index, affected_mask_index)
             debug_logging.log("Re-indexed mask nodes for after a mask was deleted.")
 
+    material_layers.invalidate_layer_node_index()
+
 def organize_mask_nodes():
     '''Organizes the position of all mask nodes in the active materials node tree.'''
+    if material_layers.defer_layer_stack_update('ORGANIZE_MASKS'):
+        return
+
     layer_count = material_layers.count_layers()
     for i in range(0, layer_count):
         layer_node = material_layers.get_material_layer_node('LAYER', i)
@@ -609,6 +530,9 @@ def link_mask_nodes(layer_index):
     if not bpy.context.active_object.active_material:
         return
 
+    if material_layers.defer_layer_stack_update('LINK_MASKS', layer_index):
+        return
+
     active_material = bpy.context.active_object.active_material
     node_tree = active_material.node_tree
     mask_count = count_masks(layer_index)
@@ -840,6 +764,10 @@ def get_mask_crgba_channel():
         input_socket = filter_node.inputs[0]
         link = input_socket.links[0]
         output_channel = link.from_socket.name.upper()
+
+        # Mesh maps sampled through the shared mesh map node group are output by name, they output color.
+        if link.from_node.name == 'MESH_MAPS':
+            output_channel = 'COLOR'
     return output_channel
 
 def set_mask_crgba_channel(output_channel):
@@ -875,6 +803,10 @@ def set_mask_crgba_channel(output_channel):
         case 'WORLD_SPACE_NORMALS_MASK':
             output_node = get_mask_node('WORLD_SPACE_NORMALS', selected_layer_index, selected_mask_index)
 
+            # Masks that sample mesh maps through the material's shared mesh map node group output the mesh map from the group node.
+            if output_node == None:
+                output_node = get_mask_node('MESH_MAPS', selected_layer_index, selected_mask_index)
+
         case _:
             output_node = get_mask_node('TEXTURE', selected_layer_index, selected_mask_index)
     
@@ -882,28 +814,36 @@ def set_mask_crgba_channel(output_channel):
         debug_logging.log("Failed to find the main node outputting the mask value.")
         return
 
+    if output_node.name == 'MESH_MAPS':
+        color_output = output_node.outputs.get('WORLD_SPACE_NORMALS')
+        alpha_output = color_output
+    else:
+        color_output = output_node.outputs[0]
+        alpha_output = output_node.outputs[1]
+
     # Disconnect the mask nodes.
-    bau.unlink_node(output_node, mask_node.node_tree, unlink_inputs=False, unlink_outputs=True)
+    for link in list(color_output.links) + list(alpha_output.links):
+        mask_node.node_tree.links.remove(link)
     bau.unlink_node(separate_rgb_node, mask_node.node_tree, unlink_inputs=True, unlink_outputs=True)
 
     # Connect the specified channel to the mask filter.
     match output_channel:
         case 'COLOR':
-            mask_node.node_tree.links.new(output_node.outputs[0], filter_node.inputs[0])
+            mask_node.node_tree.links.new(color_output, filter_node.inputs[0])
 
         case 'ALPHA':
-            mask_node.node_tree.links.new(output_node.outputs[1], filter_node.inputs[0])
+            mask_node.node_tree.links.new(alpha_output, filter_node.inputs[0])
 
         case 'RED':
-            mask_node.node_tree.links.new(output_node.outputs[0], separate_rgb_node.inputs[0])
+            mask_node.node_tree.links.new(color_output, separate_rgb_node.inputs[0])
             mask_node.node_tree.links.new(separate_rgb_node.outputs[0], filter_node.inputs[0])
 
         case 'GREEN':
-            mask_node.node_tree.links.new(output_node.outputs[0], separate_rgb_node.inputs[0])
+            mask_node.node_tree.links.new(color_output, separate_rgb_node.inputs[0])
             mask_node.node_tree.links.new(separate_rgb_node.outputs[1], filter_node.inputs[0])
 
         case 'BLUE':
-            mask_node.node_tree.links.new(output_node.outputs[0], separate_rgb_node.inputs[0])
+            mask_node.node_tree.links.new(color_output, separate_rgb_node.inputs[0])
             mask_node.node_tree.links.new(separate_rgb_node.outputs[2], filter_node.inputs[0])
 
 
@@ -926,8 +866,7 @@ class RYMAT_UL_mask_list(bpy.types.UIList):
         self.use_filter_reverse = True
 
         if self.layout_type in {'DEFAULT', 'COMPACT'}:
-            masks = bpy.context.scene.rymat_masks
-            item_index = masks.find(item.name)
+            item_index = index
             selected_layer_index = bpy.context.scene.rymat_layer_stack.selected_layer_index
             mask_node = get_mask_node('MASK', selected_layer_index, item_index)
 
@@ -950,6 +889,15 @@ class RYMAT_UL_mask_list(bpy.types.UIList):
             operator = row.operator("rymat.isolate_mask", text="", icon='MOD_MASK', emboss=False)
             operator.mask_index = item_index
 
+            # Draw a toggle to freeze procedural masks to a texture.
+            active_material = bpy.context.active_object.active_material
+            if layer_freezing.is_mask_frozen(active_material, selected_layer_index, item_index):
+                operator = row.operator("rymat.unfreeze_mask", text="", icon='FREEZE', emboss=False, depress=True)
+                operator.mask_index = item_index
+            elif layer_freezing.is_mask_freezable(active_material, selected_layer_index, item_index):
+                operator = row.operator("rymat.freeze_mask", text="", icon='FREEZE', emboss=False)
+                operator.mask_index = item_index
+
             # Draw the mask name.
             if mask_node:
                 row.prop(mask_node, "label", text="", emboss=False)
@@ -1096,6 +1044,21 @@ class RYMAT_OT_add_curvature_mask(Operator):
         add_layer_mask('CURVATURE', self)
         return {'FINISHED'}
 
+class RYMAT_OT_add_island_id_mask(Operator):
+    bl_label = "Add Island ID Mask"
+    bl_idname = "rymat.add_island_id_mask"
+    bl_description = "Adds an image mask that will auto-fill the image with a UV island ID map for the active object, where each UV island is filled with a distinct color"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    # Disable when there is no active object.
+    @ classmethod
+    def poll(cls, context):
+        return context.active_object
+
+    def execute(self, context):
+        add_layer_mask('ISLAND_ID', self)
+        return {'FINISHED'}
+
 class RYMAT_OT_add_thickness_mask(Operator):
     bl_label = "Add Thickness Mask"
     bl_idname = "rymat.add_thickness_mask"
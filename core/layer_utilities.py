@@ -108,6 +108,13 @@ class RYMAT_OT_import_texture_set(Operator, ImportHelper):
         return bau.verify_addon_active_material(context)
 
     def execute(self, context):
+        # Organize and link nodes once, after all imported textures are added to the layer.
+        with material_layers.layer_stack_transaction(self):
+            self.import_texture_files(context)
+        return {'FINISHED'}
+
+    def import_texture_files(self, context):
+        '''Imports the selected texture files into the material channels of the selected layer.'''
         def split_filename_by_components(filename):
             '''Helper function to split the file name into components.'''
 
@@ -364,51 +371,53 @@ class RYMAT_OT_merge_materials(Operator):
                 return {'FINISHED'}
 
             else:
-                active_material = bpy.context.active_object.active_material
-                for i in range(0, layer_count):
+                # Organize and link layer and mask nodes once, after all layers from the merge material are added.
+                with material_layers.layer_stack_transaction(self):
+                    active_material = bpy.context.active_object.active_material
+                    for i in range(0, layer_count):
                     
-                    # Duplicate the layer node tree and add a new layer group node to the tree.
-                    merge_layer_node = merge_material.node_tree.nodes.get(str(i))
-                    if merge_layer_node:
-                        if merge_layer_node.node_tree:
-                            duplicated_node_tree = bau.duplicate_node_group(merge_layer_node.node_tree.name)
-                            if duplicated_node_tree:
-                                new_layer_slot_index = material_layers.add_material_layer_slot()
-
-                                duplicated_node_tree.name = "{0}_{1}".format(active_material.name, str(new_layer_slot_index))
-                                new_layer_group_node = active_material.node_tree.nodes.new('ShaderNodeGroup')
-                                new_layer_group_node.node_tree = duplicated_node_tree
-                                new_layer_group_node.name = str(new_layer_slot_index) + "~"
-                                new_layer_group_node.label = merge_layer_node.label
-                                
-                                material_layers.reindex_layer_nodes(change_made='ADDED_LAYER', affected_layer_index=new_layer_slot_index)
-                                material_layers.organize_layer_group_nodes()
-                                material_layers.link_layer_group_nodes(self)
-                                layer_masks.organize_mask_nodes()
-
-                        # Clear the mask stack from the new layer.
-                        masks = bpy.context.scene.rymat_masks
-                        masks.clear()
-
-                        # Duplicate all masks associated with that layer.
-                        mask_count = layer_masks.count_masks(i)
-                        for c in range(0, mask_count):
-                            original_mask_node = layer_masks.get_mask_node('MASK', i, c)
-                            if original_mask_node:
-                                duplicated_node_tree = bau.duplicate_node_group(original_mask_node.node_tree.name)
+                        # Duplicate the layer node tree and add a new layer group node to the tree.
+                        merge_layer_node = material_layers.find_material_layer_node(merge_material, 'LAYER', i)
+                        if merge_layer_node:
+                            if merge_layer_node.node_tree:
+                                duplicated_node_tree = bau.duplicate_node_group(merge_layer_node.node_tree.name)
                                 if duplicated_node_tree:
-                                    new_mask_slot_index = layer_masks.add_mask_slot()
-                                    duplicated_mask_name = layer_masks.format_mask_name(bpy.context.active_object.active_material.name, new_layer_slot_index, new_mask_slot_index) + "~"
-                                    duplicated_node_tree.name = duplicated_mask_name
-                                    new_mask_group_node = active_material.node_tree.nodes.new('ShaderNodeGroup')
-                                    new_mask_group_node.node_tree = duplicated_node_tree
-                                    new_mask_group_node.name = duplicated_mask_name
-                                    new_mask_group_node.label = original_mask_node.label
-
-                                    layer_masks.reindex_masks('ADDED_MASK', new_layer_slot_index, affected_mask_index=i)
-
-                        layer_masks.link_mask_nodes(new_layer_slot_index)
-                        layer_masks.organize_mask_nodes()
+                                    new_layer_slot_index = material_layers.add_material_layer_slot()
+
+                                    duplicated_node_tree.name = "{0}_{1}".format(active_material.name, str(new_layer_slot_index))
+                                    new_layer_group_node = active_material.node_tree.nodes.new('ShaderNodeGroup')
+                                    new_layer_group_node.node_tree = duplicated_node_tree
+                                    new_layer_group_node.name = str(new_layer_slot_index) + "~"
+                                    new_layer_group_node.label = merge_layer_node.label
+                                
+                                    material_layers.reindex_layer_nodes(change_made='ADDED_LAYER', affected_layer_index=new_layer_slot_index)
+                                    material_layers.organize_layer_group_nodes()
+                                    material_layers.link_layer_group_nodes(self)
+                                    layer_masks.organize_mask_nodes()
+
+                            # Clear the mask stack from the new layer.
+                            masks = bpy.context.scene.rymat_masks
+                            masks.clear()
+
+                            # Duplicate all masks associated with that layer.
+                            mask_count = layer_masks.count_masks(i)
+                            for c in range(0, mask_count):
+                                original_mask_node = layer_masks.get_mask_node('MASK', i, c)
+                                if original_mask_node:
+                                    duplicated_node_tree = bau.duplicate_node_group(original_mask_node.node_tree.name)
+                                    if duplicated_node_tree:
+                                        new_mask_slot_index = layer_masks.add_mask_slot()
+                                        duplicated_mask_name = layer_masks.format_mask_name(bpy.context.active_object.active_material.name, new_layer_slot_index, new_mask_slot_index) + "~"
+                                        duplicated_node_tree.name = duplicated_mask_name
+                                        new_mask_group_node = active_material.node_tree.nodes.new('ShaderNodeGroup')
+                                        new_mask_group_node.node_tree = duplicated_node_tree
+                                        new_mask_group_node.name = duplicated_mask_name
+                                        new_mask_group_node.label = original_mask_node.label
+
+                                        layer_masks.reindex_masks('ADDED_MASK', new_layer_slot_index, affected_mask_index=i)
+
+                            layer_masks.link_mask_nodes(new_layer_slot_index)
+                            layer_masks.organize_mask_nodes()
 
             bpy.context.scene.rymat_merge_material = None
             debug_logging.log_status("Merged materials.", self, type='INFO')
@@ -10,9 +10,14 @@ from ..core import blender_addon_utils as bau
 from ..core import debug_logging
 from ..core import texture_set_settings as tss
 from ..core import shaders
+from ..core import update_dispatcher
+from ..core import layer_freezing
 import copy
-import random
+import hashlib
+import math
+from contextlib import contextmanager
 import time
+import uuid
 
 TRIPLANAR_PROJECTION_INPUTS = [
     'X',
@@ -45,6 +50,79 @@ MIX_NODE_INPUT_INDEX = {
     'MIX': 7
 }
 
+# Names of nodes accessed with get_material_layer_node, defined as (node tree the node is in, node name format).
+# Nodes are in the material node tree ('MATERIAL'), or in the layer group node tree ('LAYER').
+# Node name formats can include the static material channel name ({channel}) and the node number ({number}).
+MATERIAL_LAYER_NODE_NAMES = {
+    'MATERIAL_OUTPUT': ('MATERIAL', 'MATERIAL_OUTPUT'),
+    'EXPORT_UV_MAP': ('MATERIAL', 'EXPORT_UV_MAP'),
+    'BLUR_NOISE': ('MATERIAL', 'BLUR_NOISE'),
+    'PROJECTION': ('LAYER', 'PROJECTION'),
+    'GROUP_INPUT': ('LAYER', 'GROUP_INPUT'),
+    'GROUP_OUTPUT': ('LAYER', 'GROUP_OUTPUT'),
+    'FIX_NORMAL_ROTATION': ('LAYER', 'FIX_NORMAL_ROTATION'),
+    'DECAL_COORDINATES': ('LAYER', 'DECAL_COORDINATES'),
+    'LINEAR_DECAL_MASK_BLEND': ('LAYER', 'LINEAR_DECAL_MASK_BLEND'),
+    'FRAME': ('LAYER', '{channel}'),
+    'VALUE': ('LAYER', '{channel}-VALUE-{number}'),
+    'TRIPLANAR_BLEND': ('LAYER', '{channel}-TRIPLANAR_BLEND'),
+    'MIX': ('LAYER', '{channel}-MIX'),
+    'MIX_REROUTE': ('LAYER', '{channel}-MIX_REROUTE'),
+    'MIX_IMAGE_ALPHA': ('LAYER', '{channel}-MIX_IMAGE_ALPHA'),
+    'OPACITY': ('LAYER', '{channel}-OPACITY'),
+    'IMAGE_ALPHA_REROUTE': ('LAYER', '{channel}-IMAGE_ALPHA_REROUTE'),
+    'FILTER': ('LAYER', '{channel}-FILTER'),
+    'SEPARATE_RGB': ('LAYER', '{channel}-SEPARATE_RGB'),
+    'BLUR': ('LAYER', '{channel}-BLUR')
+}
+
+# Size of the material used to benchmark layer node lookups.
+BENCHMARK_LAYER_COUNT = 50
+BENCHMARK_CHANNEL_COUNT = 12
+BENCHMARK_MATERIAL_NAME = "RY_LayerNodeLookupBenchmark"
+BENCHMARK_LOOKUP_REPEATS = 5
+
+# Material channel nodes looked up in each layer and material channel when benchmarking layer node lookups.
+BENCHMARK_LAYER_NODE_NAMES = ('VALUE', 'MIX', 'OPACITY', 'FILTER', 'BLUR')
+
+# Number of layers built with each method when benchmarking layer construction.
+BENCHMARK_CONSTRUCTION_REPEATS = 10
+BENCHMARK_LAYER_NODE_GROUP_NAME = "RY_LayerConstructionBenchmark"
+
+# Name format of template node groups new layers are copied from ({0} is the layer type), and the ID property storing the shader settings templates were built with.
+# Templates start with a period so Blender hides them from node group selection menus.
+LAYER_TEMPLATE_NAME = ".RY_LayerTemplate_{0}"
+LAYER_TEMPLATE_SIGNATURE_KEY = "rymat_template_signature"
+
+# Key of the ID property storing the layer count and ordered layer and mask IDs in materials created with this add-on.
+LAYER_STACK_METADATA_KEY = "rymat_layer_stack"
+
+# Key of the ID property storing the layer or mask ID in layer and mask group nodes, and the length of generated IDs.
+STACK_ID_PROPERTY = "rymat_id"
+STACK_ID_LENGTH = 8
+
+# Name format of the node group each material samples mesh maps through, all masks in the material that use mesh maps reference this node group.
+MESH_MAP_NODE_GROUP_NAME = "{0}_MeshMaps"
+
+# Key of the ID property marking materials whose masks all sample mesh maps through the material's shared mesh map node group.
+MESH_MAPS_BOUND_KEY = "rymat_mesh_maps_bound"
+
+# Node lookup index for each material, stored as (index generation, {key: node group}).
+# Python references to nodes aren't invalidated when nodes are removed, so only node groups (which raise a reference error when removed) are indexed,
+# nodes are then found by name within the indexed node group.
+_layer_node_index = {}
+_layer_node_index_generation = 0
+
+# Formatted layer node names, stored by (layer node name, channel name, node number).
+_layer_node_names = {}
+
+# Projection, image and interpolation of the first triplanar texture node when triplanar texture samples were last synced,
+# stored by (material name, layer key, material channel name or mask key).
+_synced_triplanar_sources = {}
+
+# Updates deferred until the active layer stack transaction is committed, None when no transaction is active.
+_layer_stack_transaction = None
+
 #----------------------------- UPDATING PROPERTIES -----------------------------#
 
 
@@ -56,9 +134,9 @@ def format_material_channel_node_name(material_channel_name, node_name, node_ind
     else:
         return "{0}-{1}".format(static_channel_name, node_name)
 
-def format_layer_group_node_name(material_name, layer_index):
-    '''Properly formats the layer group node names for this add-on.'''
-    return "{0}_{1}".format(material_name, layer_index)
+def format_layer_group_node_name(material_name, layer_key):
+    '''Properly formats the layer group node names for this add-on. Layer node trees are named using the layer's ID, or the layer's index for new layers that aren't added to the layer stack yet.'''
+    return "{0}_{1}".format(material_name, layer_key)
 
 def update_layer_index(self, context):
     '''Updates properties and user interface when a new layer is selected.'''
@@ -68,7 +146,8 @@ def update_layer_index(self, context):
     if active_object_attribute == None:
         return
     
-    layer_masks.refresh_mask_slots()
+    # Mask slots are refreshed once, after the selected layer stops changing (refreshing the layer stack can change the selected layer many times).
+    update_dispatcher.request_update('MASK_SLOTS', 'SELECTED_LAYER_CHANGED')
 
     # Select the image for texture painting.
     selected_layer_index = bpy.context.scene.rymat_layer_stack.selected_layer_index
@@ -93,10 +172,44 @@ def update_layer_index(self, context):
                         else:
                             decal_coordinates_node.object.hide_set(True)
 
+def triplanar_source_changed(sync_key, projection_node, source_node):
+    '''Returns true if the projection, image or interpolation of the provided source texture node changed since triplanar texture samples were last synced with it, and records the source node's current state.'''
+    image_name = ""
+    if source_node.image:
+        image_name = source_node.image.name
+    source_state = (projection_node.node_tree.name, image_name, source_node.interpolation)
+    if _synced_triplanar_sources.get(sync_key) == source_state:
+        return False
+    _synced_triplanar_sources[sync_key] = source_state
+    return True
+
+def clear_triplanar_sync_state():
+    '''Clears the recorded state of triplanar texture sample sources, so all triplanar texture samples are checked the next time they're synced.'''
+    _synced_triplanar_sources.clear()
+
+def sync_triplanar_samples(source_node, texture_sample_nodes):
+    '''Copies the image and interpolation of the source texture node to the provided texture sample nodes. Returns the number of nodes changed.'''
+    nodes_changed = 0
+    for texture_sample_node in texture_sample_nodes:
+        if not texture_sample_node:
+            continue
+
+        # Only write properties that differ, to avoid triggering shader re-compiling.
+        if texture_sample_node.image != source_node.image:
+            texture_sample_node.image = source_node.image
+            nodes_changed += 1
+        if texture_sample_node.interpolation != source_node.interpolation:
+            texture_sample_node.interpolation = source_node.interpolation
+            nodes_changed += 1
+    return nodes_changed
+
 def sync_triplanar_nodes():
-    '''Updates the image texture used in triplanar texture nodes to match the image being used in the first triplanar node.'''
-    # Sync triplanar texture samples for all material channels.
+    '''Updates the image texture used in triplanar texture nodes to match the image being used in the first triplanar node. Texture samples are only synced when the first triplanar node's image or interpolation changed since the last sync, so edits to other nodes don't check every texture sample.'''
+    active_material = bpy.context.active_object.active_material
     selected_layer_index = bpy.context.scene.rymat_layer_stack.selected_layer_index
+    layer_key = get_layer_key(active_material, selected_layer_index)
+
+    # Sync triplanar texture samples for all material channels.
     projection_node = get_material_layer_node('PROJECTION', selected_layer_index)
     if projection_node:
         if projection_node.node_tree.name == 'RY_TriplanarProjection' or projection_node.node_tree.name == 'RY_TriplanarHexGridProjection':
@@ -105,13 +218,10 @@ def sync_triplanar_nodes():
                 value_node = get_material_layer_node('VALUE', selected_layer_index, channel.name, node_number=1)
                 if value_node:
                     if value_node.bl_static_type == 'TEX_IMAGE':
-                        for i in range(2, 10):
-                            texture_sample_node = get_material_layer_node('VALUE', selected_layer_index, channel.name, node_number=i)
-                            if texture_sample_node:
-                                if texture_sample_node.image != value_node.image:
-                                    texture_sample_node.image = value_node.image
-                                if texture_sample_node.interpolation != value_node.interpolation:
-                                    texture_sample_node.interpolation = value_node.interpolation
+                        if triplanar_source_changed((active_material.name, layer_key, channel.name), projection_node, value_node):
+                            texture_sample_nodes = [get_material_layer_node('VALUE', selected_layer_index, channel.name, node_number=i) for i in range(2, 10)]
+                            nodes_changed = sync_triplanar_samples(value_node, texture_sample_nodes)
+                            debug_logging.log("Synced triplanar texture samples for {0}, {1} node properties changed.".format(channel.name, nodes_changed), sub_process=True)
 
     # Sync triplanar texture samples for masks.
     selected_mask_index = bpy.context.scene.rymat_mask_stack.selected_index
@@ -120,27 +230,18 @@ def sync_triplanar_nodes():
         if mask_projection_node.node_tree.name == 'RY_TriplanarProjection':
             texture_sample_1 = layer_masks.get_mask_node('TEXTURE', selected_layer_index, selected_mask_index, node_number=1)
             if texture_sample_1:
-                texture_sample_2 = layer_masks.get_mask_node('TEXTURE', selected_layer_index, selected_mask_index, node_number=2)
-                texture_sample_3 = layer_masks.get_mask_node('TEXTURE', selected_layer_index, selected_mask_index, node_number=3)
-
-                # Run additional checks to avoid accidentally triggering shader re-compiling by changing the image to the same image.
-                if texture_sample_2:
-                    if texture_sample_2.image != texture_sample_1.image:
-                        texture_sample_2.image = texture_sample_1.image
-
-                    if texture_sample_2.interpolation != texture_sample_1.interpolation:
-                        texture_sample_2.interpolation = texture_sample_1.interpolation
-
-                if texture_sample_3:
-                    if texture_sample_3.image != texture_sample_1.image:
-                        texture_sample_3.image = texture_sample_1.image
-
-                    if texture_sample_3.interpolation != texture_sample_1.interpolation:
-                        texture_sample_3.interpolation = texture_sample_1.interpolation
+                mask_key = get_mask_key(active_material, selected_layer_index, selected_mask_index)
+                if triplanar_source_changed((active_material.name, layer_key, mask_key), mask_projection_node, texture_sample_1):
+                    texture_sample_nodes = [layer_masks.get_mask_node('TEXTURE', selected_layer_index, selected_mask_index, node_number=i) for i in range(2, 4)]
+                    nodes_changed = sync_triplanar_samples(texture_sample_1, texture_sample_nodes)
+                    debug_logging.log("Synced triplanar mask texture samples, {0} node properties changed.".format(nodes_changed), sub_process=True)
 
 def shader_node_tree_update():
     '''Updates properties when the shader nodetree is changed.'''
 
+    # Node trees may have been edited outside of this add-on, re-index layer nodes the next time they're looked up.
+    invalidate_layer_node_index()
+
     # If the context isn't correct to edit materials, don't update any properties after a shader nodetree update.
     if bau.verify_material_operation_context(display_message=False) == False:
         return
@@ -148,18 +249,6 @@ def shader_node_tree_update():
     # Perform updates that should occur after a shader nodetree change is detected.
     sync_triplanar_nodes()
 
-def parse_layer_index(layer_group_node_name):
-    '''Return the layers's index by parsing the layer group node name. Returns -1 if there is no active object'''
-    active_object = bpy.context.active_object
-    if active_object:
-        active_material = active_object.active_material
-        if active_material:
-            material_name_length = len(active_material.name)
-            indicies = layer_group_node_name[material_name_length:]
-            indicies = indicies.split('_')
-            return int(indicies[1])
-    return -1
-
 def parse_material_name(layer_group_node_name):
     '''Returns the layer's associated material name by parsing the layer group node name. Returns -1 if there is no active object, or material.'''
     active_object = bpy.context.active_object
@@ -171,18 +260,106 @@ def parse_material_name(layer_group_node_name):
             return material_name
     return -1
 
+def invalidate_layer_node_index(reason=""):
+    '''Bumps the layer node index generation so layer and mask nodes are re-indexed the next time they are looked up. This should be called after structural edits to the layer stack such as adding, deleting, moving or renaming layer and mask nodes.'''
+    global _layer_node_index_generation
+    _layer_node_index_generation += 1
+    if reason != "":
+        debug_logging.log("Invalidated layer node index due to: {0}".format(reason), sub_process=True)
+
+def get_layer_node_index_generation():
+    '''Returns the layer node index generation, which changes whenever layer nodes need to be re-indexed.'''
+    return _layer_node_index_generation
+
+def get_layer_node_index(material):
+    '''Returns the node lookup index for the provided material, the index is cleared if it was built for a previous index generation.'''
+    node_index = _layer_node_index.get(material.name)
+    if node_index == None or node_index[0] != _layer_node_index_generation:
+        node_index = (_layer_node_index_generation, {})
+        _layer_node_index[material.name] = node_index
+    return node_index[1]
+
+def get_indexed_node_group(node_index, key, node_group_name_function, use_index=True):
+    '''Returns the node group stored in the node index with the provided key, finding it in Blender's data using the node group name returned by the provided function if it isn't indexed yet.'''
+    if use_index:
+        node_group = node_index.get(key)
+        if node_group != None:
+
+            # Node groups removed from Blender's data raise a reference error when accessed, re-index them.
+            try:
+                node_group.name
+                return node_group
+            except ReferenceError:
+                del node_index[key]
+
+    node_group = bpy.data.node_groups.get(node_group_name_function())
+    if node_group and use_index:
+        node_index[key] = node_group
+    return node_group
+
+def format_layer_node_name(layer_node_name, channel_name, node_number):
+    '''Returns the name of the specified layer node within its node tree, using the node name formats defined for layer nodes.'''
+    node_name_format = MATERIAL_LAYER_NODE_NAMES[layer_node_name][1]
+    return node_name_format.format(channel=bau.format_static_matchannel_name(channel_name), number=node_number)
+
+def get_layer_node_name(layer_node_name, channel_name, node_number, use_index=True):
+    '''Returns the name of the specified layer node, reusing previously formatted node names.'''
+    if not use_index:
+        return format_layer_node_name(layer_node_name, channel_name, node_number)
+
+    key = (layer_node_name, channel_name, node_number)
+    node_name = _layer_node_names.get(key)
+    if node_name == None:
+        node_name = format_layer_node_name(layer_node_name, channel_name, node_number)
+        _layer_node_names[key] = node_name
+    return node_name
+
 def get_layer_node_tree(layer_index):
     '''Returns the node group for the specified layer (from Blender data) if it exists'''
     
     if not bpy.context.active_object:
         return None
     
-    if not bpy.context.active_object.active_material:
+    active_material = bpy.context.active_object.active_material
+    if not active_material:
+        return None
+
+    return find_layer_node_tree(active_material, layer_index)
+
+def find_layer_node_tree(material, layer_index, get_changed=False, use_index=True):
+    '''Returns the node group for the specified layer in the provided material if it exists.'''
+    node_index = get_layer_node_index(material)
+    if get_changed:
+        return get_indexed_node_group(node_index, (layer_index, '~'), lambda: format_layer_group_node_name(material.name, layer_index) + "~", use_index)
+
+    layer_key = get_layer_key(material, layer_index)
+    if layer_key == None:
+        return None
+    return get_indexed_node_group(node_index, (layer_index,), lambda: format_layer_group_node_name(material.name, layer_key), use_index)
+
+def find_material_layer_node(material, layer_node_name, layer_index=0, channel_name='COLOR', node_number=1, get_changed=False, use_index=True):
+    '''Returns the desired layer node from the provided material if it exists. Nodes are found through the material's layer node index unless use_index is false.'''
+    if layer_node_name == 'LAYER':
+        if get_changed:
+            return material.node_tree.nodes.get(str(layer_index) + "~")
+        layer_key = get_layer_key(material, layer_index)
+        if layer_key == None:
+            return None
+        return material.node_tree.nodes.get(str(layer_key))
+
+    node_location = MATERIAL_LAYER_NODE_NAMES.get(layer_node_name)
+    if node_location == None:
+        debug_logging.log("Invalid material node name: {0}".format(layer_node_name))
         return None
-    
-    layer_group_name = format_layer_group_node_name(bpy.context.active_object.active_material.name, layer_index)
 
-    return bpy.data.node_groups.get(layer_group_name)
+    node_name = get_layer_node_name(layer_node_name, channel_name, node_number, use_index)
+    if node_location[0] == 'MATERIAL':
+        return material.node_tree.nodes.get(node_name)
+
+    node_tree = find_layer_node_tree(material, layer_index, use_index=use_index)
+    if node_tree:
+        return node_tree.nodes.get(node_name)
+    return None
 
 def get_material_layer_node(layer_node_name, layer_index=0, channel_name='COLOR', node_number=1, get_changed=False):
     '''Returns the desired material node if it exists. Supply the material channel name to get nodes specific to material channels.'''
@@ -203,141 +380,7 @@ def get_material_layer_node(layer_node_name, layer_index=0, channel_name='COLOR'
     if active_material == None:
         return
     
-    layer_group_node_name = format_layer_group_node_name(active_material.name, layer_index)
-    static_channel_name = bau.format_static_matchannel_name(channel_name)
-
-    # TODO: This should use a list lookup, instead of a match statement.
-    match layer_node_name:
-        case 'LAYER':
-            if get_changed:
-                return active_material.node_tree.nodes.get(str(layer_index) + "~")
-            else:
-                return active_material.node_tree.nodes.get(str(layer_index))
-        
-        case 'MATERIAL_OUTPUT':
-            return active_material.node_tree.nodes.get('MATERIAL_OUTPUT')
-        
-        case 'PROJECTION':
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get("PROJECTION")
-            return None
-
-        case 'GROUP_INPUT':
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get("GROUP_INPUT")
-            return None
-        
-        case 'GROUP_OUTPUT':
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get("GROUP_OUTPUT")
-            return None
-
-        case 'FRAME':
-            frame_name = static_channel_name
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get(frame_name)
-            return None
-
-        case 'VALUE':
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                node_name = format_material_channel_node_name(static_channel_name, "VALUE", node_number)
-                return node_tree.nodes.get(node_name)
-            return None
-
-        case 'TRIPLANAR_BLEND':
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                node_name = format_material_channel_node_name(static_channel_name, "TRIPLANAR_BLEND")
-                return node_tree.nodes.get(node_name)
-            return None
-
-        case 'FIX_NORMAL_ROTATION':
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get("FIX_NORMAL_ROTATION")
-            return None
-
-        case 'MIX':
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                node_name = format_material_channel_node_name(static_channel_name, "MIX")
-                return node_tree.nodes.get(node_name)
-            return None
-        
-        case 'MIX_REROUTE':
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                node_name = format_material_channel_node_name(static_channel_name, "MIX_REROUTE")
-                return node_tree.nodes.get(node_name)
-            return None
-
-        case 'MIX_IMAGE_ALPHA':
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                node_name = format_material_channel_node_name(static_channel_name, "MIX_IMAGE_ALPHA")
-                return node_tree.nodes.get(node_name)
-            return None  
-
-        case 'OPACITY':
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                node_name = format_material_channel_node_name(static_channel_name, 'OPACITY')
-                return node_tree.nodes.get(node_name)
-            return None
-        
-        case 'IMAGE_ALPHA_REROUTE':
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                node_name = format_material_channel_node_name(static_channel_name, 'IMAGE_ALPHA_REROUTE')
-                return node_tree.nodes.get(node_name)
-        
-        case 'FILTER':
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                node_name = format_material_channel_node_name(static_channel_name, 'FILTER')
-                return node_tree.nodes.get(node_name)
-            return None
-
-        case 'DECAL_COORDINATES':
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('DECAL_COORDINATES')
-            return None
-        
-        case 'LINEAR_DECAL_MASK_BLEND':
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('LINEAR_DECAL_MASK_BLEND')
-            return None
-        
-        case 'SEPARATE_RGB':
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                node_name = format_material_channel_node_name(static_channel_name, "SEPARATE_RGB")
-                return node_tree.nodes.get(node_name)
-            return None
-        
-        case 'EXPORT_UV_MAP':
-            return active_material.node_tree.nodes.get('EXPORT_UV_MAP')
-
-        case 'BLUR':
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                node_name = format_material_channel_node_name(static_channel_name, 'BLUR')
-                return node_tree.nodes.get(node_name)
-            return None
-
-        case 'BLUR_NOISE':
-            return active_material.node_tree.nodes.get('BLUR_NOISE')
-
-        case _:
-            debug_logging.log("Invalid material node name: {0}".format(layer_node_name))
-            return None
+    return find_material_layer_node(active_material, layer_node_name, layer_index, channel_name, node_number, get_changed)
 
 def get_isolate_node():
     '''Returns a node designed to isolate materials (Emission). If the node doesn't exist already within the active material node tree, a new isolate node will be created.'''
@@ -385,14 +428,7 @@ def add_material_layer_slot():
     layers = bpy.context.scene.rymat_layers
     layer_stack = bpy.context.scene.rymat_layer_stack
 
-    layer_slot = layers.add()
-
-    # Assign a random, unique number to the layer slot. 
-    # This allows the layer slot array index to be found using the name of the layer slot as a key.
-    unique_random_slot_id = str(random.randrange(0, 999999))
-    while layers.find(unique_random_slot_id) != -1:
-        unique_random_slot_id = str(random.randrange(0, 999999))
-    layer_slot.name = unique_random_slot_id
+    layers.add()
 
     # If there is no layer selected, move the layer to the top of the stack.
     if bpy.context.scene.rymat_layer_stack.selected_layer_index < 0:
@@ -410,8 +446,16 @@ def add_material_layer_slot():
         layer_stack.layer_index = move_to_index
         bpy.context.scene.rymat_layer_stack.selected_layer_index = max(0, min(bpy.context.scene.rymat_layer_stack.selected_layer_index + 1, len(layers) - 1))
 
+    sync_layer_slot_names(layers, move_to_index)
     return bpy.context.scene.rymat_layer_stack.selected_layer_index
 
+def sync_layer_slot_names(layers, start_index=0):
+    '''Names layer slots using their index in the layer stack, starting from the provided slot index. Slot names are deterministic, so refreshing the layer stack doesn't need to search for unused random names.'''
+    for i in range(start_index, len(layers)):
+        slot_name = str(i)
+        if layers[i].name != slot_name:
+            layers[i].name = slot_name
+
 def create_default_material_setup():
     '''Creates a default material setup using the selected shader group node defined in the add-on shader tab.'''
 
@@ -671,15 +715,12 @@ def organize_material_channel_frames(node_tree):
             frame.location[1] = frame_y
             frame_y -= frame_spacing
 
-def create_new_layer_node(layer_type):
-    '''Creates a new layer group node, with a default setup based on the defined shader material channels.'''
-
-    # Create a default node group for the layer, if one exists already, delete it.
-    new_layer_node_name = "NewLayerNode"
-    new_node_group = bpy.data.node_groups.get(new_layer_node_name)
+def build_layer_node_group(node_group_name, layer_type):
+    '''Builds a layer node group node by node, with a default setup based on the defined shader material channels. If a node group with the provided name exists already, it's replaced.'''
+    new_node_group = bpy.data.node_groups.get(node_group_name)
     if new_node_group:
         bpy.data.node_groups.remove(new_node_group)
-    new_node_group = bpy.data.node_groups.new(new_layer_node_name, type='ShaderNodeTree')
+    new_node_group = bpy.data.node_groups.new(node_group_name, type='ShaderNodeTree')
 
     # Add inputs and outputs to the group node for all shader channels.
     shader_info = bpy.context.scene.rymat_shader_info
@@ -795,6 +836,63 @@ def create_new_layer_node(layer_type):
 
     return new_node_group
 
+def get_layer_template_signature(layer_type):
+    '''Returns a hash of the shader material channel settings layers of the provided type are built from, layer templates built with a different signature are out of date.'''
+    shader_info = bpy.context.scene.rymat_shader_info
+    template_settings = [layer_type, shader_info.shader_node_group.name if shader_info.shader_node_group else ""]
+    for channel in shader_info.material_channels:
+        template_settings.append((
+            channel.name,
+            channel.default_active,
+            channel.socket_type,
+            channel.socket_subtype,
+            round(channel.socket_float_default, 6),
+            round(channel.socket_float_min, 6),
+            round(channel.socket_float_max, 6),
+            tuple(round(value, 6) for value in channel.socket_color_default),
+            tuple(round(value, 6) for value in channel.socket_vector_default),
+            channel.default_blend_mode
+        ))
+    template_hash = hashlib.sha1()
+    template_hash.update(repr(template_settings).encode('utf-8'))
+    return template_hash.hexdigest()
+
+def get_layer_template(layer_type):
+    '''Returns the template node group new layers of the provided type are copied from. Templates are built once and re-used until shader material channels change, or node groups they use are removed.'''
+    template_name = LAYER_TEMPLATE_NAME.format(layer_type)
+    template_signature = get_layer_template_signature(layer_type)
+    layer_template = bpy.data.node_groups.get(template_name)
+    if layer_template:
+        missing_node_groups = any(node.bl_static_type == 'GROUP' and node.node_tree == None for node in layer_template.nodes)
+        if layer_template.get(LAYER_TEMPLATE_SIGNATURE_KEY) == template_signature and not missing_node_groups:
+            return layer_template
+
+    layer_template = build_layer_node_group(template_name, layer_type)
+    layer_template[LAYER_TEMPLATE_SIGNATURE_KEY] = template_signature
+    debug_logging.log("Built {0} layer template with {1} nodes.".format(layer_type.lower(), len(layer_template.nodes)), sub_process=True)
+    return layer_template
+
+def remove_layer_templates():
+    '''Removes all layer template node groups, they're rebuilt the next time a layer is added.'''
+    for layer_template in [node_group for node_group in bpy.data.node_groups if node_group.name.startswith(LAYER_TEMPLATE_NAME.format(""))]:
+        bpy.data.node_groups.remove(layer_template)
+
+def create_new_layer_node(layer_type):
+    '''Creates a new layer group node, with a default setup based on the defined shader material channels, by copying the layer template for the layer type.'''
+
+    # Remove the default node group for the layer if one exists already.
+    new_layer_node_name = "NewLayerNode"
+    new_node_group = bpy.data.node_groups.get(new_layer_node_name)
+    if new_node_group:
+        bpy.data.node_groups.remove(new_node_group)
+
+    # Copying a template node group creates all layer nodes at once, which is much faster than creating them one at a time through Python.
+    new_node_group = get_layer_template(layer_type).copy()
+    new_node_group.name = new_layer_node_name
+    if LAYER_TEMPLATE_SIGNATURE_KEY in new_node_group:
+        del new_node_group[LAYER_TEMPLATE_SIGNATURE_KEY]
+    return new_node_group
+
 def add_material_layer(layer_type, self):
     '''Adds a material layer to the active materials layer stack.'''
 
@@ -954,78 +1052,80 @@ def duplicate_layer(original_layer_index, self):
     if bau.verify_material_operation_context(self) == False:
         return
     
-    duplicated_decal_object = None
-
-    # Duplicate the node tree and add it to the layer stack.
-    layer_node_tree = get_layer_node_tree(original_layer_index)
-    if not layer_node_tree:
-        debug_logging.log("No layer node tree, can't duplicate layer.")
-        return
+    # Organize and link layer and mask nodes once, after the layer and all of its masks are duplicated.
+    with layer_stack_transaction(self):
+        duplicated_decal_object = None
+
+        # Duplicate the node tree and add it to the layer stack.
+        layer_node_tree = get_layer_node_tree(original_layer_index)
+        if not layer_node_tree:
+            debug_logging.log("No layer node tree, can't duplicate layer.")
+            return
 
-    duplicated_node_tree = bau.duplicate_node_group(layer_node_tree.name)
-    if duplicated_node_tree:
-        active_material = bpy.context.active_object.active_material
+        duplicated_node_tree = bau.duplicate_node_group(layer_node_tree.name)
+        if duplicated_node_tree:
+            active_material = bpy.context.active_object.active_material
 
-        new_layer_slot_index = add_material_layer_slot()
+            new_layer_slot_index = add_material_layer_slot()
 
-        duplicated_node_tree.name = "{0}_{1}".format(active_material.name, str(new_layer_slot_index))
-        new_layer_group_node = active_material.node_tree.nodes.new('ShaderNodeGroup')
-        new_layer_group_node.node_tree = duplicated_node_tree
-        new_layer_group_node.name = str(new_layer_slot_index) + "~"
+            duplicated_node_tree.name = "{0}_{1}".format(active_material.name, str(new_layer_slot_index))
+            new_layer_group_node = active_material.node_tree.nodes.new('ShaderNodeGroup')
+            new_layer_group_node.node_tree = duplicated_node_tree
+            new_layer_group_node.name = str(new_layer_slot_index) + "~"
 
-        # Copy the name of the original layer.
-        original_layer_node = get_material_layer_node('LAYER', original_layer_index)
-        new_layer_group_node.label = original_layer_node.label + " Copy"
+            # Copy the name of the original layer.
+            original_layer_node = get_material_layer_node('LAYER', original_layer_index)
+            new_layer_group_node.label = original_layer_node.label + " Copy"
         
-        reindex_layer_nodes(change_made='ADDED_LAYER', affected_layer_index=new_layer_slot_index)
-        organize_layer_group_nodes()
-        link_layer_group_nodes(self)
-        layer_masks.organize_mask_nodes()
+            reindex_layer_nodes(change_made='ADDED_LAYER', affected_layer_index=new_layer_slot_index)
+            organize_layer_group_nodes()
+            link_layer_group_nodes(self)
+            layer_masks.organize_mask_nodes()
 
-        # Link blurring for the duplicated layer.
-        link_material_channel_noise_blur(active_material.node_tree, new_layer_group_node)
-
-        # Duplicate decal objects if the original layer was a decal layer.
-        decal_coordinate_node = get_material_layer_node('DECAL_COORDINATES', original_layer_index)
-        if decal_coordinate_node:
-            decal_object = decal_coordinate_node.object
-            if decal_object:
-                duplicated_decal_object = bau.duplicate_object(decal_object)
-                new_decal_coordinate_node = get_material_layer_node('DECAL_COORDINATES', new_layer_slot_index)
-                if new_decal_coordinate_node:
-                    new_decal_coordinate_node.object = duplicated_decal_object
-
-    # Clear the mask stack from the new layer.
-    masks = bpy.context.scene.rymat_masks
-    masks.clear()
-
-    # Duplicate mask node trees and add them as group nodes to the active material.
-    mask_count = layer_masks.count_masks(original_layer_index)
-    for i in range(0, mask_count):
-        original_mask_node = layer_masks.get_mask_node('MASK', original_layer_index, i)
-        if original_mask_node:
-            duplicated_node_tree = bau.duplicate_node_group(original_mask_node.node_tree.name)
-            if duplicated_node_tree:
-                new_mask_slot_index = layer_masks.add_mask_slot()
-                duplicated_mask_name = layer_masks.format_mask_name(new_layer_slot_index, new_mask_slot_index, bpy.context.active_object.active_material.name) + "~"
-                duplicated_node_tree.name = duplicated_mask_name
-                new_mask_group_node = active_material.node_tree.nodes.new('ShaderNodeGroup')
-                new_mask_group_node.node_tree = duplicated_node_tree
-                new_mask_group_node.name = duplicated_mask_name
-                new_mask_group_node.label = original_mask_node.label
-
-                layer_masks.reindex_masks('ADDED_MASK', new_layer_slot_index, affected_mask_index=i)
-
-                if duplicated_decal_object:
-                    decal_coordinate_node = layer_masks.get_mask_node('DECAL_COORDINATES', new_layer_slot_index, new_mask_slot_index)
-                    if decal_coordinate_node:
-                        decal_coordinate_node.object = duplicated_decal_object
+            # Link blurring for the duplicated layer.
+            link_material_channel_noise_blur(active_material.node_tree, new_layer_group_node)
+
+            # Duplicate decal objects if the original layer was a decal layer.
+            decal_coordinate_node = get_material_layer_node('DECAL_COORDINATES', original_layer_index)
+            if decal_coordinate_node:
+                decal_object = decal_coordinate_node.object
+                if decal_object:
+                    duplicated_decal_object = bau.duplicate_object(decal_object)
+                    new_decal_coordinate_node = get_material_layer_node('DECAL_COORDINATES', new_layer_slot_index)
+                    if new_decal_coordinate_node:
+                        new_decal_coordinate_node.object = duplicated_decal_object
+
+        # Clear the mask stack from the new layer.
+        masks = bpy.context.scene.rymat_masks
+        masks.clear()
+
+        # Duplicate mask node trees and add them as group nodes to the active material.
+        mask_count = layer_masks.count_masks(original_layer_index)
+        for i in range(0, mask_count):
+            original_mask_node = layer_masks.get_mask_node('MASK', original_layer_index, i)
+            if original_mask_node:
+                duplicated_node_tree = bau.duplicate_node_group(original_mask_node.node_tree.name)
+                if duplicated_node_tree:
+                    new_mask_slot_index = layer_masks.add_mask_slot()
+                    duplicated_mask_name = layer_masks.format_mask_name(new_layer_slot_index, new_mask_slot_index, bpy.context.active_object.active_material.name) + "~"
+                    duplicated_node_tree.name = duplicated_mask_name
+                    new_mask_group_node = active_material.node_tree.nodes.new('ShaderNodeGroup')
+                    new_mask_group_node.node_tree = duplicated_node_tree
+                    new_mask_group_node.name = duplicated_mask_name
+                    new_mask_group_node.label = original_mask_node.label
+
+                    layer_masks.reindex_masks('ADDED_MASK', new_layer_slot_index, affected_mask_index=i)
+
+                    if duplicated_decal_object:
+                        decal_coordinate_node = layer_masks.get_mask_node('DECAL_COORDINATES', new_layer_slot_index, new_mask_slot_index)
+                        if decal_coordinate_node:
+                            decal_coordinate_node.object = duplicated_decal_object
                         
-    layer_masks.link_mask_nodes(new_layer_slot_index)
-    layer_masks.organize_mask_nodes()
+        layer_masks.link_mask_nodes(new_layer_slot_index)
+        layer_masks.organize_mask_nodes()
 
-    # Log this operation completion for debugging purposes.
-    debug_logging.log("Duplicated material layer.")
+        # Log this operation completion for debugging purposes.
+        debug_logging.log("Duplicated material layer.")
 
 def delete_layer(self):
     '''Deletes the selected layer'''
@@ -1060,6 +1160,7 @@ def delete_layer(self):
     layer_group_node = get_material_layer_node('LAYER', selected_layer_index)
     if layer_group_node:
         active_material.node_tree.nodes.remove(layer_group_node)
+    invalidate_layer_node_index("deleted material layer")
 
     reindex_layer_nodes(change_made='DELETED_LAYER', affected_layer_index=selected_layer_index)
     organize_layer_group_nodes()
@@ -1077,98 +1178,30 @@ def move_layer(direction, self):
     if bau.verify_material_operation_context(self) == False:
         return
     
+    # Layers are identified by their ID, so moving a layer only swaps the layer's position in the layer stack order, layer and mask nodes aren't renamed.
+    active_material = bpy.context.active_object.active_material
+    layers = bpy.context.scene.rymat_layers
+    selected_layer_index = bpy.context.scene.rymat_layer_stack.selected_layer_index
     match direction:
         case 'UP':
-            # Swap the layer index for all layer nodes in this layer with the layer above it (if one exists).
-            layers = bpy.context.scene.rymat_layers
-            layer_count = len(layers)
-            selected_layer_index = bpy.context.scene.rymat_layer_stack.selected_layer_index
-            if not selected_layer_index < layer_count - 1:
+            if not selected_layer_index < len(layers) - 1:
                 debug_logging.log_status("Can't move layer up. No layers exist above the selected layer.", self, type='INFO')
                 return
-            
-            layer_node = get_material_layer_node('LAYER', selected_layer_index)
-            if layer_node:
-                layer_node.name += "~"
-                if layer_node.node_tree:
-                    layer_node.node_tree.name += "~"
-
-            above_layer_node = get_material_layer_node('LAYER', selected_layer_index + 1)
-            if above_layer_node:
-                above_layer_node.name = str(selected_layer_index)
-                if above_layer_node.node_tree:
-                    material_name = parse_material_name(above_layer_node.node_tree.name)
-                    above_layer_node.node_tree.name = format_layer_group_node_name(material_name, selected_layer_index)
-
-            layer_node.name = str(selected_layer_index + 1)
-            material_name = parse_material_name(layer_node.node_tree.name)
-            layer_node.node_tree.name = format_layer_group_node_name(material_name, selected_layer_index + 1)
-
-            # Swap the layer index for all mask nodes in this layer with the layer above it.
-            selected_layer_mask_count = layer_masks.count_masks(selected_layer_index)
-            for i in range(0, selected_layer_mask_count):
-                mask_node = layer_masks.get_mask_node('MASK', selected_layer_index, i)
-                mask_node.name += "~"
-                mask_node.node_tree.name = mask_node.name
-
-            above_layer_mask_count = layer_masks.count_masks(selected_layer_index + 1)
-            for i in range(0, above_layer_mask_count):
-                mask_node = layer_masks.get_mask_node('MASK', selected_layer_index + 1, i)
-                mask_node.name = layer_masks.format_mask_name(selected_layer_index, i)
-                mask_node.node_tree.name = mask_node.name
-
-            for i in range(0, selected_layer_mask_count):
-                mask_node = layer_masks.get_mask_node('MASK', selected_layer_index, i, get_changed=True)
-                mask_node.name = layer_masks.format_mask_name(selected_layer_index + 1, i)
-                mask_node.node_tree.name = mask_node.name
-
+            swap_layer_ids(active_material, selected_layer_index, selected_layer_index + 1)
             bpy.context.scene.rymat_layer_stack.selected_layer_index = selected_layer_index + 1
 
         case 'DOWN':
-            # Swap the layer index for all nodes in this layer with the layer below it (if one exists).
-            layers = bpy.context.scene.rymat_layers
-            selected_layer_index = bpy.context.scene.rymat_layer_stack.selected_layer_index
             if not selected_layer_index - 1 >= 0:
                 debug_logging.log_status("Can't move layer down. No layers exist below the selected layer.", self, type='INFO')
                 return
-            
-            layer_node = get_material_layer_node('LAYER', selected_layer_index)
-            layer_node.name += "~"
-            layer_node.node_tree.name += "~"
-
-            below_layer_node = get_material_layer_node('LAYER', selected_layer_index - 1)
-            below_layer_node.name = str(selected_layer_index)
-            material_name = parse_material_name(below_layer_node.node_tree.name)
-            below_layer_node.node_tree.name = format_layer_group_node_name(material_name, selected_layer_index)
-
-            layer_node.name = str(selected_layer_index - 1)
-            material_name = parse_material_name(layer_node.node_tree.name)
-            layer_node.node_tree.name = format_layer_group_node_name(material_name, selected_layer_index - 1)
-
-            # Swap the layer index for all mask nodes in this layer with the layer below it.
-            selected_layer_mask_count = layer_masks.count_masks(selected_layer_index)
-            for i in range(0, selected_layer_mask_count):
-                mask_node = layer_masks.get_mask_node('MASK', selected_layer_index, i)
-                mask_node.name += "~"
-                mask_node.node_tree.name = mask_node.name
-
-            below_layer_mask_count = layer_masks.count_masks(selected_layer_index - 1)
-            for i in range(0, below_layer_mask_count):
-                mask_node = layer_masks.get_mask_node('MASK', selected_layer_index - 1, i)
-                mask_node.name = layer_masks.format_mask_name(selected_layer_index, i)
-                mask_node.node_tree.name = mask_node.name
-
-            for i in range(0, selected_layer_mask_count):
-                mask_node = layer_masks.get_mask_node('MASK', selected_layer_index, i, get_changed=True)
-                mask_node.name = layer_masks.format_mask_name(selected_layer_index - 1, i)
-                mask_node.node_tree.name = mask_node.name
-
+            swap_layer_ids(active_material, selected_layer_index, selected_layer_index - 1)
             bpy.context.scene.rymat_layer_stack.selected_layer_index = selected_layer_index - 1
 
         case _:
             debug_logging.log_status("Invalid direction provided for moving a material layer.", self, 'ERROR')
             return
 
+    invalidate_layer_node_index("moved material layer")
     organize_layer_group_nodes()
     link_layer_group_nodes(self)
     layer_masks.organize_mask_nodes()
@@ -1176,17 +1209,10 @@ def move_layer(direction, self):
     debug_logging.log("Moved material layer.")
 
 def count_layers(material=None):
-    '''Counts the total layers in the specified material (active material if no material is specified) by reading the active material's node tree.'''
-    layer_count = 0
+    '''Returns the total layers in the specified material (active material if no material is specified), read from the layer stack metadata stored in the material.'''
 
-    # Count the number of layers in the specified material.
-    if material != None:
-        while material.node_tree.nodes.get(str(layer_count)):
-            layer_count += 1
-        return layer_count
-    
     # Count the number of layers in the active material.
-    else:
+    if material == None:
         active_object_attribute = getattr(bpy.context, "active_object", None)
         if active_object_attribute == None:
             return 0
@@ -1195,24 +1221,34 @@ def count_layers(material=None):
         if not bpy.context.active_object.active_material:
             return 0
 
-        active_material = bpy.context.active_object.active_material
-        if active_material.use_nodes == False:
+        material = bpy.context.active_object.active_material
+        if material.use_nodes == False:
             return 0
-        
-        while active_material.node_tree.nodes.get(str(layer_count)):
-            layer_count += 1
-        
-        return layer_count
+
+    layer_stack_metadata = get_layer_stack_metadata(material)
+    if layer_stack_metadata == None:
+        return count_node_tree_layers(material)
+    return layer_stack_metadata['layer_count']
+
+def count_node_tree_layers(material):
+    '''Counts the total layers in the specified material by searching the material's node tree for layer group nodes.'''
+    layer_count = 0
+    while material.node_tree.nodes.get(str(layer_count)):
+        layer_count += 1
+    return layer_count
 
 def organize_layer_group_nodes():
     '''Organizes all layer group nodes in the active material to ensure the node tree is easy to read.'''
+    if defer_layer_stack_update('ORGANIZE_LAYERS'):
+        return
+
     active_material = bpy.context.active_object.active_material
 
     # Organize layer group nodes.
     layer_count = count_layers()
     position_x = -500
     for i in range(layer_count, 0, -1):
-        layer_group_node = active_material.node_tree.nodes.get(str(i - 1))
+        layer_group_node = get_material_layer_node('LAYER', i - 1)
         if layer_group_node:
             layer_group_node.width = 300
             layer_group_node.location = (position_x, 0)
@@ -1222,7 +1258,7 @@ def organize_layer_group_nodes():
     blur_noise = get_material_layer_node('BLUR_NOISE')
     if blur_noise:
         blur_node_y = 0
-        layer_node = active_material.node_tree.nodes.get('0')
+        layer_node = get_material_layer_node('LAYER', 0)
         if layer_node:
             blur_node_y = layer_node.height * -6
         blur_noise.location = (position_x, 0 + blur_node_y)
@@ -1230,36 +1266,60 @@ def organize_layer_group_nodes():
     debug_logging.log("Organized layer group nodes.")
 
 def refresh_layer_stack(reason="", scene=None):
-    '''Clears, and then reads the active material, to sync the number of layers in the user interface with the number of layers that exist within the material node tree.'''
+    '''Reads the active material, to sync the number of layers in the user interface with the number of layers that exist within the material node tree. Only the difference in layer slots is added or removed.'''
     if scene:
         layers = scene.rymat_layers
     else:
         layers = bpy.context.scene.rymat_layers
     
-    # Clear all layers.
-    layers.clear()
-
     # Do not add material slots if there is no active object.
+    layer_count = 0
     if bpy.context.active_object != None:
 
-        # Add a material slot for each material layer detected in the active material.
+        # Repair layer stack metadata if it doesn't match layers in the active material's node tree.
+        active_material = bpy.context.active_object.active_material
+        if active_material and bau.verify_addon_material(active_material):
+            validate_layer_stack_metadata(active_material)
         layer_count = count_layers()
-        for layer in range(0, layer_count):
-            add_material_layer_slot()
 
-        # Reset the layer index if it's out of range.
-        selected_layer_index = bpy.context.scene.rymat_layer_stack.selected_layer_index
-        if selected_layer_index > len(layers) - 1 or selected_layer_index < 0:
-            bpy.context.scene.rymat_layer_stack.selected_layer_index = 0
+    # Add or remove layer slots so there is a layer slot for each material layer detected in the active material.
+    # Layer slots hold no layer data, so existing slots can be kept for any layer.
+    while len(layers) > layer_count:
+        layers.remove(len(layers) - 1)
+    while len(layers) < layer_count:
+        layers.add()
+    sync_layer_slot_names(layers)
+
+    # Select the top layer (setting the selected layer also refreshes mask slots for the selected layer).
+    if bpy.context.active_object != None:
+        bpy.context.scene.rymat_layer_stack.selected_layer_index = max(0, layer_count - 1)
 
     if reason != "":
         debug_logging.log("Refreshed layer stack due to: " + reason, sub_process=True)
 
+def get_layer_chain_links(layer_nodes, shader_node, material_channels):
+    '''Returns the links required to connect the provided (ordered) layer nodes together, and the last active layer node to the shader node, as a set of (output node name, output name, input node name, input name).'''
+    chain_links = set()
+
+    # Only active (non-muted) layer nodes are linked, inactive layer nodes are skipped over.
+    active_layer_nodes = [layer_node for layer_node in layer_nodes if bau.get_node_active(layer_node)]
+    if shader_node:
+        active_layer_nodes.append(shader_node)
+
+    for layer_node, next_layer_node in zip(active_layer_nodes, active_layer_nodes[1:]):
+        for channel in material_channels:
+            if layer_node.outputs.get(channel.name) and next_layer_node.inputs.get(channel.name):
+                chain_links.add((layer_node.name, channel.name, next_layer_node.name, channel.name))
+    return chain_links
+
 def link_layer_group_nodes(self):
-    '''Connects all layer group nodes to other existing group nodes, and the principled BSDF shader.'''
+    '''Connects all layer group nodes to other existing group nodes, and the principled BSDF shader. Only links that differ from the existing layer chain are removed or added, which avoids re-compiling shaders for layers that didn't change. Returns the number of links changed.'''
 
     if bau.verify_material_operation_context(self) == False:
-        return
+        return 0
+
+    if defer_layer_stack_update('LINK_LAYERS', operator=self):
+        return 0
 
     shader_info = bpy.context.scene.rymat_shader_info
     active_material = bpy.context.active_object.active_material
@@ -1268,60 +1328,51 @@ def link_layer_group_nodes(self):
     # Don't attempt to link layer group nodes if there are no layers.
     layer_count = count_layers()
     if layer_count <= 0:
-        return
-
-    # Disconnect all layer group nodes (don't disconnect masks).
-    for i in range(0, layer_count):
-        layer_node = get_material_layer_node('LAYER', i)
-        if layer_node:
-            for input in layer_node.inputs:
-                if input.name != 'Layer Mask' and input.name != 'Blur Noise':
-                    for link in input.links:
-                        node_tree.links.remove(link)
-            for output in layer_node.outputs:
-                for link in output.links:
-                    node_tree.links.remove(link)
-
-    # Re-connect all (non-muted / active) layer group nodes.
-    for i in range(0, layer_count):
-        layer_node = get_material_layer_node('LAYER', i)
-        if bau.get_node_active(layer_node):
-            next_layer_index = i + 1
-            next_layer_node = get_material_layer_node('LAYER', next_layer_index)
-            if next_layer_node:
-                while not bau.get_node_active(next_layer_node) and next_layer_index <= layer_count - 1:
-                    next_layer_index += 1
-                    next_layer_node = get_material_layer_node('LAYER', next_layer_index)
-
-            if next_layer_node:
-                if bau.get_node_active(next_layer_node):
-                    for channel in shader_info.material_channels:
-                        output_socket = layer_node.outputs.get(channel.name)
-                        input_socket = next_layer_node.inputs.get(channel.name)
-                        if output_socket and input_socket:
-                            node_tree.links.new(output_socket, input_socket)
-
-    # Connect the last (non-muted / active) layer node to the principled BSDF.
-    shader_node = active_material.node_tree.nodes.get('SHADER_NODE')
-
-    last_layer_node_index = layer_count - 1
-    last_layer_node = get_material_layer_node('LAYER', last_layer_node_index)
-    if last_layer_node:
-        while not bau.get_node_active(last_layer_node) and last_layer_node_index >= 0:
-            last_layer_node = get_material_layer_node('LAYER', last_layer_node_index)
-            last_layer_node_index -= 1
-
-    if last_layer_node:
-        if bau.get_node_active(last_layer_node):
-            
-            for channel in shader_info.material_channels:
-
-                output_socket = last_layer_node.outputs.get(channel.name)
-                input_socket = shader_node.inputs.get(channel.name)
-                if output_socket and input_socket:
-                    node_tree.links.new(output_socket, input_socket)
-    
-    debug_logging.log("Linked layer group nodes.")
+        return 0
+
+    layer_nodes = [get_material_layer_node('LAYER', i) for i in range(0, layer_count)]
+    layer_nodes = [layer_node for layer_node in layer_nodes if layer_node]
+    shader_node = node_tree.nodes.get('SHADER_NODE')
+
+    # Frozen layers are replaced by their cache images, which are linked to the first unfrozen layer instead.
+    frozen_layer_count = layer_freezing.validate_frozen_layers(active_material)
+    chain_links = get_layer_chain_links(layer_nodes[frozen_layer_count:], shader_node, shader_info.material_channels)
+    if frozen_layer_count > 0:
+        chain_links |= layer_freezing.get_frozen_cache_links(active_material, layer_nodes[frozen_layer_count:], shader_node, shader_info.material_channels)
+
+    # Find existing links connected to layer group nodes (don't include masks and blur noise).
+    existing_links = {}
+    for layer_node in layer_nodes:
+        for input in layer_node.inputs:
+            if input.name != 'Layer Mask' and input.name != 'Blur Noise':
+                for link in input.links:
+                    existing_links[(link.from_node.name, link.from_socket.name, link.to_node.name, link.to_socket.name)] = link
+        for output in layer_node.outputs:
+            for link in output.links:
+                existing_links[(link.from_node.name, link.from_socket.name, link.to_node.name, link.to_socket.name)] = link
+    for cache_output_node in layer_freezing.get_frozen_cache_output_nodes(active_material):
+        for output in cache_output_node.outputs:
+            for link in output.links:
+                existing_links[(link.from_node.name, link.from_socket.name, link.to_node.name, link.to_socket.name)] = link
+
+    # Remove links that aren't part of the layer chain.
+    links_changed = 0
+    for link_key, link in existing_links.items():
+        if link_key not in chain_links:
+            node_tree.links.remove(link)
+            links_changed += 1
+
+    # Add links missing from the layer chain.
+    nodes = node_tree.nodes
+    for output_node_name, output_name, input_node_name, input_name in chain_links:
+        if (output_node_name, output_name, input_node_name, input_name) not in existing_links:
+            output_socket = nodes.get(output_node_name).outputs.get(output_name)
+            input_socket = nodes.get(input_node_name).inputs.get(input_name)
+            node_tree.links.new(output_socket, input_socket)
+            links_changed += 1
+
+    debug_logging.log("Linked layer group nodes, {0} link(s) changed.".format(links_changed))
+    return links_changed
 
 def link_material_channel_noise_blur(node_tree, layer_node):
     '''Links the blur noise texture to the layer input to allow it to apply blur filters to material channels.'''
@@ -1332,63 +1383,144 @@ def link_material_channel_noise_blur(node_tree, layer_node):
         debug_logging.log("No blur noise texture node.", message_type='ERROR')
 
 def reindex_layer_nodes(change_made, affected_layer_index):
-    '''Reindexes layer group nodes to keep them properly indexed. This should be called after a change is made that effects the layer stack order such as adding, duplicating, deleting, or moving a material layer on the layer stack.'''
+    '''Updates the layer stack order after a change is made that effects the layer stack such as adding, duplicating or deleting a material layer. Layers are identified by their ID, so existing layer and mask nodes are never renamed.'''
+    active_material = bpy.context.active_object.active_material
     match change_made:
         case 'ADDED_LAYER':
-            # Increase the layer index for all layer group nodes, their node trees, and their masks that exist above the affected layer.
-            layer_count = len(bpy.context.scene.rymat_layers)
-            for i in range(layer_count, affected_layer_index, -1):
-                layer_node = get_material_layer_node('LAYER', i - 1)
-                if layer_node:
-                    layer_node.name = str(int(layer_node.name) + 1)
-                    material_name = parse_material_name(layer_node.node_tree.name)
-                    layer_index = parse_layer_index(layer_node.node_tree.name)
-                    layer_node.node_tree.name = format_layer_group_node_name(material_name, layer_index + 1)
-                    layer_mask_count = layer_masks.count_masks(i - 1)
-                    for c in range(layer_mask_count, 0, -1):
-                        mask_node = layer_masks.get_mask_node('MASK', i - 1, c - 1)
-                        if mask_node:
-                            mask_node.name = layer_masks.format_mask_name(i, c - 1)
-                            mask_node.node_tree.name = mask_node.name
-
+            # Assign an ID to the new layer group node, and name it and its node tree using the ID.
             new_layer_node = get_material_layer_node('LAYER', affected_layer_index, get_changed=True)
             if new_layer_node:
-                new_layer_node.name = str(affected_layer_index)
-                material_name = parse_material_name(new_layer_node.node_tree.name)
-                new_layer_node.node_tree.name = format_layer_group_node_name(material_name, affected_layer_index)
+                layer_id = insert_layer_id(active_material, affected_layer_index, new_layer_node)
+                new_layer_node.name = layer_id
+                new_layer_node.node_tree.name = format_layer_group_node_name(active_material.name, layer_id)
 
         case 'DELETED_LAYER':
-            # Reduce the layer index for all layer group nodes, their nodes trees, and their masks that exist above the affected layer.
-            layer_count = len(bpy.context.scene.rymat_layers)
-            for i in range(affected_layer_index + 1, layer_count):
-                layer_node = get_material_layer_node('LAYER', i)
-                layer_node.name = str(int(layer_node.name) - 1)
-                material_name = parse_material_name(layer_node.node_tree.name)
-                layer_index = parse_layer_index(layer_node.node_tree.name)
-                layer_node.node_tree.name = format_layer_group_node_name(material_name, layer_index - 1)
-                layer_mask_count = layer_masks.count_masks(i)
-                for c in range(0, layer_mask_count):
-                    mask_node = layer_masks.get_mask_node('MASK', i, c)
-                    if mask_node:
-                        mask_node.name = layer_masks.format_mask_name(i - 1, c)
-                        mask_node.node_tree.name = mask_node.name
+            remove_layer_id(active_material, affected_layer_index)
 
+    invalidate_layer_node_index()
     debug_logging.log("Re-indexed material layers.")
 
+def get_mesh_map_node_group(material):
+    '''Returns the node group the provided material samples mesh maps through, creating it if it doesn't exist. The node group has a vector input and a color output for each mesh map type.'''
+    mesh_map_node_group_name = MESH_MAP_NODE_GROUP_NAME.format(material.name)
+    mesh_map_node_group = bpy.data.node_groups.get(mesh_map_node_group_name)
+    if mesh_map_node_group:
+        return mesh_map_node_group
+
+    mesh_map_node_group = bpy.data.node_groups.new(mesh_map_node_group_name, type='ShaderNodeTree')
+    input_node = mesh_map_node_group.nodes.new('NodeGroupInput')
+    input_node.name = 'GROUP_INPUT'
+    input_node.label = input_node.name
+    input_node.location = (-600, 0)
+
+    output_node = mesh_map_node_group.nodes.new('NodeGroupOutput')
+    output_node.name = 'GROUP_OUTPUT'
+    output_node.label = output_node.name
+    output_node.location = (400, 0)
+
+    for i, mesh_map_type in enumerate(mesh_map_baking.MESH_MAP_TYPES):
+        mesh_map_node_group.interface.new_socket(
+            name=mesh_map_type,
+            description="Texture coordinates the {0} mesh map is sampled with".format(mesh_map_type.lower().replace('_', ' ')),
+            in_out='INPUT',
+            socket_type='NodeSocketVector'
+        )
+        mesh_map_node_group.interface.new_socket(
+            name=mesh_map_type,
+            description="{0} mesh map".format(mesh_map_type.lower().replace('_', ' ')),
+            in_out='OUTPUT',
+            socket_type='NodeSocketColor'
+        )
+
+        texture_node = mesh_map_node_group.nodes.new('ShaderNodeTexImage')
+        texture_node.name = mesh_map_type
+        texture_node.label = mesh_map_type
+        texture_node.location = (-200, i * -300)
+        mesh_map_node_group.links.new(input_node.outputs.get(mesh_map_type), texture_node.inputs[0])
+        mesh_map_node_group.links.new(texture_node.outputs[0], output_node.inputs.get(mesh_map_type))
+
+    return mesh_map_node_group
+
+def get_mask_mesh_map_texture_node(material, layer_index, mask_index, mesh_map_type):
+    '''Returns the texture node the mask at the provided index samples the provided mesh map type with, or None if the mask doesn't use the mesh map.'''
+    mesh_maps_node = layer_masks.find_mask_node(material, 'MESH_MAPS', layer_index, mask_index)
+    if mesh_maps_node and mesh_maps_node.node_tree:
+        mesh_map_output = mesh_maps_node.outputs.get(mesh_map_type)
+        if mesh_map_output and mesh_map_output.is_linked:
+            return mesh_maps_node.node_tree.nodes.get(mesh_map_type)
+        return None
+
+    # Masks added before mesh maps were shared sample mesh maps with their own texture nodes.
+    return layer_masks.find_mask_node(material, mesh_map_type, layer_index, mask_index)
+
+def bind_mask_mesh_maps(material, layer_index, mask_index):
+    '''Replaces mesh map texture nodes in the mask at the provided index with a node sampling the material's shared mesh map node group, so applying mesh maps doesn't require updating every mask. Returns true if the mask uses mesh maps.'''
+    mask_node_tree = layer_masks.find_mask_node_tree(material, layer_index, mask_index)
+    if mask_node_tree == None:
+        return False
+
+    nodes = mask_node_tree.nodes
+    links = mask_node_tree.links
+    mesh_map_texture_nodes = [node for node in nodes if node.name in mesh_map_baking.MESH_MAP_TYPES and node.bl_static_type == 'TEX_IMAGE']
+    mesh_maps_node = nodes.get('MESH_MAPS')
+    if len(mesh_map_texture_nodes) <= 0:
+        return mesh_maps_node != None
+
+    if mesh_maps_node == None:
+        mesh_maps_node = nodes.new('ShaderNodeGroup')
+        mesh_maps_node.name = 'MESH_MAPS'
+        mesh_maps_node.label = mesh_maps_node.name
+        mesh_maps_node.location = mesh_map_texture_nodes[0].location
+        mesh_maps_node.width = 300
+    mesh_maps_node.node_tree = get_mesh_map_node_group(material)
+
+    for texture_node in mesh_map_texture_nodes:
+        mesh_map_type = texture_node.name
+
+        # Texture nodes sample the active render UV map when their vector input isn't linked, a UV map node without a UV map name does the same.
+        if texture_node.inputs[0].is_linked:
+            vector_output = texture_node.inputs[0].links[0].from_socket
+        else:
+            uv_map_node = nodes.get('MESH_MAP_UV')
+            if uv_map_node == None:
+                uv_map_node = nodes.new('ShaderNodeUVMap')
+                uv_map_node.name = 'MESH_MAP_UV'
+                uv_map_node.label = uv_map_node.name
+                uv_map_node.location = (mesh_maps_node.location[0] - 300, mesh_maps_node.location[1])
+            vector_output = uv_map_node.outputs[0]
+        links.new(vector_output, mesh_maps_node.inputs.get(mesh_map_type))
+
+        for to_socket in [link.to_socket for link in texture_node.outputs[0].links]:
+            links.new(mesh_maps_node.outputs.get(mesh_map_type), to_socket)
+        nodes.remove(texture_node)
+
+    return True
+
+def update_mesh_map_node_group(material):
+    '''Applies baked mesh maps for the active object to the provided material's shared mesh map node group.'''
+    mesh_map_node_group = get_mesh_map_node_group(material)
+    for mesh_map_type in mesh_map_baking.MESH_MAP_TYPES:
+        texture_node = mesh_map_node_group.nodes.get(mesh_map_type)
+        if texture_node:
+            texture_node.image = mesh_map_baking.get_meshmap_image(bpy.context.active_object.name, mesh_map_type)
+
 def apply_mesh_maps():
-    '''Searches for all mesh map texture nodes in the node tree and applies mesh maps if they exist.'''
-    # Apply baked mesh maps to all group nodes used as masks for all material layers.
-    layers = bpy.context.scene.rymat_layers
-    for layer_index in range(0, len(layers)):
-        mask_count = layer_masks.count_masks(layer_index)
-        for mask_index in range(0, mask_count):
-            for mesh_map_type in mesh_map_baking.MESH_MAP_TYPES:
-                mask_node = layer_masks.get_mask_node('MASK', layer_index, mask_index)
-                mesh_map_node = mask_node.node_tree.nodes.get(mesh_map_type)
-                if mesh_map_node:
-                    if mesh_map_node.bl_static_type == 'TEX_IMAGE':
-                        mesh_map_node.image = mesh_map_baking.get_meshmap_image(bpy.context.active_object.name, mesh_map_type)
+    '''Applies baked mesh maps to the shared mesh map node group of the active material, which all masks using mesh maps sample them through.'''
+    active_material = getattr(bpy.context.active_object, "active_material", None)
+    if active_material == None:
+        return
+
+    # Masks in materials created before mesh maps were shared are bound to the shared node group once.
+    if not active_material.get(MESH_MAPS_BOUND_KEY, False):
+        for layer_index in range(0, count_layers(active_material)):
+            for mask_index in range(0, layer_masks.count_masks(layer_index)):
+                bind_mask_mesh_maps(active_material, layer_index, mask_index)
+        active_material[MESH_MAPS_BOUND_KEY] = True
+
+    update_mesh_map_node_group(active_material)
 
+    # Frozen masks using mesh maps are out of date when mesh maps are re-baked.
+    update_dispatcher.request_update('FROZEN_MASKS', 'APPLIED_MESH_MAPS')
     debug_logging.log("Applied baked mesh maps.")
 
 def relink_material_channel(relink_material_channel_name="", original_output_channel='', unlink_projection=False):
@@ -2231,6 +2363,481 @@ def relink_shader_node():
     active_material.node_tree.links.new(shader_node.outputs[0], material_output_node.inputs[0])
 
 
+#----------------------------- LAYER STACK TRANSACTIONS -----------------------------#
+
+
+@contextmanager
+def layer_stack_transaction(operator=None):
+    '''Groups structural edits to the layer stack (adding, duplicating or merging many layers and masks) into a single transaction. Organizing and linking layer and mask nodes, and printing debug messages, are deferred until the transaction is committed, so they run once instead of once per edit.'''
+    global _layer_stack_transaction
+
+    # Edits in nested transactions are committed with the outer transaction.
+    if _layer_stack_transaction != None:
+        yield
+        return
+
+    # Remember the object and material the transaction began with, deferred updates run on them even if the active material changes.
+    object_name = ""
+    material_name = ""
+    if bau.verify_material_operation_context(display_message=False):
+        object_name = bpy.context.active_object.name
+        material_name = bpy.context.active_object.active_material.name
+
+    _layer_stack_transaction = {
+        'ORGANIZE_LAYERS': False,
+        'LINK_LAYERS': False,
+        'ORGANIZE_MASKS': False,
+        'LINK_MASKS': [],
+        'OPERATOR': operator,
+        'OBJECT_NAME': object_name,
+        'MATERIAL_NAME': material_name
+    }
+    debug_logging.begin_deferred_logging()
+    try:
+        yield
+    finally:
+        deferred_updates = _layer_stack_transaction
+        _layer_stack_transaction = None
+        try:
+            commit_layer_stack_transaction(deferred_updates)
+        finally:
+            debug_logging.flush_deferred_logging()
+
+def defer_layer_stack_update(update_name, layer_index=-1, operator=None):
+    '''Records an update to run when the active layer stack transaction is committed. Returns false if there is no active transaction, in which case the update should run immediately.'''
+    if _layer_stack_transaction == None:
+        return False
+    
+    match update_name:
+        case 'LINK_MASKS':
+            # Masks are linked by layer ID, layer indices can change before the transaction is committed.
+            layer_key = get_layer_key(bpy.context.active_object.active_material, layer_index)
+            if layer_key not in _layer_stack_transaction['LINK_MASKS']:
+                _layer_stack_transaction['LINK_MASKS'].append(layer_key)
+        case _:
+            _layer_stack_transaction[update_name] = True
+            
+    if operator != None and _layer_stack_transaction['OPERATOR'] == None:
+        _layer_stack_transaction['OPERATOR'] = operator
+    return True
+
+def commit_layer_stack_transaction(deferred_updates):
+    '''Runs updates deferred during a layer stack transaction on the material the transaction began with, each update runs once.'''
+    if not (deferred_updates['ORGANIZE_LAYERS'] or deferred_updates['LINK_LAYERS'] or deferred_updates['ORGANIZE_MASKS'] or deferred_updates['LINK_MASKS']):
+        return
+
+    object_name = deferred_updates['OBJECT_NAME']
+    material_name = deferred_updates['MATERIAL_NAME']
+    if bau.verify_material_operation_context(display_message=False):
+        active_object = bpy.context.active_object
+        if active_object.name == object_name and active_object.active_material.name == material_name:
+            run_deferred_layer_stack_updates(deferred_updates, active_object.active_material)
+            return
+
+    # If the active material changed before the transaction was committed, run deferred updates with the transaction's material temporarily active.
+    transaction_object = bpy.data.objects.get(object_name)
+    material_slot_index = -1
+    if transaction_object:
+        for i, material_slot in enumerate(transaction_object.material_slots):
+            if material_slot.material and material_slot.material.name == material_name:
+                material_slot_index = i
+                break
+
+    if material_slot_index == -1:
+        debug_logging.log("Deferred layer stack updates were discarded, the material {0} is no longer assigned to the object {1}.".format(material_name, object_name), message_type='ERROR')
+        return
+
+    debug_logging.log("Active material changed before the layer stack transaction for {0} was committed, running deferred updates on {0}.".format(material_name), message_type='WARNING')
+    original_material_index = transaction_object.active_material_index
+    transaction_object.active_material_index = material_slot_index
+    try:
+        with bpy.context.temp_override(active_object=transaction_object, object=transaction_object):
+            run_deferred_layer_stack_updates(deferred_updates, transaction_object.active_material)
+    finally:
+        transaction_object.active_material_index = original_material_index
+
+def run_deferred_layer_stack_updates(deferred_updates, active_material):
+    '''Runs the provided deferred layer stack updates on the provided material, which must be the active material.'''
+    if deferred_updates['ORGANIZE_LAYERS']:
+        organize_layer_group_nodes()
+
+    if deferred_updates['LINK_LAYERS']:
+        link_layer_group_nodes(deferred_updates['OPERATOR'])
+
+    for layer_key in deferred_updates['LINK_MASKS']:
+        layer_index = find_layer_index(active_material, layer_key)
+        if layer_index != -1:
+            layer_masks.link_mask_nodes(layer_index)
+
+    if deferred_updates['ORGANIZE_MASKS']:
+        layer_masks.organize_mask_nodes()
+
+
+#----------------------------- LAYER STACK METADATA -----------------------------#
+
+
+def generate_stack_id(existing_ids):
+    '''Returns a new random ID used to identify a layer or mask, that is unique among the provided IDs. IDs are never entirely numeric so they can't be mistaken for layer indices.'''
+    stack_id = uuid.uuid4().hex[:STACK_ID_LENGTH]
+    while stack_id in existing_ids or stack_id.isdigit():
+        stack_id = uuid.uuid4().hex[:STACK_ID_LENGTH]
+    return stack_id
+
+def get_stack_node_id(node, existing_ids):
+    '''Returns the layer or mask ID stored in the provided group node, assigning a new ID to the node if it doesn't have one, or if its ID is already used.'''
+    stack_id = node.get(STACK_ID_PROPERTY, "")
+    if stack_id == "" or stack_id in existing_ids:
+        stack_id = generate_stack_id(existing_ids)
+        node[STACK_ID_PROPERTY] = stack_id
+    return stack_id
+
+def get_layer_key(material, layer_index):
+    '''Returns the key layer and mask nodes of the layer at the provided index are named with, which is the layer's ID, or the layer's index in materials that haven't been migrated to layer IDs yet. Returns None if the layer doesn't exist.'''
+    layer_stack_metadata = material.get(LAYER_STACK_METADATA_KEY)
+    if layer_stack_metadata == None:
+        return layer_index
+    
+    layer_ids = layer_stack_metadata['layer_ids']
+    if layer_index < 0 or layer_index >= len(layer_ids):
+        return None
+    return layer_ids[layer_index]
+
+def get_mask_key(material, layer_index, mask_index):
+    '''Returns the key the mask node at the provided layer and mask index is named with, which is the mask's ID, or the mask's index in materials that haven't been migrated to layer IDs yet. Returns None if the mask doesn't exist.'''
+    layer_stack_metadata = material.get(LAYER_STACK_METADATA_KEY)
+    if layer_stack_metadata == None:
+        return mask_index
+
+    layer_ids = layer_stack_metadata['layer_ids']
+    if layer_index < 0 or layer_index >= len(layer_ids):
+        return None
+    layer_mask_ids = layer_stack_metadata['mask_ids'].get(layer_ids[layer_index], [])
+    if mask_index < 0 or mask_index >= len(layer_mask_ids):
+        return None
+    return layer_mask_ids[mask_index]
+
+def find_layer_index(material, layer_key):
+    '''Returns the position of the layer with the provided key (layer group node name) in the layer stack of the provided material. Returns -1 if the layer isn't in the layer stack.'''
+    layer_stack_metadata = material.get(LAYER_STACK_METADATA_KEY)
+    if layer_stack_metadata == None:
+        if str(layer_key).isdigit():
+            return int(layer_key)
+        return -1
+    
+    layer_ids = list(layer_stack_metadata['layer_ids'])
+    if layer_key in layer_ids:
+        return layer_ids.index(layer_key)
+    return -1
+
+def read_legacy_layer_stack(material, material_name=""):
+    '''Returns the layer and mask indices of layers in a material saved before layers had IDs, where layer and mask nodes are named using their index, as [(layer index, [mask indices])].'''
+    if material_name == "":
+        material_name = material.name
+
+    legacy_layer_stack = []
+    nodes = material.node_tree.nodes
+    while nodes.get(str(len(legacy_layer_stack))):
+        layer_index = len(legacy_layer_stack)
+        mask_count = 0
+        while nodes.get(layer_masks.format_mask_name(layer_index, mask_count, material_name)):
+            mask_count += 1
+        legacy_layer_stack.append((layer_index, list(range(0, mask_count))))
+    return legacy_layer_stack
+
+def get_layer_stack_keys(material, material_name=""):
+    '''Returns the keys layer and mask nodes in the provided material are named with, in layer stack order, as [(layer key, [mask keys])]. The material name mask nodes were named with can be provided for materials that haven't been migrated to layer IDs yet.'''
+    layer_stack_metadata = material.get(LAYER_STACK_METADATA_KEY)
+    if layer_stack_metadata == None:
+        return read_legacy_layer_stack(material, material_name)
+    
+    mask_ids = layer_stack_metadata['mask_ids']
+    return [(layer_id, list(mask_ids.get(layer_id, []))) for layer_id in layer_stack_metadata['layer_ids']]
+
+def migrate_legacy_layer_stack(material):
+    '''Assigns IDs to all layers and masks in a material saved before layers had IDs, renames their nodes and node trees using the IDs, and stores the layer stack order as layer stack metadata.'''
+    layer_ids = []
+    mask_ids = {}
+    nodes = material.node_tree.nodes
+    for layer_index, mask_indices in read_legacy_layer_stack(material):
+        layer_node = nodes.get(str(layer_index))
+        layer_id = get_stack_node_id(layer_node, layer_ids)
+        layer_ids.append(layer_id)
+
+        layer_mask_ids = []
+        for mask_index in mask_indices:
+            mask_node = nodes.get(layer_masks.format_mask_name(layer_index, mask_index, material.name))
+            mask_id = get_stack_node_id(mask_node, layer_mask_ids)
+            layer_mask_ids.append(mask_id)
+            mask_node.name = layer_masks.format_mask_name(layer_id, mask_id, material.name)
+            if mask_node.node_tree:
+                mask_node.node_tree.name = mask_node.name
+        mask_ids[layer_id] = layer_mask_ids
+
+        layer_node.name = layer_id
+        if layer_node.node_tree:
+            layer_node.node_tree.name = format_layer_group_node_name(material.name, layer_id)
+
+    write_layer_stack_metadata(material, layer_ids, mask_ids)
+    invalidate_layer_node_index("migrated layer stack")
+    debug_logging.log("Migrated {0} layers in {1} to layer IDs.".format(len(layer_ids), material.name))
+
+def read_node_tree_layer_stack(material):
+    '''Reads the IDs of all layers and masks from the layer and mask group nodes in the provided material's node tree. Layers and masks already in the layer stack metadata keep their order, other layers and masks found in the node tree are added based on their node location. Returns (layer IDs, {layer ID: mask IDs}).'''
+    layer_nodes = []
+    mask_nodes = {}
+    mask_name_prefix = material.name + "_"
+    for node in material.node_tree.nodes:
+        stack_id = node.get(STACK_ID_PROPERTY)
+        if stack_id == None or node.bl_static_type != 'GROUP':
+            continue
+
+        # Layer nodes are named using their ID, mask nodes are named using the material name, layer ID and mask ID.
+        if node.name == stack_id:
+            layer_nodes.append(node)
+        elif node.name.startswith(mask_name_prefix):
+            mask_keys = node.name[len(mask_name_prefix):].split('_')
+            if len(mask_keys) == 2 and mask_keys[1] == stack_id:
+                mask_nodes.setdefault(mask_keys[0], []).append(node)
+
+    stored_layer_ids = []
+    stored_mask_ids = {}
+    layer_stack_metadata = material.get(LAYER_STACK_METADATA_KEY)
+    if layer_stack_metadata != None:
+        stored_layer_ids = list(layer_stack_metadata['layer_ids'])
+        stored_mask_ids = layer_stack_metadata['mask_ids']
+
+    # Layers are organized from right to left, and masks from bottom to top in the node tree.
+    existing_layer_ids = [node.name for node in sorted(layer_nodes, key=lambda node: -node.location[0])]
+    layer_ids = [layer_id for layer_id in stored_layer_ids if layer_id in existing_layer_ids]
+    layer_ids += [layer_id for layer_id in existing_layer_ids if layer_id not in layer_ids]
+
+    mask_ids = {}
+    for layer_id in layer_ids:
+        existing_mask_ids = [node[STACK_ID_PROPERTY] for node in sorted(mask_nodes.get(layer_id, []), key=lambda node: node.location[1])]
+        layer_mask_ids = [mask_id for mask_id in stored_mask_ids.get(layer_id, []) if mask_id in existing_mask_ids]
+        layer_mask_ids += [mask_id for mask_id in existing_mask_ids if mask_id not in layer_mask_ids]
+        mask_ids[layer_id] = layer_mask_ids
+
+    return layer_ids, mask_ids
+
+def write_layer_stack_metadata(material, layer_ids, mask_ids):
+    '''Stores the layer count and ordered layer and mask IDs as layer stack metadata in the provided material. Returns false if the metadata can't be written in the current context.'''
+    try:
+        material[LAYER_STACK_METADATA_KEY] = {
+            'layer_count': len(layer_ids),
+            'layer_ids': layer_ids,
+            'mask_ids': mask_ids
+        }
+
+        # Layers and masks with frozen masks may have been added or removed.
+        layer_freezing.clear_frozen_mask_flags(material)
+        return True
+    
+    # ID properties can't be written while drawing the user interface.
+    except AttributeError:
+        return False
+
+def get_layer_stack_metadata(material):
+    '''Returns the layer stack metadata stored in the provided material, creating it from the material's node tree if it doesn't exist. Returns None if the metadata doesn't exist and can't be created in the current context.'''
+    layer_stack_metadata = material.get(LAYER_STACK_METADATA_KEY)
+    if layer_stack_metadata == None:
+        validate_layer_stack_metadata(material)
+        layer_stack_metadata = material.get(LAYER_STACK_METADATA_KEY)
+    return layer_stack_metadata
+
+def read_layer_stack_metadata(material):
+    '''Returns the ordered layer and mask IDs stored in the layer stack metadata of the provided material as (layer IDs, {layer ID: mask IDs}).'''
+    layer_stack_metadata = get_layer_stack_metadata(material)
+    if layer_stack_metadata == None:
+        return read_node_tree_layer_stack(material)
+
+    layer_ids = list(layer_stack_metadata['layer_ids'])
+    stored_mask_ids = layer_stack_metadata['mask_ids']
+    mask_ids = {layer_id: list(stored_mask_ids.get(layer_id, [])) for layer_id in layer_ids}
+    return layer_ids, mask_ids
+
+def validate_layer_stack_metadata(material, repair=True):
+    '''Checks the layer stack metadata stored in the provided material matches layers and masks in the material's node tree. Invalid metadata is rebuilt from the node tree when repair is true, materials saved before layers had IDs are migrated. Returns true if the stored metadata was valid.'''
+    try:
+        # Materials with layer nodes named using the layer index were saved before layers had IDs.
+        if material.node_tree.nodes.get('0'):
+            if repair:
+                migrate_legacy_layer_stack(material)
+            return False
+        
+        layer_ids, mask_ids = read_node_tree_layer_stack(material)
+    
+    # Missing layer and mask IDs can't be assigned to nodes while drawing the user interface.
+    except AttributeError:
+        return False
+
+    layer_stack_metadata = material.get(LAYER_STACK_METADATA_KEY)
+    metadata_valid = layer_stack_metadata != None
+    if metadata_valid:
+        stored_mask_ids = layer_stack_metadata['mask_ids']
+        metadata_valid = (
+            layer_stack_metadata['layer_count'] == len(layer_ids) and
+            list(layer_stack_metadata['layer_ids']) == layer_ids and
+            all(list(stored_mask_ids.get(layer_id, [])) == mask_ids[layer_id] for layer_id in layer_ids)
+        )
+
+    if not metadata_valid and repair:
+        if write_layer_stack_metadata(material, layer_ids, mask_ids):
+            invalidate_layer_node_index("repaired layer stack")
+            if layer_stack_metadata == None:
+                debug_logging.log("Created layer stack metadata for {0}.".format(material.name), sub_process=True)
+            else:
+                debug_logging.log("Repaired layer stack metadata for {0}, it didn't match the material's node tree.".format(material.name), message_type='WARNING')
+
+    return metadata_valid
+
+def insert_layer_id(material, layer_index, layer_node):
+    '''Adds the provided (new) layer node to the layer stack order at the provided layer index. Returns the ID assigned to the layer node.'''
+    layer_ids, mask_ids = read_layer_stack_metadata(material)
+    layer_id = get_stack_node_id(layer_node, layer_ids)
+    layer_ids.insert(layer_index, layer_id)
+    mask_ids[layer_id] = []
+    write_layer_stack_metadata(material, layer_ids, mask_ids)
+    return layer_id
+
+def remove_layer_id(material, layer_index):
+    '''Removes the layer at the provided layer index, and IDs of its masks, from the layer stack order.'''
+    if material.get(LAYER_STACK_METADATA_KEY) == None:
+        validate_layer_stack_metadata(material)
+        return
+    
+    layer_ids, mask_ids = read_layer_stack_metadata(material)
+    if layer_index < len(layer_ids):
+        del mask_ids[layer_ids.pop(layer_index)]
+        write_layer_stack_metadata(material, layer_ids, mask_ids)
+
+def swap_layer_ids(material, layer_index, other_layer_index):
+    '''Swaps the order of two layers in the layer stack order.'''
+    layer_ids, mask_ids = read_layer_stack_metadata(material)
+    if max(layer_index, other_layer_index) < len(layer_ids):
+        layer_ids[layer_index], layer_ids[other_layer_index] = layer_ids[other_layer_index], layer_ids[layer_index]
+        write_layer_stack_metadata(material, layer_ids, mask_ids)
+
+def get_layer_mask_ids(material, layer_index):
+    '''Returns the ordered IDs of masks applied to the layer at the provided index, read from the layer stack metadata. Returns None if the metadata isn't available.'''
+    layer_stack_metadata = get_layer_stack_metadata(material)
+    if layer_stack_metadata == None:
+        return None
+    
+    layer_ids = layer_stack_metadata['layer_ids']
+    if layer_index < 0 or layer_index >= len(layer_ids):
+        return []
+    return layer_stack_metadata['mask_ids'].get(layer_ids[layer_index], [])
+
+def insert_mask_id(material, layer_index, mask_index, mask_node):
+    '''Adds the provided (new) mask node to the mask order of the layer at the provided index. Returns the ID assigned to the mask node, or None if the layer doesn't exist.'''
+    layer_ids, mask_ids = read_layer_stack_metadata(material)
+    if layer_index >= len(layer_ids):
+        return None
+    
+    layer_mask_ids = mask_ids[layer_ids[layer_index]]
+    mask_id = get_stack_node_id(mask_node, layer_mask_ids)
+    layer_mask_ids.insert(mask_index, mask_id)
+    write_layer_stack_metadata(material, layer_ids, mask_ids)
+    return mask_id
+
+def remove_mask_id(material, layer_index, mask_index):
+    '''Removes the mask at the provided layer and mask index from the layer stack order.'''
+    if material.get(LAYER_STACK_METADATA_KEY) == None:
+        validate_layer_stack_metadata(material)
+        return
+    
+    layer_ids, mask_ids = read_layer_stack_metadata(material)
+    if layer_index < len(layer_ids):
+        layer_mask_ids = mask_ids[layer_ids[layer_index]]
+        if mask_index < len(layer_mask_ids):
+            layer_mask_ids.pop(mask_index)
+            write_layer_stack_metadata(material, layer_ids, mask_ids)
+
+def swap_mask_ids(material, layer_index, mask_index, other_mask_index):
+    '''Swaps the order of two masks of the layer at the provided index in the layer stack order.'''
+    layer_ids, mask_ids = read_layer_stack_metadata(material)
+    if layer_index < len(layer_ids):
+        layer_mask_ids = mask_ids[layer_ids[layer_index]]
+        if max(mask_index, other_mask_index) < len(layer_mask_ids):
+            layer_mask_ids[mask_index], layer_mask_ids[other_mask_index] = layer_mask_ids[other_mask_index], layer_mask_ids[mask_index]
+            write_layer_stack_metadata(material, layer_ids, mask_ids)
+
+
+#----------------------------- BENCHMARK FUNCTIONS -----------------------------#
+
+
+def create_layer_node_lookup_benchmark_material(channel_names):
+    '''Creates a temporary material with layer node groups containing the nodes looked up when benchmarking layer node lookups. Returns the material.'''
+    benchmark_material = bpy.data.materials.new(BENCHMARK_MATERIAL_NAME)
+    benchmark_material.use_nodes = True
+    for layer_index in range(0, BENCHMARK_LAYER_COUNT):
+        layer_node_tree = bpy.data.node_groups.new(format_layer_group_node_name(benchmark_material.name, layer_index), type='ShaderNodeTree')
+        projection_node = layer_node_tree.nodes.new('ShaderNodeGroup')
+        projection_node.name = 'PROJECTION'
+        for channel_name in channel_names:
+            for layer_node_name in BENCHMARK_LAYER_NODE_NAMES:
+                channel_node = layer_node_tree.nodes.new('ShaderNodeMath')
+                channel_node.name = format_layer_node_name(layer_node_name, channel_name, 1)
+    return benchmark_material
+
+def remove_layer_node_lookup_benchmark_material(benchmark_material):
+    '''Removes the temporary material and layer node groups created to benchmark layer node lookups.'''
+    for layer_index in range(0, BENCHMARK_LAYER_COUNT):
+        layer_node_tree = bpy.data.node_groups.get(format_layer_group_node_name(benchmark_material.name, layer_index))
+        if layer_node_tree:
+            bpy.data.node_groups.remove(layer_node_tree)
+    bpy.data.materials.remove(benchmark_material)
+    invalidate_layer_node_index()
+
+def time_layer_node_lookups(material, channel_names, use_index):
+    '''Looks up all benchmarked nodes in all layers of the provided material. Returns the time taken in seconds and the number of nodes found.'''
+    found_node_count = 0
+    start_time = time.perf_counter()
+    for layer_index in range(0, BENCHMARK_LAYER_COUNT):
+        if find_material_layer_node(material, 'PROJECTION', layer_index, use_index=use_index):
+            found_node_count += 1
+        for channel_name in channel_names:
+            for layer_node_name in BENCHMARK_LAYER_NODE_NAMES:
+                if find_material_layer_node(material, layer_node_name, layer_index, channel_name, use_index=use_index):
+                    found_node_count += 1
+    return time.perf_counter() - start_time, found_node_count
+
+def add_benchmark_shader_channels():
+    '''Adds temporary float material channels to the shader until it has the benchmark channel count, so layer construction is benchmarked on a shader with at least that many channels. Returns the names of the added channels.'''
+    shader_info = bpy.context.scene.rymat_shader_info
+    added_channel_names = []
+    while len(shader_info.material_channels) < BENCHMARK_CHANNEL_COUNT:
+        channel = shader_info.material_channels.add()
+        channel.name = "Benchmark Channel {0}".format(len(added_channel_names))
+        channel.socket_type = 'NodeSocketFloat'
+        added_channel_names.append(channel.name)
+    return added_channel_names
+
+def remove_benchmark_shader_channels(channel_names):
+    '''Removes temporary material channels added to the shader for benchmarking layer construction.'''
+    shader_info = bpy.context.scene.rymat_shader_info
+    for channel_name in channel_names:
+        channel_index = shader_info.material_channels.find(channel_name)
+        if channel_index >= 0:
+            shader_info.material_channels.remove(channel_index)
+
+def time_layer_construction(layer_type, use_template):
+    '''Builds a layer node group of the provided type the benchmark number of times, node by node or by copying the layer template. Returns the fastest time taken in seconds and the number of nodes in the layer.'''
+    fastest_time = math.inf
+    layer_node_count = 0
+    for i in range(0, BENCHMARK_CONSTRUCTION_REPEATS):
+        start_time = time.perf_counter()
+        if use_template:
+            layer_node_group = get_layer_template(layer_type).copy()
+        else:
+            layer_node_group = build_layer_node_group(BENCHMARK_LAYER_NODE_GROUP_NAME, layer_type)
+        fastest_time = min(fastest_time, time.perf_counter() - start_time)
+        layer_node_count = len(layer_node_group.nodes)
+        bpy.data.node_groups.remove(layer_node_group)
+    return fastest_time, layer_node_count
+
+
 #----------------------------- OPERATORS -----------------------------#
 
 
@@ -2782,4 +3389,100 @@ class RYMAT_OT_merge_with_layer_below(Operator):
         # Log the completion of merging layers.
         end_bake_time = time.time()
         total_bake_time = end_bake_time - self._start_bake_time
-        debug_logging.log_status("Merging layers completed, total time: {0} seconds.".format(round(total_bake_time), 1), self, 'INFO')
\ No newline at end of file
+        debug_logging.log_status("Merging layers completed, total time: {0} seconds.".format(round(total_bake_time), 1), self, 'INFO')
+
+class RYMAT_OT_benchmark_layer_node_lookup(Operator):
+    bl_idname = "rymat.benchmark_layer_node_lookup"
+    bl_label = "Benchmark Layer Node Lookup"
+    bl_description = "Creates a temporary material with 50 layers and 12 material channels, then compares the time taken to look up all of its layer nodes with and without the layer node index"
+
+    def execute(self, context):
+        channel_names = ["BENCHMARK_CHANNEL_{0}".format(i) for i in range(0, BENCHMARK_CHANNEL_COUNT)]
+        benchmark_material = create_layer_node_lookup_benchmark_material(channel_names)
+
+        # Time each lookup method a few times and keep the fastest time, the first indexed pass includes building the index.
+        unindexed_time = math.inf
+        indexed_time = math.inf
+        invalidate_layer_node_index()
+        indexed_build_time, found_node_count = time_layer_node_lookups(benchmark_material, channel_names, use_index=True)
+        for i in range(0, BENCHMARK_LOOKUP_REPEATS):
+            lookup_time, unindexed_node_count = time_layer_node_lookups(benchmark_material, channel_names, use_index=False)
+            unindexed_time = min(unindexed_time, lookup_time)
+            lookup_time, indexed_node_count = time_layer_node_lookups(benchmark_material, channel_names, use_index=True)
+            indexed_time = min(indexed_time, lookup_time)
+
+        remove_layer_node_lookup_benchmark_material(benchmark_material)
+
+        if indexed_node_count != unindexed_node_count or indexed_node_count != found_node_count:
+            debug_logging.log_status("Layer node lookup benchmark failed, indexed lookups found {0} nodes, unindexed lookups found {1} nodes.".format(indexed_node_count, unindexed_node_count), self, type='ERROR')
+            return {'FINISHED'}
+
+        debug_logging.log_status("Looked up {0} layer nodes ({1} layers x {2} channels): unindexed {3}ms, indexed {4}ms ({5}ms including building the index), {6}x faster.".format(
+            found_node_count,
+            BENCHMARK_LAYER_COUNT,
+            BENCHMARK_CHANNEL_COUNT,
+            round(unindexed_time * 1000, 2),
+            round(indexed_time * 1000, 2),
+            round(indexed_build_time * 1000, 2),
+            round(unindexed_time / max(indexed_time, 0.000001), 2)
+        ), self, type='INFO')
+        return {'FINISHED'}
+
+class RYMAT_OT_benchmark_layer_construction(Operator):
+    bl_idname = "rymat.benchmark_layer_construction"
+    bl_label = "Benchmark Layer Construction"
+    bl_description = "Compares the time taken to create the nodes for a new layer node by node and by copying a layer template, on a shader temporarily padded to 12 material channels"
+
+    def execute(self, context):
+        bau.append_default_node_groups()
+        if shaders.verify_shader_node_group(self) == False:
+            return {'FINISHED'}
+
+        added_channel_names = add_benchmark_shader_channels()
+        try:
+            remove_layer_templates()
+            start_time = time.perf_counter()
+            get_layer_template('NORMAL')
+            template_build_time = time.perf_counter() - start_time
+
+            node_by_node_time, node_by_node_count = time_layer_construction('NORMAL', use_template=False)
+            template_time, template_node_count = time_layer_construction('NORMAL', use_template=True)
+            channel_count = len(bpy.context.scene.rymat_shader_info.material_channels)
+
+        # Restore the shader channels, templates built for the benchmark channels are rebuilt the next time a layer is added.
+        finally:
+            remove_benchmark_shader_channels(added_channel_names)
+            remove_layer_templates()
+
+        if node_by_node_count != template_node_count:
+            debug_logging.log_status("Layer construction benchmark failed, layers built node by node have {0} nodes, layers copied from templates have {1} nodes.".format(node_by_node_count, template_node_count), self, type='ERROR')
+            return {'FINISHED'}
+
+        debug_logging.log_status("Created layers with {0} nodes ({1} material channels): node by node {2}ms, from template {3}ms (building the template took {4}ms), {5}x faster.".format(
+            template_node_count,
+            channel_count,
+            round(node_by_node_time * 1000, 2),
+            round(template_time * 1000, 2),
+            round(template_build_time * 1000, 2),
+            round(node_by_node_time / max(template_time, 0.000001), 2)
+        ), self, type='INFO')
+        return {'FINISHED'}
+
+class RYMAT_OT_validate_layer_stack(Operator):
+    bl_idname = "rymat.validate_layer_stack"
+    bl_label = "Validate Layer Stack"
+    bl_description = "Checks the layer stack data stored in the active material matches the layers and masks in its node tree, and repairs it if it doesn't"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @ classmethod
+    def poll(cls, context):
+        return bau.verify_addon_active_material(context)
+
+    def execute(self, context):
+        active_material = bpy.context.active_object.active_material
+        if validate_layer_stack_metadata(active_material):
+            debug_logging.log_status("Layer stack for {0} is valid.".format(active_material.name), self, type='INFO')
+        else:
+            refresh_layer_stack("validated layer stack")
+            debug_logging.log_status("Repaired layer stack for {0}.".format(active_material.name), self, type='WARNING')
+        return {'FINISHED'}
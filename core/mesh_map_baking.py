@@ -1,7 +1,10 @@
 # This file contains baking operators and settings for common mesh map bake types.
 
 import os
+import math
 import time
+import hashlib
+import numpy as np
 import bpy
 from bpy.types import Operator, PropertyGroup
 from bpy.props import StringProperty, PointerProperty, BoolProperty, EnumProperty, IntProperty, FloatProperty
@@ -10,6 +13,11 @@ from ..core import blender_addon_utils
 from ..core import debug_logging
 from ..core import texture_set_settings as tss
 from ..core import image_utilities
+from ..core import uv_rasterization
+from ..core import bake_post_processing
+from ..core import bake_denoising
+from ..core import bake_render_profiles
+from ..core import bake_isolation
 
 MESH_MAP_MATERIAL_NAMES = (
     "BakeNormals",
@@ -34,12 +42,49 @@ MESH_MAP_TYPES = (
     "WORLD_SPACE_NORMALS"
 )
 
+# Mesh map types baked from sampled shaders, which are denoised after baking when denoising is enabled.
+MESH_MAP_DENOISE_TYPES = (
+    "AMBIENT_OCCLUSION",
+    "CURVATURE",
+    "THICKNESS"
+)
+
 MESH_MAP_ANTI_ALIASING = [
     ("NO_AA", "No AA", "No anti aliasing will be applied to output mesh map textures"),
     ("2X", "2xAA", "Mesh maps will be rendered at 2x scale and then scaled down to effectively apply anti-aliasing"),
     ("4X", "4xAA", "Mesh maps will be rendered at 4x scale and then scaled down to effectively apply anti-aliasing")
 ]
 
+MESH_MAP_ANTI_ALIASING_FILTER = [
+    ("BOX", "Box", "Super-sampled pixels are averaged evenly into each output pixel. This is fast and produces soft, even anti-aliasing"),
+    ("LANCZOS", "Lanczos", "Super-sampled pixels are filtered into output pixels using a Lanczos kernel. This keeps slightly sharper detail than box filtering, but is slower to filter")
+]
+
+MESH_MAP_BAKE_TILE_SIZE = [
+    ("1024", "1024", "Anti-aliased mesh maps are baked in tiles no larger than 1024 pixels. Uses the least memory, but requires the most bakes"),
+    ("2048", "2048", "Anti-aliased mesh maps are baked in tiles no larger than 2048 pixels. A good balance between memory use and baking time"),
+    ("4096", "4096", "Anti-aliased mesh maps are baked in tiles no larger than 4096 pixels. Requires the least bakes, but uses the most memory")
+]
+
+# Radius (in output pixels) of the Lanczos kernel used to filter anti-aliased mesh maps.
+LANCZOS_FILTER_RADIUS = 2
+
+# Name of the temporary UV map used to bake anti-aliased mesh maps in tiles.
+BAKE_TILE_UV_MAP_NAME = "RY_BakeTileUV"
+
+# File extension of the bake hash files saved next to each baked mesh map image.
+MESH_MAP_BAKE_HASH_EXTENSION = "bakehash"
+
+# Name and pixel resolution of the image baked to when benchmarking bake render profiles.
+BENCHMARK_BAKE_IMAGE_NAME = "RY_BakeBenchmark"
+BENCHMARK_BAKE_IMAGE_SIZE = 512
+
+# Number of times each bake is repeated when benchmarking bake render profiles, the fastest time is used.
+BENCHMARK_BAKE_REPEATS = 2
+
+# Version of the mesh map bake hash, increase this when changes to baking invalidate previously baked mesh maps.
+MESH_MAP_BAKE_HASH_VERSION = 1
+
 MESH_MAP_UPSCALE_MULTIPLIER = [
     ("NO_UPSCALE", "No Upscale", "All mesh maps will be baked at the pixel resolution defined in this materials texture set"),
     ("1_75X", "1.75x Upscale", "All mesh maps will be baked at 0.75 of the pixel resolution defined in this materials texture set and then upscaled to match the texture set resolution"),
@@ -56,6 +101,24 @@ MESH_MAP_BAKING_QUALITY = [
     ("INSANE_QUALITY", "Insane Quality", "Very high sampling, for hyper accurate mesh map data output, not recommended for standard use. Render times are very long (256 samples)")
 ]
 
+MESH_MAP_BATCH_BAKE_OBJECTS = [
+    ("ACTIVE_OBJECT", "Active Object", "Mesh maps are baked for the active object using the defined high poly and cage objects"),
+    ("SELECTED_OBJECTS", "Selected Objects", "Mesh maps are baked for all selected low poly objects in one batch. High poly and cage objects are paired to each low poly object by name suffix (e.g. Crate_low, Crate_high, Crate_Cage)")
+]
+
+# Name suffixes used to pair low poly objects with high poly and cage objects when baking mesh maps for selected objects.
+LOW_POLY_SUFFIX = "_low"
+HIGH_POLY_SUFFIX = "_high"
+CAGE_SUFFIX = "_Cage"
+
+MESH_MAP_PREVIEW_SHADING = [
+    ("SOLID", "Solid", "Previews baked mesh maps as textures in solid viewport shading, this is the fastest preview"),
+    ("MATERIAL", "Material Preview", "Previews baked mesh maps through an emission material in material preview (EEVEE) viewport shading")
+]
+
+# Name of the lightweight material used to preview baked mesh map images.
+MESH_MAP_PREVIEW_MATERIAL_NAME = "RY_MeshMapPreview"
+
 MESH_MAP_CAGE_MODE = [
     ("NO_CAGE", "No Cage", "No cage will be used when baking mesh maps. This can in rare cases produce better results than using a cage"),
     ("MANUAL_CAGE", "Manual Cage", "Insert a manually created cage to be used when baking mesh maps. Baking using a cage can cause some skewing of the baked data if the cage extends too much, or missing normal data in areas where the geometry is not covered by the cage. For some objects that have small crevaces where cage mesh normals would intersect if extruded defining a manual cage object will produce the best results")
@@ -166,40 +229,62 @@ def get_meshmap_name(mesh_name, mesh_map_type):
         case 'WORLD_SPACE_NORMALS':
             return "{0}_WorldSpaceNormals".format(mesh_name)
 
+def get_meshmap_material_name(mesh_map_type):
+    '''Returns the name of the premade material used to bake the specified mesh map type.'''
+    match mesh_map_type:
+        case 'AMBIENT_OCCLUSION':
+            return "BakeAmbientOcclusion"
+
+        case 'CURVATURE':
+            return "BakeCurvature"
+
+        case 'THICKNESS':
+            return "BakeThickness"
+
+        case 'NORMALS':
+            return "BakeNormals"
+
+        case 'WORLD_SPACE_NORMALS':
+            return "BakeWorldSpaceNormals"
+
 def get_meshmap_image(mesh_name, mesh_map_type):
     '''Returns a mesh map image if it exists. The mesh name can be an objects name if the object is a mesh type.'''
     mesh_map_name = get_meshmap_name(mesh_name, mesh_map_type)
     return bpy.data.images.get(mesh_map_name)
 
-def create_bake_image(mesh_map_type, object_name, baking_settings):
-    '''Creates a new image in Blender's data to bake to.'''
-
-    # Use the object's name and bake type to define the bake image name.
-    mesh_map_name = get_meshmap_name(object_name, mesh_map_type)
-
-    # For anti-aliasing, mesh maps are baked at a higher resolution and then scaled down (which effectively applies anti-aliasing).
-    # Define the anti-aliasing multiplier based on mesh map settings.
-    anti_aliasing_multiplier = 1
-    match getattr(baking_settings.mesh_map_anti_aliasing, mesh_map_type.lower() + "_anti_aliasing", '1X'):
-        case '1X':
-            anti_aliasing_multiplier = 1
+def get_anti_aliasing_multiplier(mesh_map_type, baking_settings):
+    '''Returns the resolution multiplier used to super-sample the specified mesh map type for anti-aliasing.'''
+    match getattr(baking_settings.mesh_map_anti_aliasing, mesh_map_type.lower() + "_anti_aliasing", 'NO_AA'):
         case '2X':
-            anti_aliasing_multiplier = 2
+            return 2
         case '4X':
-            anti_aliasing_multiplier = 4
+            return 4
+        case _:
+            return 1
 
-    # Set an image pixel resolution multiplier for mesh map upscaling.
+def get_upscale_multiplier(baking_settings):
+    '''Returns the pixel resolution multiplier mesh maps are baked at before being upscaled to the texture set resolution.'''
     match baking_settings.mesh_map_upscaling_multiplier:
-        case 'NO_UPSCALE':
-            upscale_multiplier = 1.0
         case '1_75X':
-            upscale_multiplier = 0.75
+            return 0.75
         case '2X':
-            upscale_multiplier = 0.5
+            return 0.5
+        case _:
+            return 1.0
+
+def create_bake_image(mesh_map_type, object_name, baking_settings):
+    '''Creates a new image in Blender's data to bake to.'''
+
+    # Use the object's name and bake type to define the bake image name.
+    mesh_map_name = get_meshmap_name(object_name, mesh_map_type)
+
+    # Anti-aliased mesh maps are baked in super-sampled tiles that are filtered into this image,
+    # so the image is only created at the (upscale adjusted) output resolution.
+    upscale_multiplier = get_upscale_multiplier(baking_settings)
 
     # Create a new image in Blender's data, delete existing bake image if it exists.
-    new_image_width = int(round(tss.get_texture_width() * anti_aliasing_multiplier * upscale_multiplier))
-    new_image_height = int(round(tss.get_texture_height() * anti_aliasing_multiplier * upscale_multiplier))
+    new_image_width = int(round(tss.get_texture_width() * upscale_multiplier))
+    new_image_height = int(round(tss.get_texture_height() * upscale_multiplier))
     mesh_map_image = blender_addon_utils.create_image(
         new_image_name=mesh_map_name,
         image_width=new_image_width,
@@ -218,6 +303,231 @@ def create_bake_image(mesh_map_type, object_name, baking_settings):
     mesh_map_image.use_fake_user = True
     return mesh_map_image
 
+def get_bake_tiles(image_width, image_height, anti_aliasing_multiplier, max_tile_size):
+    '''Splits the output image into tiles that can be baked at the super-sampled resolution without exceeding the maximum tile size. Returns a list of tile origins and the tile size in output pixels.'''
+    # The tile count per axis is kept equal (and a power of two) so UVs are scaled uniformly for each tile, which keeps baked tangent space normals correct.
+    tiles_per_axis = 1
+    while max(image_width, image_height) * anti_aliasing_multiplier / tiles_per_axis > max_tile_size:
+        tiles_per_axis *= 2
+
+    tile_width = int(math.ceil(image_width / tiles_per_axis))
+    tile_height = int(math.ceil(image_height / tiles_per_axis))
+    tile_origins = []
+    for y in range(0, tiles_per_axis):
+        for x in range(0, tiles_per_axis):
+            tile_origins.append((x * tile_width, y * tile_height))
+    return tile_origins, tile_width, tile_height
+
+def get_filter_apron(filter_type):
+    '''Returns the number of output pixels baked past each edge of a tile, so filter kernels have valid pixels to sample at tile edges.'''
+    match filter_type:
+        case 'LANCZOS':
+            return LANCZOS_FILTER_RADIUS
+        case _:
+            return 0
+
+def get_filter_taps(anti_aliasing_multiplier, filter_type):
+    '''Returns the normalized filter weights applied to the super-sampled pixels that make up a single output pixel.'''
+    match filter_type:
+        case 'LANCZOS':
+            # Distances (in output pixels) from the output pixel center to each super-sampled pixel center in the filter window.
+            tap_count = (LANCZOS_FILTER_RADIUS * 2 + 1) * anti_aliasing_multiplier
+            distances = (np.arange(tap_count) + 0.5) / anti_aliasing_multiplier - LANCZOS_FILTER_RADIUS - 0.5
+            weights = np.sinc(distances) * np.sinc(distances / LANCZOS_FILTER_RADIUS)
+            weights[np.abs(distances) >= LANCZOS_FILTER_RADIUS] = 0.0
+        case _:
+            weights = np.ones(anti_aliasing_multiplier)
+    return (weights / np.sum(weights)).astype(np.float32)
+
+def filter_image_axis(pixels, taps, anti_aliasing_multiplier, output_count, axis):
+    '''Filters super-sampled pixels along one axis of an (height, width, channel) pixel array down to the provided output pixel count.'''
+    output_shape = list(pixels.shape)
+    output_shape[axis] = output_count
+    filtered_pixels = np.zeros(output_shape, dtype=np.float32)
+
+    # Every output pixel uses the same filter weights, so each weight is applied to a strided slice of the input pixels.
+    for tap_index, tap_weight in enumerate(taps):
+        if tap_weight == 0.0:
+            continue
+        tap_slice = [slice(None)] * pixels.ndim
+        tap_slice[axis] = slice(tap_index, tap_index + output_count * anti_aliasing_multiplier, anti_aliasing_multiplier)
+        filtered_pixels += tap_weight * pixels[tuple(tap_slice)]
+    return filtered_pixels
+
+def filter_bake_tile(tile_image, tile_width, tile_height, anti_aliasing_multiplier, filter_type):
+    '''Reads pixels from a super-sampled bake tile and filters them down to the tile's output resolution.'''
+    input_width, input_height = tile_image.size
+    pixels = np.empty(input_width * input_height * 4, dtype=np.float32)
+    tile_image.pixels.foreach_get(pixels)
+    pixels = pixels.reshape(input_height, input_width, 4)
+
+    taps = get_filter_taps(anti_aliasing_multiplier, filter_type)
+    pixels = filter_image_axis(pixels, taps, anti_aliasing_multiplier, tile_height, axis=0)
+    pixels = filter_image_axis(pixels, taps, anti_aliasing_multiplier, tile_width, axis=1)
+    return np.clip(pixels, 0.0, 1.0)
+
+def create_bake_tile_uv_map(mesh_object):
+    '''Creates a temporary UV map used to bake tiles of the active UV map. Returns the original UV coordinates, or None if a UV map can't be created.'''
+    mesh = mesh_object.data
+    source_uv_layer = mesh.uv_layers.active
+    if source_uv_layer == None:
+        return None
+
+    source_uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+    source_uv_layer.data.foreach_get('uv', source_uvs)
+
+    tile_uv_layer = mesh.uv_layers.get(BAKE_TILE_UV_MAP_NAME)
+    if tile_uv_layer == None:
+        tile_uv_layer = mesh.uv_layers.new(name=BAKE_TILE_UV_MAP_NAME, do_init=False)
+        if tile_uv_layer == None:
+            return None
+    mesh.uv_layers.active = tile_uv_layer
+    return source_uvs.reshape(-1, 2)
+
+def apply_bake_tile_uvs(mesh_object, source_uvs, tile_origin, tile_width, tile_height, image_width, image_height, apron):
+    '''Transforms the temporary bake tile UV map so the provided tile (including its filter apron) fills the 0-1 UV range.'''
+    tile_uvs = np.empty(source_uvs.shape, dtype=np.float32)
+    tile_uvs[:, 0] = (source_uvs[:, 0] * image_width - (tile_origin[0] - apron)) / (tile_width + apron * 2)
+    tile_uvs[:, 1] = (source_uvs[:, 1] * image_height - (tile_origin[1] - apron)) / (tile_height + apron * 2)
+    tile_uv_layer = mesh_object.data.uv_layers.get(BAKE_TILE_UV_MAP_NAME)
+    tile_uv_layer.data.foreach_set('uv', tile_uvs.reshape(-1))
+    mesh_object.data.update()
+
+def remove_bake_tiles(mesh_object, original_uv_map_name, mesh_map_name):
+    '''Removes the temporary UV map and image used for baking anti-aliased mesh maps in tiles.'''
+    if mesh_object:
+        mesh = mesh_object.data
+        tile_uv_layer = mesh.uv_layers.get(BAKE_TILE_UV_MAP_NAME)
+        if tile_uv_layer:
+            mesh.uv_layers.remove(tile_uv_layer)
+        original_uv_layer = mesh.uv_layers.get(original_uv_map_name)
+        if original_uv_layer:
+            mesh.uv_layers.active = original_uv_layer
+
+    tile_image = bpy.data.images.get(get_bake_tile_image_name(mesh_map_name))
+    if tile_image:
+        bpy.data.images.remove(tile_image)
+
+def get_bake_tile_image_name(mesh_map_name):
+    '''Returns the name of the temporary image anti-aliased mesh map tiles are baked to.'''
+    return "{0}_BakeTile".format(mesh_map_name)
+
+def setup_tiled_bake(mesh_map_image, anti_aliasing_multiplier, baking_settings, self):
+    '''Prepares baking the provided mesh map image in super-sampled tiles. Returns the tile image to bake to, or None if tiles can't be baked.'''
+    active_object = bpy.context.active_object
+    self._original_uv_map_name = ""
+    if active_object.data.uv_layers.active:
+        self._original_uv_map_name = active_object.data.uv_layers.active.name
+
+    self._bake_source_uvs = create_bake_tile_uv_map(active_object)
+    if self._bake_source_uvs is None:
+        debug_logging.log_status("Unable to create a temporary UV map for anti-aliased mesh map baking.", self, type='ERROR')
+        return None
+
+    image_width, image_height = mesh_map_image.size
+    self._bake_filter_apron = get_filter_apron(baking_settings.mesh_map_anti_aliasing_filter)
+    self._bake_anti_aliasing_multiplier = anti_aliasing_multiplier
+    self._bake_tile_origins, self._bake_tile_width, self._bake_tile_height = get_bake_tiles(
+        image_width,
+        image_height,
+        anti_aliasing_multiplier,
+        int(baking_settings.mesh_map_bake_tile_size)
+    )
+    self._bake_tile_index = 0
+    self._bake_output_pixels = np.zeros((image_height, image_width, 4), dtype=np.float32)
+
+    # All tiles are baked to a single reusable image, large enough to include the filter apron around the tile.
+    tile_image = blender_addon_utils.create_image(
+        new_image_name=get_bake_tile_image_name(mesh_map_image.name),
+        image_width=(self._bake_tile_width + self._bake_filter_apron * 2) * anti_aliasing_multiplier,
+        image_height=(self._bake_tile_height + self._bake_filter_apron * 2) * anti_aliasing_multiplier,
+        base_color=(0.0, 0.0, 0.0, 1.0),
+        alpha_channel=False,
+        thirty_two_bit=True,
+        add_unique_id=False,
+        delete_existing=True
+    )
+    tile_image.colorspace_settings.name = 'Non-Color'
+
+    apply_bake_tile_uvs(
+        active_object,
+        self._bake_source_uvs,
+        self._bake_tile_origins[0],
+        self._bake_tile_width,
+        self._bake_tile_height,
+        image_width,
+        image_height,
+        self._bake_filter_apron
+    )
+    debug_logging.log("Baking {0} in {1} tiles of {2}x{3} pixels.".format(mesh_map_image.name, len(self._bake_tile_origins), tile_image.size[0], tile_image.size[1]))
+    return tile_image
+
+def bake_next_mesh_map_tile(mesh_map_type, self):
+    '''Filters the baked tile into the mesh map output pixels and starts baking the next tile. Returns true if another tile started baking.'''
+    baking_settings = bpy.context.scene.rymat_baking_settings
+    active_object = bpy.context.active_object
+    mesh_map_name = get_meshmap_name(active_object.name, mesh_map_type)
+    mesh_map_image = bpy.data.images.get(mesh_map_name)
+    tile_image = bpy.data.images.get(get_bake_tile_image_name(mesh_map_name))
+    if mesh_map_image == None or tile_image == None:
+        self._bake_tile_origins = []
+        return False
+
+    # Filter the super-sampled tile down and copy it into the output pixels, cropping tiles that extend past the image.
+    image_width, image_height = mesh_map_image.size
+    tile_x, tile_y = self._bake_tile_origins[self._bake_tile_index]
+    tile_pixels = filter_bake_tile(tile_image, self._bake_tile_width, self._bake_tile_height, self._bake_anti_aliasing_multiplier, baking_settings.mesh_map_anti_aliasing_filter)
+    copy_width = min(self._bake_tile_width, image_width - tile_x)
+    copy_height = min(self._bake_tile_height, image_height - tile_y)
+    self._bake_output_pixels[tile_y:tile_y + copy_height, tile_x:tile_x + copy_width] = tile_pixels[:copy_height, :copy_width]
+    self._bake_tile_index += 1
+
+    # Start baking the next tile.
+    if self._bake_tile_index < len(self._bake_tile_origins):
+        apply_bake_tile_uvs(
+            active_object,
+            self._bake_source_uvs,
+            self._bake_tile_origins[self._bake_tile_index],
+            self._bake_tile_width,
+            self._bake_tile_height,
+            image_width,
+            image_height,
+            self._bake_filter_apron
+        )
+        start_mesh_map_bake(mesh_map_type)
+        return True
+
+    # All tiles are baked, write the filtered pixels into the mesh map image and remove temporary tile data.
+    mesh_map_image.pixels.foreach_set(self._bake_output_pixels.reshape(-1))
+    self._bake_output_pixels = None
+    self._bake_source_uvs = None
+    self._bake_tile_origins = []
+    remove_bake_tiles(active_object, self._original_uv_map_name, mesh_map_name)
+    return False
+
+def get_bake_margin(baking_settings, resolution_multiplier=1):
+    '''Returns the margin Cycles should bake with. When UV islands are padded after baking, Cycles only needs to bake a margin wide enough for anti-aliasing filters to sample.'''
+    if baking_settings.post_bake_padding:
+
+        # Anti-aliasing filters average super-sampled pixels around each output pixel, without a margin they would average unbaked pixels into island edges.
+        # Post bake padding only fills pixels outside islands at the output resolution, so it can't fix island edges darkened by filtering.
+        if resolution_multiplier > 1:
+            return (get_filter_apron(baking_settings.mesh_map_anti_aliasing_filter) + 1) * resolution_multiplier
+        return 0
+    return baking_settings.uv_padding * resolution_multiplier
+
+def get_mesh_map_bake_type(mesh_map_type):
+    '''Returns the Cycles bake type used to bake the specified mesh map type.'''
+    match mesh_map_type:
+        case 'NORMALS':
+            return 'NORMAL'
+        case _:
+            return 'EMIT'
+
+def start_mesh_map_bake(mesh_map_type):
+    '''Starts baking the specified mesh map type to the active image node of the bake material.'''
+    bpy.ops.object.bake('INVOKE_DEFAULT', type=get_mesh_map_bake_type(mesh_map_type))
+
 def apply_baking_settings():
     '''Applies baking settings to existing node setups before baking.'''
 
@@ -264,27 +574,17 @@ def bake_mesh_map(mesh_map_type, object_name, self):
     '''Applies a premade baking material to the active object and starts baking. Returns true if baking was successful.'''
     baking_settings = bpy.context.scene.rymat_baking_settings
 
-    # Append a premade material for baking the specified mesh map type.
-    match mesh_map_type:
-        case 'AMBIENT_OCCLUSION':
-            temp_bake_material = blender_addon_utils.append_material('BakeAmbientOcclusion')
-            self._mesh_map_group_node_name = "RY_AmbientOcclusion"
-
-        case 'CURVATURE':
-            temp_bake_material = blender_addon_utils.append_material('BakeCurvature')
-            self._mesh_map_group_node_name = "RY_Curvature"
-
-        case 'THICKNESS':
-            temp_bake_material = blender_addon_utils.append_material('BakeThickness')
-            self._mesh_map_group_node_name = "RY_Thickness"
-
-        case 'NORMALS':
-            temp_bake_material = blender_addon_utils.append_material('BakeNormals')
-
-        case 'WORLD_SPACE_NORMALS':
-            temp_bake_material = blender_addon_utils.append_material('BakeWorldSpaceNormals')
-            self._mesh_map_group_node_name = "RY_WorldSpaceNormals"
-
+    # Use the premade material for baking the specified mesh map type, these are preloaded when batch baking starts.
+    # Materials are only appended here if they were removed while baking, which is logged because it costs a library load.
+    bake_material_name = get_meshmap_material_name(mesh_map_type)
+    temp_bake_material = bpy.data.materials.get(bake_material_name)
+    if temp_bake_material == None:
+        library_load_start_time = time.time()
+        temp_bake_material = blender_addon_utils.append_material(bake_material_name)
+        debug_logging.log("Bake material {0} wasn't preloaded, appended it in {1} seconds.".format(bake_material_name, round(time.time() - library_load_start_time, 3)), message_type='WARNING')
+        if temp_bake_material == None:
+            debug_logging.log_status("Error: Failed to append mesh map baking material: {0}".format(bake_material_name), self, type='ERROR')
+            return False
     self._temp_bake_material_name = temp_bake_material.name
 
     # Skip normal map baking if there is no high poly object defined, no normal information can be baked without a high poly object.
@@ -295,14 +595,25 @@ def bake_mesh_map(mesh_map_type, object_name, self):
     # Create and assign an image to bake the mesh map to.
     new_bake_image = create_bake_image(mesh_map_type, object_name, baking_settings)
     self._mesh_map_image_index = bpy.data.images.find(new_bake_image.name)
+
+    # Anti-aliased mesh maps are baked in super-sampled tiles which are filtered into the mesh map image,
+    # this avoids allocating the full super-sampled image.
+    self._bake_tile_origins = []
+    anti_aliasing_multiplier = get_anti_aliasing_multiplier(mesh_map_type, baking_settings)
+    bake_target_image = new_bake_image
+    if anti_aliasing_multiplier > 1:
+        bake_target_image = setup_tiled_bake(new_bake_image, anti_aliasing_multiplier, baking_settings, self)
+        if bake_target_image == None:
+            return False
+
     bake_image_node = temp_bake_material.node_tree.nodes.get("BAKE_IMAGE")
     if bake_image_node:
-        bake_image_node.image = new_bake_image
+        bake_image_node.image = bake_target_image
         for node in temp_bake_material.node_tree.nodes:
             node.select = False
         bake_image_node.select = True
         temp_bake_material.node_tree.nodes.active = bake_image_node
-        bpy.context.scene.tool_settings.image_paint.canvas = new_bake_image
+        bpy.context.scene.tool_settings.image_paint.canvas = bake_target_image
     else:
         debug_logging.log_status("Error: Image node not found in premade mesh map baking material setup.", self, type='ERROR')
         return False
@@ -339,14 +650,12 @@ def bake_mesh_map(mesh_map_type, object_name, self):
     # Apply mesh map quality and baking settings.
     apply_baking_settings()
     apply_mesh_map_quality(baking_settings)
-    bpy.context.scene.render.bake.margin = baking_settings.uv_padding
+    bpy.context.scene.render.bake.margin = get_bake_margin(baking_settings, anti_aliasing_multiplier)
+    if baking_settings.use_bake_render_profiles:
+        bake_render_profiles.apply_bake_render_profile(get_mesh_map_bake_type(mesh_map_type), self._original_render_settings)
 
     # Trigger the baking process.
-    match mesh_map_type:
-        case 'NORMALS':
-            bpy.ops.object.bake('INVOKE_DEFAULT', type='NORMAL')
-        case _:
-            bpy.ops.object.bake('INVOKE_DEFAULT', type='EMIT')
+    start_mesh_map_bake(mesh_map_type)
 
     # Print debug info...
     mesh_map_type = mesh_map_type.replace('_', ' ')
@@ -362,6 +671,7 @@ def delete_meshmap(meshmap_type, self):
         meshmap_image = bpy.data.images.get(meshmap_name)
         if meshmap_image:
             bpy.data.images.remove(meshmap_image)
+            remove_mesh_map_bake_hash(meshmap_name)
             self.report({'INFO'}, "{0} mesh map was deleted.".format(meshmap_name))
         else:
             self.report({'INFO'}, "{0} mesh map doesn't exist.".format(meshmap_name))
@@ -390,6 +700,174 @@ def get_batch_bake_mesh_maps():
 
     return mesh_maps_to_bake
 
+
+#----------------------------- BAKE CACHE FUNCTIONS -----------------------------#
+
+
+def update_mesh_buffer_hash(bake_hash, mesh_object):
+    '''Adds the world transform, vertex, UV and normal buffers of the evaluated mesh of the provided object to the provided hash.'''
+    # High poly objects can be in layer collections excluded from the view layer, these aren't evaluated so their original mesh is used.
+    evaluated_object = mesh_object
+    if bpy.context.view_layer.objects.get(mesh_object.name):
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        evaluated_object = mesh_object.evaluated_get(depsgraph)
+    mesh = evaluated_object.to_mesh()
+
+    vertex_positions = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', vertex_positions)
+
+    loop_vertex_indices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get('vertex_index', loop_vertex_indices)
+
+    corner_normals = np.empty(len(mesh.corner_normals) * 3, dtype=np.float32)
+    mesh.corner_normals.foreach_get('vector', corner_normals)
+
+    uvs = np.empty(0, dtype=np.float32)
+    uv_layer = mesh.uv_layers.active
+    if uv_layer:
+        uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+        uv_layer.data.foreach_get('uv', uvs)
+
+    evaluated_object.to_mesh_clear()
+
+    bake_hash.update(np.array(mesh_object.matrix_world, dtype=np.float32).tobytes())
+    bake_hash.update(vertex_positions.tobytes())
+    bake_hash.update(loop_vertex_indices.tobytes())
+    bake_hash.update(corner_normals.tobytes())
+    bake_hash.update(uvs.tobytes())
+
+def get_mesh_map_bake_settings(mesh_map_type, baking_settings):
+    '''Returns the values of all settings that change the output of the specified mesh map type.'''
+    bake_settings = [
+        MESH_MAP_BAKE_HASH_VERSION,
+        mesh_map_type,
+        tss.get_texture_width(),
+        tss.get_texture_height(),
+        get_anti_aliasing_multiplier(mesh_map_type, baking_settings),
+        baking_settings.mesh_map_anti_aliasing_filter,
+        baking_settings.mesh_map_bake_tile_size,
+        baking_settings.mesh_map_upscaling_multiplier,
+        baking_settings.mesh_map_quality,
+        baking_settings.cage_mode,
+        baking_settings.uv_padding,
+        baking_settings.post_bake_padding,
+        baking_settings.use_bake_render_profiles
+    ]
+
+    # Denoising only changes mesh maps baked from sampled shaders.
+    if mesh_map_type in MESH_MAP_DENOISE_TYPES:
+        bake_settings.append(baking_settings.denoise_mesh_maps)
+
+    match mesh_map_type:
+        case 'AMBIENT_OCCLUSION':
+            bake_settings.extend([
+                baking_settings.occlusion_samples,
+                baking_settings.occlusion_distance,
+                baking_settings.occlusion_intensity,
+                baking_settings.local_occlusion
+            ])
+
+        case 'CURVATURE':
+            bake_settings.extend([
+                baking_settings.bevel_radius,
+                baking_settings.bevel_samples,
+                baking_settings.relative_to_bounding_box
+            ])
+
+        case 'THICKNESS':
+            bake_settings.extend([
+                baking_settings.thickness_samples,
+                baking_settings.thickness_distance,
+                baking_settings.local_thickness
+            ])
+
+    return bake_settings
+
+def get_mesh_map_bake_hashes(mesh_map_types, low_poly_object, high_poly_object, cage_object):
+    '''Returns a bake hash for each of the provided mesh map types. Bake hashes change when the geometry of the low poly, high poly or cage objects, or any setting that changes the baked mesh map is edited.'''
+    baking_settings = bpy.context.scene.rymat_baking_settings
+
+    # Hash mesh buffers once, they are shared by all mesh map types.
+    geometry_hash = hashlib.sha1()
+    update_mesh_buffer_hash(geometry_hash, low_poly_object)
+
+    if high_poly_object:
+        geometry_hash.update(b"HIGH_POLY")
+        update_mesh_buffer_hash(geometry_hash, high_poly_object)
+
+        if baking_settings.cage_mode == 'MANUAL_CAGE' and cage_object:
+            geometry_hash.update(b"CAGE")
+            update_mesh_buffer_hash(geometry_hash, cage_object)
+
+    bake_hashes = {}
+    for mesh_map_type in mesh_map_types:
+        bake_hash = geometry_hash.copy()
+        bake_hash.update(repr(get_mesh_map_bake_settings(mesh_map_type, baking_settings)).encode('utf-8'))
+        bake_hashes[mesh_map_type] = bake_hash.hexdigest()
+    return bake_hashes
+
+def get_mesh_map_bake_hash_path(mesh_map_name):
+    '''Returns the file path of the bake hash saved next to the mesh map image with the provided name.'''
+    mesh_map_folder = blender_addon_utils.get_texture_folder_path(folder='MESH_MAPS')
+    return os.path.join(mesh_map_folder, "{0}.{1}".format(mesh_map_name, MESH_MAP_BAKE_HASH_EXTENSION))
+
+def read_mesh_map_bake_hash(mesh_map_name):
+    '''Returns the bake hash saved for the mesh map with the provided name, or an empty string if no bake hash was saved.'''
+    bake_hash_path = get_mesh_map_bake_hash_path(mesh_map_name)
+    if not os.path.exists(bake_hash_path):
+        return ""
+    with open(bake_hash_path, "r") as bake_hash_file:
+        return bake_hash_file.read().strip()
+
+def write_mesh_map_bake_hash(mesh_map_name, bake_hash):
+    '''Saves the bake hash for the mesh map with the provided name next to the mesh map image.'''
+    if bake_hash == "":
+        return
+    with open(get_mesh_map_bake_hash_path(mesh_map_name), "w") as bake_hash_file:
+        bake_hash_file.write(bake_hash)
+
+def remove_mesh_map_bake_hash(mesh_map_name):
+    '''Removes the bake hash saved for the mesh map with the provided name, so the mesh map is re-baked next time.'''
+    bake_hash_path = get_mesh_map_bake_hash_path(mesh_map_name)
+    if os.path.exists(bake_hash_path):
+        os.remove(bake_hash_path)
+
+def get_cached_mesh_map_image(mesh_map_name):
+    '''Returns the mesh map image with the provided name, loading it from the mesh map folder if it isn't in the blend file's data. Returns None if the image file doesn't exist.'''
+    mesh_map_folder = blender_addon_utils.get_texture_folder_path(folder='MESH_MAPS')
+    mesh_map_path = "{0}/{1}.{2}".format(mesh_map_folder, mesh_map_name, 'png')
+    if not os.path.exists(mesh_map_path):
+        return None
+
+    mesh_map_image = bpy.data.images.get(mesh_map_name)
+    if mesh_map_image == None:
+        mesh_map_image = bpy.data.images.load(mesh_map_path)
+        mesh_map_image.name = mesh_map_name
+        mesh_map_image.colorspace_settings.name = 'Non-Color'
+        mesh_map_image.use_fake_user = True
+    return mesh_map_image
+
+def remove_cached_mesh_maps(mesh_map_types, bake_hashes, object_name):
+    '''Returns the provided mesh map types without mesh maps that were already baked with a matching bake hash. Reused mesh maps are logged.'''
+    mesh_maps_to_bake = []
+    for mesh_map_type in mesh_map_types:
+        mesh_map_name = get_meshmap_name(object_name, mesh_map_type)
+        if read_mesh_map_bake_hash(mesh_map_name) == bake_hashes.get(mesh_map_type) and get_cached_mesh_map_image(mesh_map_name):
+            debug_logging.log("Reusing {0}, the mesh geometry and bake settings are unchanged since it was baked.".format(mesh_map_name))
+        else:
+            mesh_maps_to_bake.append(mesh_map_type)
+    return mesh_maps_to_bake
+
+
+#----------------------------- BAKE ASSET FUNCTIONS -----------------------------#
+
+
+def preload_mesh_map_assets():
+    '''Appends all mesh map baking materials (and the group nodes they use) in a single library load so they can be reused for every mesh map bake.'''
+    start_time = time.time()
+    appended_material_count = blender_addon_utils.append_materials(MESH_MAP_MATERIAL_NAMES)
+    debug_logging.log("Preloaded {0} mesh map baking material(s) in 1 library load ({1} seconds).".format(appended_material_count, round(time.time() - start_time, 3)))
+
 def clean_mesh_map_assets():
     '''Removes all mesh map baking materials and group nodes if they exist.'''
     # Remove all mesh map materials.
@@ -404,8 +882,67 @@ def clean_mesh_map_assets():
         if mesh_map_group_node:
             bpy.data.node_groups.remove(mesh_map_group_node)
 
+def create_mesh_map_preview_material(mesh_map_image):
+    '''Creates (or updates) a lightweight material that displays the provided baked mesh map image as emission.'''
+    preview_material = bpy.data.materials.get(MESH_MAP_PREVIEW_MATERIAL_NAME)
+    if preview_material == None:
+        preview_material = bpy.data.materials.new(MESH_MAP_PREVIEW_MATERIAL_NAME)
+    preview_material.use_nodes = True
+
+    nodes = preview_material.node_tree.nodes
+    links = preview_material.node_tree.links
+    nodes.clear()
+
+    image_node = nodes.new('ShaderNodeTexImage')
+    image_node.image = mesh_map_image
+    image_node.location = (-300, 0)
+    emission_node = nodes.new('ShaderNodeEmission')
+    material_output_node = nodes.new('ShaderNodeOutputMaterial')
+    material_output_node.location = (200, 0)
+    links.new(image_node.outputs.get('Color'), emission_node.inputs.get('Color'))
+    links.new(emission_node.outputs.get('Emission'), material_output_node.inputs.get('Surface'))
+
+    # Solid viewport shading displays the active image texture node of a material when using texture color.
+    nodes.active = image_node
+    return preview_material
+
+def remove_mesh_map_preview_material():
+    '''Removes the mesh map preview material if it exists.'''
+    preview_material = bpy.data.materials.get(MESH_MAP_PREVIEW_MATERIAL_NAME)
+    if preview_material:
+        bpy.data.materials.remove(preview_material)
+
+def get_cage_vertex_normals(mesh, vertex_positions, average_split_normals):
+    '''Returns normalized normals for each vertex in the provided mesh, used to extrude vertices when creating a bake cage.'''
+    vertex_count = len(vertex_positions)
+    if not average_split_normals:
+        vertex_normals = np.empty(vertex_count * 3, dtype=np.float32)
+        mesh.vertex_normals.foreach_get('vector', vertex_normals)
+        return vertex_normals.reshape(-1, 3)
+
+    # Sum split (corner) normals for each vertex, this averages normals across hard edges and custom normals.
+    corner_normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+    mesh.corner_normals.foreach_get('vector', corner_normals)
+    loop_vertex_indices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get('vertex_index', loop_vertex_indices)
+    vertex_normals = np.zeros((vertex_count, 3), dtype=np.float64)
+    np.add.at(vertex_normals, loop_vertex_indices, corner_normals.reshape(-1, 3))
+
+    # Vertices split apart at hard edges share a position, average their normals so they're extruded together and the cage doesn't tear.
+    if vertex_count > 0:
+        position_keys = np.round(vertex_positions, 5)
+        unique_positions, position_ids = np.unique(position_keys, axis=0, return_inverse=True)
+        position_ids = position_ids.reshape(-1)
+        position_normals = np.zeros((len(unique_positions), 3), dtype=np.float64)
+        np.add.at(position_normals, position_ids, vertex_normals)
+        vertex_normals = position_normals[position_ids]
+
+    normal_lengths = np.linalg.norm(vertex_normals, axis=1, keepdims=True)
+    vertex_normals = np.divide(vertex_normals, normal_lengths, out=np.zeros_like(vertex_normals), where=normal_lengths > 0)
+    return vertex_normals.astype(np.float32)
+
 def create_baking_cage(self):
-    '''Creates a duplicate of the selected object, scaled slightly up to act as a cage object for baking high to low poly mesh map textures.'''
+    '''Creates a duplicate of the selected object, with vertices extruded along their normals to act as a cage object for baking high to low poly mesh map textures.'''
 
     # This function requires a selected (active object), abort if there is not active object.
     active_object = bpy.context.active_object
@@ -413,36 +950,51 @@ def create_baking_cage(self):
         return
     
     # If the active object being selected is a cage object, don't make a new cage.
-    selecting_cage = active_object.name.endswith("_Cage")
+    selecting_cage = active_object.name.endswith(CAGE_SUFFIX)
     if selecting_cage:
         debug_logging.log_status("Selected object is a bake cage.", self, type='INFO')
         return
-    
-    # Make a scaled up duplicate of the object to act as the base mesh.
+
+    # Cages can only be created from mesh objects.
+    if active_object.type != 'MESH':
+        debug_logging.log_status("Selected object must be a mesh to create a bake cage.", self, type='INFO')
+        return
+
+    # Must be in object mode to read and write mesh data.
+    if active_object.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT', toggle=False)
+
+    # Make a duplicate of the object to act as the base mesh.
+    start_time = time.time()
     cage_object = active_object.copy()
     cage_mesh = active_object.data.copy()
     cage_object.data = cage_mesh
-    cage_object.name = active_object.name + "_Cage"
+    cage_object.name = active_object.name + CAGE_SUFFIX
     bpy.context.collection.objects.link(cage_object)
     bpy.context.scene.render.bake.cage_object = cage_object
+
+    # Extrude all vertices along their normals using numpy, this avoids edit mode operators which are slow for dense meshes and require a 3D viewport.
+    baking_settings = bpy.context.scene.rymat_baking_settings
+    cage_extrusion = baking_settings.cage_upscale
+    if baking_settings.cage_relative_to_bounding_box:
+        cage_extrusion *= get_bounding_box_multiplier()
+
+    vertex_positions = np.empty(len(cage_mesh.vertices) * 3, dtype=np.float32)
+    cage_mesh.vertices.foreach_get('co', vertex_positions)
+    vertex_positions = vertex_positions.reshape(-1, 3)
+    vertex_normals = get_cage_vertex_normals(cage_mesh, vertex_positions, baking_settings.cage_average_split_normals)
+    vertex_positions += vertex_normals * cage_extrusion
+    cage_mesh.vertices.foreach_set('co', vertex_positions.reshape(-1))
+    cage_mesh.update()
+    debug_logging.log("Extruded {0} cage vertices in {1} seconds.".format(len(vertex_positions), round(time.time() - start_time, 3)))
+
     blender_addon_utils.select_only(cage_object)
-    bpy.ops.object.mode_set(mode='EDIT', toggle=False)
-    bpy.ops.mesh.select_all(action='SELECT')
-    bpy.ops.transform.shrink_fatten(
-        value=0.01,
-        use_even_offset=False,
-        mirror=True,
-        use_proportional_edit=False,
-        proportional_edit_falloff='SMOOTH', 
-        proportional_size=1,
-        use_proportional_connected=False, 
-        use_proportional_projected=False, 
-        snap=False
-    )
 
     # Change viewport shading so users can see the applied cage material.
-    bpy.context.space_data.shading.color_type = 'MATERIAL'
-    bpy.context.space_data.shading.type = 'SOLID'
+    space_data = getattr(bpy.context, "space_data", None)
+    if space_data and space_data.type == 'VIEW_3D':
+        space_data.shading.color_type = 'MATERIAL'
+        space_data.shading.type = 'SOLID'
 
     # Create a new material for the cage object.
     # This material will be slightly transparent to allow the user to see through the cage object.
@@ -452,9 +1004,6 @@ def create_baking_cage(self):
     if not cage_material:
         cage_material = blender_addon_utils.append_material("Cage Material")
 
-    # Must be in object mode to make changes to the material.
-    bpy.ops.object.mode_set(mode='OBJECT', toggle=False)
-
     # Remove all material slots on the cage object.
     cage_object.data.materials.clear()
     cage_object.data.materials.append(cage_material)
@@ -483,6 +1032,257 @@ def delete_baking_cage(self):
             bpy.data.objects.remove(cage_object)
             debug_logging.log_status("Removed bake cage for selected object.", self, type='INFO')
 
+#----------------------------- BATCH BAKE OBJECT FUNCTIONS -----------------------------#
+
+
+def find_object_by_name(object_name):
+    '''Returns the object with the provided name ignoring letter case, or None if no object has the provided name.'''
+    matching_object = bpy.data.objects.get(object_name)
+    if matching_object:
+        return matching_object
+
+    lower_object_name = object_name.lower()
+    for obj in bpy.data.objects:
+        if obj.name.lower() == lower_object_name:
+            return obj
+    return None
+
+def get_bake_object_base_name(object_name):
+    '''Returns the provided object name without the low poly suffix.'''
+    if object_name.lower().endswith(LOW_POLY_SUFFIX.lower()):
+        return object_name[:-len(LOW_POLY_SUFFIX)]
+    return object_name
+
+def get_paired_bake_objects(low_poly_object):
+    '''Returns the high poly and cage objects paired with the provided low poly object by name suffix (e.g. Crate_low, Crate_high, Crate_Cage). Returns None for objects that don't exist.'''
+    base_name = get_bake_object_base_name(low_poly_object.name)
+
+    high_poly_object = find_object_by_name(base_name + HIGH_POLY_SUFFIX)
+    if high_poly_object and high_poly_object.type != 'MESH':
+        high_poly_object = None
+
+    # Cages created with this add-on use the full low poly object name as a prefix.
+    cage_object = find_object_by_name(base_name + CAGE_SUFFIX)
+    if cage_object == None:
+        cage_object = find_object_by_name(low_poly_object.name + CAGE_SUFFIX)
+    if cage_object and cage_object.type != 'MESH':
+        cage_object = None
+
+    return high_poly_object, cage_object
+
+def verify_bake_objects(low_poly_object, high_poly_object, cage_object):
+    '''Verifies mesh maps can be baked for the provided low poly, high poly and cage objects. Returns an empty string if the objects are valid, otherwise returns the reason they are invalid.'''
+    if low_poly_object.type != 'MESH':
+        return "{0} must be a mesh for baking.".format(low_poly_object.name)
+
+    if len(low_poly_object.data.uv_layers) <= 0:
+        return "{0} has no UV map to bake to.".format(low_poly_object.name)
+
+    # Baking with a manual cage requires a cage object with the same vertex count as the low poly object.
+    baking_settings = bpy.context.scene.rymat_baking_settings
+    if high_poly_object and baking_settings.cage_mode == 'MANUAL_CAGE':
+        if cage_object == None:
+            return "No cage object for {0}, please define a cage object.".format(low_poly_object.name)
+
+        debug_logging.log("Cage object vertex count: {0}".format(len(cage_object.data.vertices)))
+        debug_logging.log("Low poly object vertex count: {0}".format(len(low_poly_object.data.vertices)))
+        if len(cage_object.data.vertices) != len(low_poly_object.data.vertices):
+            return "Vertex count for low poly ({0}) and cage object ({1}) must match.".format(low_poly_object.name, cage_object.name)
+
+    return ""
+
+def get_bake_objects(self):
+    '''Returns a list of (low poly, high poly, cage) object names to bake mesh maps for. High poly and cage names are empty strings if they aren't used.'''
+    baking_settings = bpy.context.scene.rymat_baking_settings
+    bake_objects = []
+
+    match baking_settings.batch_bake_objects:
+        case 'ACTIVE_OBJECT':
+            low_poly_object = bpy.context.active_object
+            high_poly_object = baking_settings.high_poly_object
+            cage_object = bpy.context.scene.render.bake.cage_object
+            invalid_reason = verify_bake_objects(low_poly_object, high_poly_object, cage_object)
+            if invalid_reason != "":
+                debug_logging.log_status(invalid_reason, self, type='ERROR')
+                return []
+            bake_objects.append((low_poly_object.name, high_poly_object.name if high_poly_object else "", cage_object.name if cage_object else ""))
+
+        case 'SELECTED_OBJECTS':
+            for obj in sorted(bpy.context.selected_objects, key=lambda selected_object: selected_object.name):
+                # High poly and cage objects are baked from, not to.
+                lower_object_name = obj.name.lower()
+                if lower_object_name.endswith(HIGH_POLY_SUFFIX.lower()) or lower_object_name.endswith(CAGE_SUFFIX.lower()):
+                    continue
+
+                if obj.type != 'MESH':
+                    continue
+
+                high_poly_object, cage_object = get_paired_bake_objects(obj)
+                invalid_reason = verify_bake_objects(obj, high_poly_object, cage_object)
+                if invalid_reason != "":
+                    debug_logging.log("Skipping baking mesh maps: {0}".format(invalid_reason), message_type='WARNING')
+                    continue
+
+                bake_objects.append((obj.name, high_poly_object.name if high_poly_object else "", cage_object.name if cage_object else ""))
+
+            if len(bake_objects) <= 0:
+                debug_logging.log_status("No valid low poly objects selected for baking. High poly and cage objects are paired to low poly objects using the {0}, {1} and {2} suffixes.".format(LOW_POLY_SUFFIX, HIGH_POLY_SUFFIX, CAGE_SUFFIX), self, type='ERROR')
+
+    return bake_objects
+
+def begin_object_bake(object_index, self):
+    '''Prepares the low poly, high poly and cage objects at the provided index in the batch bake operator's object list for baking.'''
+    baking_settings = bpy.context.scene.rymat_baking_settings
+    low_poly_object_name, high_poly_object_name, cage_object_name = self._bake_objects[object_index]
+    low_poly_object = bpy.data.objects.get(low_poly_object_name)
+    high_poly_object = bpy.data.objects.get(high_poly_object_name)
+    cage_object = bpy.data.objects.get(cage_object_name)
+    self._bake_object_index = object_index
+    self._object_start_time = time.time()
+
+    # Bake mesh maps using the high poly and cage objects paired with this low poly object.
+    baking_settings.high_poly_object = high_poly_object
+    bpy.context.scene.render.bake.cage_object = cage_object
+    bpy.context.scene.render.bake.use_cage = baking_settings.cage_mode == 'MANUAL_CAGE' and cage_object != None
+
+    # If a high poly object is specified...
+    self._exclude_layer_collections = []
+    if high_poly_object:
+
+        # Having a high poly object in an excluded layer collection causes baking errors. Make sure all layer collections a high poly object is in is not excluded from the view layer.
+        view_layer_collections = bpy.context.view_layer.layer_collection.children
+        for collection in high_poly_object.users_collection:
+            layer_collection = view_layer_collections.get(collection.name)
+            if layer_collection:
+                self._exclude_layer_collections.append((collection.name, layer_collection.exclude))
+                layer_collection.exclude = False
+
+        # Ensure the high poly object is visible for rendering.
+        high_poly_object.hide_set(False)
+        high_poly_object.hide_render = False
+
+    # Ensure the low poly object is visible for rendering, and is the active object.
+    low_poly_object.hide_set(False)
+    low_poly_object.hide_render = False
+    blender_addon_utils.select_only(low_poly_object)
+
+    # Cache original materials applied to the low poly object so the materials can be re-applied after baking.
+    self._original_material_names = []
+    for material_slot in low_poly_object.material_slots:
+        if material_slot.material:
+            self._original_material_names.append(material_slot.material.name)
+        else:
+            self._original_material_names.append("")
+
+    debug_logging.log("Baking mesh maps for: {0}".format(low_poly_object_name))
+
+def end_object_bake(self):
+    '''Re-applies original materials to the low poly object being baked, hides its high poly object and records the time taken to bake its mesh maps.'''
+    if self._bake_object_index < 0:
+        return
+
+    low_poly_object_name, high_poly_object_name, cage_object_name = self._bake_objects[self._bake_object_index]
+    self._object_bake_times[low_poly_object_name][2] += time.time() - self._object_start_time
+    self._bake_object_index = -1
+
+    # Re-apply the materials that were originally on the object.
+    low_poly_object = bpy.data.objects.get(low_poly_object_name)
+    if low_poly_object:
+        for i in range(0, min(len(self._original_material_names), len(low_poly_object.material_slots))):
+            material = bpy.data.materials.get(self._original_material_names[i])
+            if material:
+                low_poly_object.material_slots[i].material = material
+
+    # Hide the high poly object, and re-exclude layer collections the high poly object belongs to.
+    high_poly_object = bpy.data.objects.get(high_poly_object_name)
+    if high_poly_object:
+        high_poly_object.hide_set(True)
+        high_poly_object.hide_render = True
+
+        view_layer_collections = bpy.context.view_layer.layer_collection.children
+        for collection_name, exclude in self._exclude_layer_collections:
+            layer_collection = view_layer_collections.get(collection_name)
+            if layer_collection:
+                layer_collection.exclude = exclude
+    self._exclude_layer_collections = []
+
+def reset_bake_objects(self):
+    '''Resets the high poly and cage objects in the bake settings and re-selects the object that was active before baking.'''
+    bpy.context.scene.rymat_baking_settings.high_poly_object = self._original_high_poly_object
+    bpy.context.scene.render.bake.cage_object = self._original_cage_object
+    bpy.context.scene.render.bake.use_cage = self._original_use_cage
+
+    original_active_object = bpy.data.objects.get(self._original_active_object_name)
+    if original_active_object:
+        blender_addon_utils.select_only(original_active_object)
+
+def submit_mesh_map_post_process(mesh_map_image, object_name, mesh_map_type, self):
+    '''Queues the provided baked mesh map image to be upscaled to the texture set resolution, UV padded and saved on a worker thread.'''
+    baking_settings = bpy.context.scene.rymat_baking_settings
+    output_width = tss.get_texture_width()
+    output_height = tss.get_texture_height()
+
+    # The UV coverage mask is read on the main thread as it requires mesh data, padding is applied at the final mesh map resolution so it isn't lost to resampling.
+    coverage_mask = None
+    if baking_settings.post_bake_padding:
+        texel_map = uv_rasterization.get_texel_map(bpy.data.objects.get(object_name), output_width, output_height)
+        if texel_map:
+            coverage_mask = uv_rasterization.get_uv_coverage_mask(texel_map)
+
+    future = bake_post_processing.submit_image_post_process(mesh_map_image, output_width, output_height, coverage_mask, baking_settings.uv_padding)
+    self._post_process_jobs.append((mesh_map_image.name, self._mesh_map_bake_hashes.get((object_name, mesh_map_type), ""), future))
+
+def load_post_processed_mesh_maps(self, wait=False):
+    '''Loads mesh maps that finished post-processing back into their images and saves their bake hash. If wait is true, waits for all queued mesh maps to finish post-processing.'''
+    remaining_jobs = []
+    for mesh_map_name, bake_hash, future in self._post_process_jobs:
+        if not wait and not future.done():
+            remaining_jobs.append((mesh_map_name, bake_hash, future))
+            continue
+
+        try:
+            post_process_time = future.result()
+        except Exception as error:
+            debug_logging.log("Failed to post-process {0}: {1}".format(mesh_map_name, error), message_type='ERROR')
+            continue
+
+        # Save the bake hash with the mesh map, so it can be reused if nothing changes before the next bake.
+        mesh_map_image = bpy.data.images.get(mesh_map_name)
+        if mesh_map_image:
+            bake_post_processing.load_post_processed_image(mesh_map_image)
+            write_mesh_map_bake_hash(mesh_map_name, bake_hash)
+        debug_logging.log("Post-processed and saved {0} in {1} seconds.".format(mesh_map_name, round(post_process_time, 3)), sub_process=True)
+
+    self._post_process_jobs = remaining_jobs
+
+def apply_bake_object_mesh_maps(self):
+    '''Applies baked mesh maps to the material of every object baked by the batch bake operator, then re-selects the object that was active before baking.'''
+    for low_poly_object_name, high_poly_object_name, cage_object_name in self._bake_objects:
+        low_poly_object = bpy.data.objects.get(low_poly_object_name)
+        if low_poly_object:
+            blender_addon_utils.select_only(low_poly_object)
+            material_layers.refresh_layer_stack()
+            material_layers.apply_mesh_maps()
+
+    reset_bake_objects(self)
+    material_layers.refresh_layer_stack()
+
+def bake_queued_mesh_map(self):
+    '''Starts baking the next mesh map in the batch bake operator's queue, preparing the next object for baking when the queue moves to a new object. Returns true if baking started successfully.'''
+    object_index, mesh_map_type = self._bake_queue[self._bake_queue_index]
+    if object_index != self._bake_object_index:
+        end_object_bake(self)
+        begin_object_bake(object_index, self)
+    return bake_mesh_map(mesh_map_type, self._bake_objects[object_index][0], self)
+
+def log_object_bake_times(self):
+    '''Logs a table of the mesh maps baked, mesh maps reused and the bake time for each object baked by the batch bake operator.'''
+    row_format = "{0:<40}{1:>8}{2:>8}{3:>12}"
+    debug_logging.log(row_format.format("Object", "Baked", "Reused", "Time (s)"))
+    for object_name, bake_times in self._object_bake_times.items():
+        baked_count, reused_count, bake_time = bake_times
+        debug_logging.log(row_format.format(object_name, baked_count, reused_count, round(bake_time, 2)))
+
 
 #----------------------------- OPERATORS AND PROPERTIES -----------------------------#
 
@@ -501,11 +1301,39 @@ class RYMAT_baking_settings(bpy.types.PropertyGroup):
         description="The high poly object (must be a mesh) from which mesh detail will be baked to texture maps. The high poly mesh should generally be overlapped by your low poly mesh before starting baking. You do not need to provide a high poly mesh for baking texture maps"
     )
 
+    mesh_map_preview_shading: EnumProperty(
+        items=MESH_MAP_PREVIEW_SHADING,
+        name="Mesh Map Preview Shading",
+        description="Viewport shading used to preview mesh maps that are already baked. Mesh maps that aren't baked yet are previewed live with Cycles",
+        default='SOLID'
+    )
+
+    batch_bake_objects: EnumProperty(
+        items=MESH_MAP_BATCH_BAKE_OBJECTS,
+        name="Batch Bake Objects",
+        description="Objects mesh maps are baked for when batch baking",
+        default='ACTIVE_OBJECT'
+    )
+
     mesh_map_anti_aliasing: PointerProperty(
         type=RYMAT_mesh_map_anti_aliasing, 
         name="Mesh Map Anti Aliasing"
     )
 
+    mesh_map_anti_aliasing_filter: EnumProperty(
+        items=MESH_MAP_ANTI_ALIASING_FILTER,
+        name="Anti Aliasing Filter",
+        description="Filter used to scale super-sampled mesh maps down to their output resolution when anti-aliasing is applied",
+        default='BOX'
+    )
+
+    mesh_map_bake_tile_size: EnumProperty(
+        items=MESH_MAP_BAKE_TILE_SIZE,
+        name="Bake Tile Size",
+        description="Maximum pixel resolution of the tiles anti-aliased mesh maps are baked in. Anti-aliased mesh maps are baked in tiles so the full super-sampled image never needs to be held in memory",
+        default='2048'
+    )
+
     mesh_map_upscaling_multiplier: EnumProperty(
         items=MESH_MAP_UPSCALE_MULTIPLIER,
         name="Mesh Map Upscale Multiplier",
@@ -529,7 +1357,7 @@ class RYMAT_baking_settings(bpy.types.PropertyGroup):
 
     cage_upscale: FloatProperty(
         name="Cage Upscale",
-        description="Upscales a duplicate of the low poly mesh by the specified amount to use as a cage for mesh map baking", 
+        description="Extrudes vertices of a duplicate of the low poly mesh along their normals by the specified amount to use as a cage for mesh map baking", 
         default=0.01,
         min=0.0,
         soft_max=0.1,
@@ -537,6 +1365,18 @@ class RYMAT_baking_settings(bpy.types.PropertyGroup):
         precision=4
     )
 
+    cage_relative_to_bounding_box: BoolProperty(
+        name="Cage Relative to Bounding Box",
+        description="If true, the cage upscale will be multiplied by the averaged size of the active objects bounding box when creating a bake cage, so the cage extrusion stays roughly correct among varying sizes of objects",
+        default=False
+    )
+
+    cage_average_split_normals: BoolProperty(
+        name="Average Split Normals",
+        description="Extrudes bake cages along normals averaged across hard edges and split vertices, this prevents the cage from tearing apart at hard edges",
+        default=True
+    )
+
     uv_padding: IntProperty(
         name="UV Padding",
         description="Amount of padding in pixels to extend the baked data out of UV islands. This ensures there is no visible seams between UV splits",
@@ -545,6 +1385,36 @@ class RYMAT_baking_settings(bpy.types.PropertyGroup):
         max=64
     )
 
+    post_bake_padding: BoolProperty(
+        name="Post Bake Padding",
+        description="Pads UV islands with a fast jump flood after baking, packing and resampling instead of having Cycles bake a margin. Padding is applied to the final output resolution so it's never eroded by resampling",
+        default=True
+    )
+
+    denoise_mesh_maps: BoolProperty(
+        name="Denoise Mesh Maps",
+        description="Denoises ambient occlusion, curvature and thickness mesh maps with OpenImageDenoise after baking, using baked world space normals and UV coverage as guide passes. This allows baking with much lower quality (fewer samples) while producing smooth results",
+        default=False
+    )
+
+    use_bake_render_profiles: BoolProperty(
+        name="Optimize Render Settings",
+        description="While baking, applies render settings that disable Cycles features which don't change baked results (light bounces, caustics, adaptive sampling, denoising, light tree) and tunes tile sizes for the render device. Original render settings are restored after baking",
+        default=True
+    )
+
+    use_bake_isolation: BoolProperty(
+        name="Isolate Bakes",
+        description="While baking, switches all 3D viewports to solid shading and pauses this add-on's update handlers and image auto-saving so they don't compete with Cycles for processing time. Viewport shading is restored when baking finishes. When disabled, the viewport uses material preview shading while baking so changes can be monitored",
+        default=True
+    )
+
+    use_bake_cache: BoolProperty(
+        name="Use Bake Cache",
+        description="Skips baking mesh maps that were already baked from unchanged low poly, high poly and cage geometry using the same bake settings. Turn this off to always re-bake all checked mesh maps",
+        default=True
+    )
+
     bake_normals: BoolProperty(
         name="Bake Normal", 
         description="Toggle for baking normal maps for baking as part of the batch baking operator", 
@@ -671,13 +1541,32 @@ class RYMAT_OT_batch_bake(Operator):
     _timer = None
     _temp_bake_material_name = ""
     _mesh_map_image_index = 0
-    _mesh_map_group_node_name = ""
-    _mesh_maps_to_bake = []
-    _baked_mesh_map_count = 0
+    _bake_objects = []
+    _bake_object_index = -1
+    _bake_queue = []
+    _bake_queue_index = 0
+    _mesh_map_bake_hashes = {}
+    _object_bake_times = {}
+    _object_start_time = 0
+    _post_process_jobs = []
     _original_material_names = []
     _original_render_engine = None
+    _original_render_settings = {}
+    _original_active_object_name = ""
+    _original_high_poly_object = None
+    _original_cage_object = None
+    _original_use_cage = False
     _start_bake_time = 0
     _exclude_layer_collections = []
+    _original_uv_map_name = ""
+    _bake_source_uvs = None
+    _bake_output_pixels = None
+    _bake_tile_origins = []
+    _bake_tile_index = 0
+    _bake_tile_width = 0
+    _bake_tile_height = 0
+    _bake_filter_apron = 0
+    _bake_anti_aliasing_multiplier = 1
 
     # Users must have an object selected to call this operator.
     @ classmethod
@@ -685,55 +1574,56 @@ class RYMAT_OT_batch_bake(Operator):
         return context.active_object
 
     def modal(self, context, event):
+        with bake_isolation.end_bake_isolation_on_error():
+            return self.update_bake(context, event)
+
+    def update_bake(self, context, event):
+        '''Handles the provided modal event, starting the next bake when the running bake job finishes.'''
         # If a user presses escape, mesh map baking will cancel.
         if event.type in {'ESC'}:
             self.cancel(context)
             return {'CANCELLED'}
         
         if event.type == 'TIMER':
+            # Load mesh maps that finished post-processing back into their images.
+            load_post_processed_mesh_maps(self)
+
             # If a mesh map isn't actively baking, move to the next mesh map, or end the function.
             if not bpy.app.is_job_running('OBJECT_BAKE'):
-                mesh_map_type = self._mesh_maps_to_bake[self._baked_mesh_map_count]
-                mesh_map_name = get_meshmap_name(bpy.context.active_object.name, mesh_map_type)
+                object_index, mesh_map_type = self._bake_queue[self._bake_queue_index]
+                object_name = self._bake_objects[object_index][0]
+
+                # For anti-aliased mesh maps, filter the baked tile into the mesh map and bake the next tile.
+                if self._bake_tile_index < len(self._bake_tile_origins):
+                    if bake_next_mesh_map_tile(mesh_map_type, self):
+                        return {'PASS_THROUGH'}
+
+                # Copy the baked pixels out and queue upscaling, padding and saving on a worker thread, so the next mesh map can start baking immediately.
+                mesh_map_name = get_meshmap_name(object_name, mesh_map_type)
                 mesh_map_image = bpy.data.images.get(mesh_map_name)
                 if mesh_map_image:
-                    # Scale baked textures down to apply anti-aliasing.
-                    baking_settings = bpy.context.scene.rymat_baking_settings
-                    match getattr(baking_settings.mesh_map_anti_aliasing, mesh_map_type.lower() + "_anti_aliasing", '1X'):
-                        case '2X':
-                            mesh_map_image.scale(int(mesh_map_image.size[0] * 0.5), int(mesh_map_image.size[1] * 0.5))
-                        case '4X':                            
-                            mesh_map_image.scale(int(mesh_map_image.size[0] * 0.25), int(mesh_map_image.size[1] * 0.25))
-
-                    # Scale baked textures up to match the texture set resolution size.
-                    match baking_settings.mesh_map_upscaling_multiplier:
-                        case '1_75X':
-                            mesh_map_image.scale(int(round(mesh_map_image.size[0] * 1.333333)), int(round(mesh_map_image.size[1] * 1.333333)))
-                        case '2X':
-                            mesh_map_image.scale(int(mesh_map_image.size[0] * 2), int(mesh_map_image.size[1] * 2))
-
-                    # Save the mesh map to disk.
-                    mesh_map_image.save(quality=0)
+                    # Denoise sampled mesh maps before they're post-processed and saved.
+                    if bpy.context.scene.rymat_baking_settings.denoise_mesh_maps and mesh_map_type in MESH_MAP_DENOISE_TYPES:
+                        normal_guide_image = bpy.data.images.get(get_meshmap_name(object_name, 'WORLD_SPACE_NORMALS'))
+                        denoised = bake_denoising.denoise_image(mesh_map_image, bpy.data.objects.get(object_name), normal_guide_image)
+
+                        # Bake hashes record mesh maps as denoised, don't save one for a mesh map that wasn't, so it's re-baked next time.
+                        if not denoised:
+                            self._mesh_map_bake_hashes[(object_name, mesh_map_type)] = ""
+                            remove_mesh_map_bake_hash(mesh_map_name)
+
+                    submit_mesh_map_post_process(mesh_map_image, object_name, mesh_map_type, self)
 
                 # Log mesh map baking completion.
                 mesh_map_type = mesh_map_type.replace('_', ' ')
                 mesh_map_type = blender_addon_utils.capitalize_by_space(mesh_map_type)
-                debug_logging.log("Finished baking: {0}".format(mesh_map_type))
-                self._baked_mesh_map_count += 1
-
-                # Remove temporary bake materials and node groups.
-                temp_bake_material = bpy.data.materials.get(self._temp_bake_material_name)
-                if temp_bake_material:
-                    bpy.data.materials.remove(temp_bake_material)
+                debug_logging.log("Finished baking: {0} for {1}".format(mesh_map_type, object_name))
+                self._object_bake_times[object_name][0] += 1
+                self._bake_queue_index += 1
 
-                bake_node_group = bpy.data.node_groups.get(self._mesh_map_group_node_name)
-                if bake_node_group:
-                    bpy.data.node_groups.remove(bake_node_group)
-
-                # Bake the next mesh map.
-                if self._baked_mesh_map_count < len(self._mesh_maps_to_bake):
-                    mesh_map_type = self._mesh_maps_to_bake[self._baked_mesh_map_count]
-                    baked_successfully = bake_mesh_map(mesh_map_type, bpy.context.active_object.name, self)
+                # Bake the next mesh map in the queue.
+                if self._bake_queue_index < len(self._bake_queue):
+                    baked_successfully = bake_queued_mesh_map(self)
 
                     # If there is an error with baking a mesh map, finish the operation.
                     if baked_successfully == False:
@@ -767,21 +1657,76 @@ class RYMAT_OT_batch_bake(Operator):
             )
             return {'CANCELLED'}
 
+        # Verify the active object can be baked to when baking only the active object.
+        baking_settings = bpy.context.scene.rymat_baking_settings
+        if baking_settings.batch_bake_objects == 'ACTIVE_OBJECT':
+            if blender_addon_utils.verify_bake_object(self) == False:
+                return {'CANCELLED'}
+
+        # Ensure we start this operation in object mode.
+        bpy.ops.object.mode_set(mode='OBJECT', toggle=False)
+
+        # Get a list of mesh maps to bake.
+        mesh_maps_to_bake = get_batch_bake_mesh_maps()
+        if len(mesh_maps_to_bake) <= 0:
+            debug_logging.log_status("No mesh maps checked for baking.", self, type='INFO')
+            return {'FINISHED'}
+
+        # When denoising, bake world space normals first so they can be used as a guide pass for denoising other mesh maps.
+        if baking_settings.denoise_mesh_maps and 'WORLD_SPACE_NORMALS' in mesh_maps_to_bake:
+            mesh_maps_to_bake.remove('WORLD_SPACE_NORMALS')
+            mesh_maps_to_bake.insert(0, 'WORLD_SPACE_NORMALS')
+
+        # Get the low poly objects to bake, with their paired high poly and cage objects.
+        self._bake_objects = get_bake_objects(self)
+        if len(self._bake_objects) <= 0:
+            return {'CANCELLED'}
+
+        # Remember the active object and bake objects so they can be reset after baking, baking each object changes them.
+        self._original_active_object_name = bpy.context.active_object.name
+        self._original_high_poly_object = baking_settings.high_poly_object
+        self._original_cage_object = bpy.context.scene.render.bake.cage_object
+        self._original_use_cage = bpy.context.scene.render.bake.use_cage
+        self._bake_object_index = -1
+
+        # Queue every mesh map for every object, skipping mesh maps that were baked from unchanged geometry and bake settings.
+        self._bake_queue = []
+        self._mesh_map_bake_hashes = {}
+        self._object_bake_times = {}
+        for object_index, bake_object_names in enumerate(self._bake_objects):
+            low_poly_object_name, high_poly_object_name, cage_object_name = bake_object_names
+            bake_hashes = get_mesh_map_bake_hashes(
+                mesh_maps_to_bake,
+                bpy.data.objects.get(low_poly_object_name),
+                bpy.data.objects.get(high_poly_object_name),
+                bpy.data.objects.get(cage_object_name)
+            )
+            for mesh_map_type, bake_hash in bake_hashes.items():
+                self._mesh_map_bake_hashes[(low_poly_object_name, mesh_map_type)] = bake_hash
+
+            object_mesh_maps_to_bake = mesh_maps_to_bake
+            if baking_settings.use_bake_cache:
+                object_mesh_maps_to_bake = remove_cached_mesh_maps(mesh_maps_to_bake, bake_hashes, low_poly_object_name)
+
+            # Track the number of baked and reused mesh maps, and the bake time for each object.
+            self._object_bake_times[low_poly_object_name] = [0, len(mesh_maps_to_bake) - len(object_mesh_maps_to_bake), 0.0]
+            for mesh_map_type in object_mesh_maps_to_bake:
+                self._bake_queue.append((object_index, mesh_map_type))
+
+        if len(self._bake_queue) <= 0:
+            apply_bake_object_mesh_maps(self)
+            debug_logging.log_status("All checked mesh maps are up to date, no mesh maps were baked.", self, type='INFO')
+            return {'FINISHED'}
+
         # To help users avoid losing data to crashes that can occur when baking in Blender,
-        # save the blend file, and all textures before starting a bake.
+        # save the blend file, and all textures once before starting to bake all queued mesh maps.
         bpy.ops.wm.save_mainfile()
         image_utilities.save_all_textures()
 
-        # Remove lingering mesh map assets if they exist.
+        # Remove lingering mesh map assets if they exist, then load all mesh map baking assets at once.
+        # Bake materials are reused for all mesh maps and removed once when baking is finished.
         clean_mesh_map_assets()
-
-        # Set the viewport shading mode to 'Material' 
-        # this helps bake materials slightly faster while still being able to preview material changes.
-        bpy.context.space_data.shading.type = 'MATERIAL'
-
-        # Verify the active object can be baked to.
-        if blender_addon_utils.verify_bake_object(self) == False:
-            return {'CANCELLED'}
+        preload_mesh_map_assets()
 
         # To avoid errors don't start baking if there is already a bake job running.
         if bpy.app.is_job_running('OBJECT_BAKE') == True:
@@ -790,86 +1735,28 @@ class RYMAT_OT_batch_bake(Operator):
         
         # Pause auto-updates for this add-on while baking.
         bpy.context.scene.pause_auto_updates = True
-        debug_logging.log("Starting mesh map baking...", sub_process=False)
+
+        # Isolate baking from viewport redraws and add-on handlers,
+        # or set the viewport shading mode to 'Material' so users can preview material changes while baking.
+        if baking_settings.use_bake_isolation:
+            bake_isolation.begin_bake_isolation("mesh map baking")
+        else:
+            bpy.context.space_data.shading.type = 'MATERIAL'
+        debug_logging.log("Starting mesh map baking ({0} mesh map(s) for {1} object(s))...".format(len(self._bake_queue), len(self._bake_objects)), sub_process=False)
 
         # Record the starting time before baking.
         self._start_bake_time = time.time()
 
-        # Ensure we start this operation in object mode.
-        bpy.ops.object.mode_set(mode='OBJECT', toggle=False)
-
-        # Get a list of mesh maps to bake.
-        self._mesh_maps_to_bake.clear()
-        self._mesh_maps_to_bake = get_batch_bake_mesh_maps()
-        if len(self._mesh_maps_to_bake) <= 0:
-            debug_logging.log_status("No mesh maps checked for baking.", self, type='INFO')
-            return {'FINISHED'}
-
-        baking_settings = bpy.context.scene.rymat_baking_settings
-        low_poly_object = bpy.context.active_object
-        high_poly_object = baking_settings.high_poly_object
-
-        # If a high poly object is specified...
-        if high_poly_object:
-
-            # Having a high poly object in an excluded layer collection causes baking errors. Make sure all layer collections a high poly object is in is not excluded from the view layer.
-            self._exclude_layer_collections.clear()
-            view_layer_collections = bpy.context.view_layer.layer_collection.children
-            user_collections = high_poly_object.users_collection
-            for collection in user_collections:
-                layer_collection = view_layer_collections.get(collection.name)
-                self._exclude_layer_collections.append(layer_collection.exclude)
-                layer_collection.exclude = False
-
-            # Adjust settings based on the selected cage mode.
-            match baking_settings.cage_mode:
-                case 'NO_CAGE':
-                    bpy.context.scene.render.bake.use_cage = False
-
-                case 'MANUAL_CAGE':
-                    bpy.context.scene.render.bake.use_cage = True
-
-                    # If a cage object isn't defined, ask the user to define one.
-                    cage_object = bpy.context.scene.render.bake.cage_object
-                    if cage_object == None:
-                        debug_logging.log_status("No cage object, please define a cage object.", self, type='INFO')
-                        return {'FINISHED'}
-                        
-                    # Abort if both a cage and high poly object is defined, 
-                    # but the vertex count between the low poly and cage objects don't match.
-                    if cage_object and high_poly_object:
-                        cage_object_vertex_count = len(cage_object.data.vertices)
-                        low_poly_object_vertex_count = len(high_poly_object.data.vertices)
-                        debug_logging.log("Cage object vertex count: {0}".format(cage_object_vertex_count))
-                        debug_logging.log("High poly object vertex count: {0}".format(low_poly_object_vertex_count))
-                        if len(cage_object.data.vertices) != len(low_poly_object.data.vertices):
-                            debug_logging.log_status("Vertex count for low poly and cage object must match.", self, type='ERROR')
-                            return {'FINISHED'}
-
-            # Ensure the high poly object is visible for rendering.
-            high_poly_object.hide_set(False)
-            high_poly_object.hide_render = False
-        
-        # Ensure the low poly object is visible for rendering.
-        low_poly_object.hide_set(False)
-        low_poly_object.hide_render = False
-
-        # Cache original materials applied to the active object so the materials can be re-applied after baking.
-        self._original_material_names.clear()
-        low_poly_obj_material_slots = bpy.context.active_object.material_slots
-        if len(low_poly_obj_material_slots) > 0:
-            for x in low_poly_obj_material_slots:
-                if x.material:
-                    self._original_material_names.append(x.material.name)
-                else:
-                    self._original_material_names.append("")
-
         # Set render engine to Cycles (required for baking) and remember the original render engine so we can reset it after baking.
         self._original_render_engine = bpy.context.scene.render.engine
         bpy.context.scene.render.engine = 'CYCLES'
 
-        # Start baking the mesh map.
-        baked_successfully = bake_mesh_map(self._mesh_maps_to_bake[0], low_poly_object.name, self)    
+        # Start baking the first mesh map in the queue.
+        self._original_render_settings = {}
+        self._post_process_jobs = []
+        self._bake_queue_index = 0
+        with bake_isolation.end_bake_isolation_on_error():
+            baked_successfully = bake_queued_mesh_map(self)
         if baked_successfully == False:
             self.finish(context)
             return {'FINISHED'}
@@ -887,30 +1774,31 @@ class RYMAT_OT_batch_bake(Operator):
             wm = context.window_manager
             wm.event_timer_remove(self._timer)
 
-        # High the high poly object, and re-exclude layer collections the high poly object belongs to.
-        high_poly_object = bpy.context.scene.rymat_baking_settings.high_poly_object
-        if high_poly_object:
-            high_poly_object.hide_set(True)
-            high_poly_object.hide_render = True
-            
-            view_layer_collections = bpy.context.view_layer.layer_collection.children
-            user_collections = high_poly_object.users_collection
-            for i, collection in enumerate(user_collections):
-                layer_collection = view_layer_collections.get(collection.name)
-                layer_collection.exclude = self._exclude_layer_collections[i]
-
-        # Re-apply the materials that were originally on the object and delete the temporary bake material.
-        for i in range(0, len(self._original_material_names)):
-            material = bpy.data.materials.get(self._original_material_names[i])
-            if material:
-                bpy.context.object.material_slots[i].material = material
-
-        # Reset the render engine.
+        # Remove temporary data used to bake anti-aliased mesh maps in tiles.
+        if len(self._bake_tile_origins) > 0:
+            object_index, mesh_map_type = self._bake_queue[self._bake_queue_index]
+            remove_bake_tiles(bpy.context.active_object, self._original_uv_map_name, get_meshmap_name(self._bake_objects[object_index][0], mesh_map_type))
+            self._bake_tile_origins = []
+            self._bake_output_pixels = None
+            self._bake_source_uvs = None
+
+        # Finish saving mesh maps that were already baked.
+        load_post_processed_mesh_maps(self, wait=True)
+
+        # Re-apply original materials, hide the high poly object and reset the bake objects and render engine.
+        end_object_bake(self)
+        reset_bake_objects(self)
+        bake_render_profiles.restore_render_settings(self._original_render_settings)
         bpy.context.scene.render.engine = self._original_render_engine
 
+        # Remove mesh map baking materials and group nodes.
+        clean_mesh_map_assets()
+
         # Unpause auto updates, unmark baking mesh maps toggle.
         bpy.context.scene.pause_auto_updates = False
+        bake_isolation.end_bake_isolation()
 
+        log_object_bake_times(self)
         debug_logging.log_status("Baking mesh map was manually cancelled.", self, 'INFO')
 
     def finish(self, context):
@@ -919,39 +1807,28 @@ class RYMAT_OT_batch_bake(Operator):
             wm = context.window_manager
             wm.event_timer_remove(self._timer)
 
-        # High the high poly object, and re-exclude layer collections the high poly object belongs to.
-        high_poly_object = bpy.context.scene.rymat_baking_settings.high_poly_object
-        if high_poly_object:
-            high_poly_object.hide_set(True)
-            high_poly_object.hide_render = True
-
-            view_layer_collections = bpy.context.view_layer.layer_collection.children
-            user_collections = high_poly_object.users_collection
-            for i, collection in enumerate(user_collections):
-                layer_collection = view_layer_collections.get(collection.name)
-                layer_collection.exclude = self._exclude_layer_collections[i]
-
-        # Re-apply the materials that were originally on the object.
-        for i in range(0, len(self._original_material_names)):
-            material = bpy.data.materials.get(self._original_material_names[i])
-            if material:
-                bpy.context.object.material_slots[i].material = material
+        # Wait for all mesh maps to finish post-processing and load them into their images.
+        load_post_processed_mesh_maps(self, wait=True)
 
-        # Select only the low poly object.
-        low_poly_object = bpy.context.active_object
-        if low_poly_object:
-            blender_addon_utils.select_only(low_poly_object)
+        # Re-apply original materials and hide the high poly object.
+        end_object_bake(self)
 
-        # Reset the render engine.
+        # Reset render settings and the render engine.
+        bake_render_profiles.restore_render_settings(self._original_render_settings)
         bpy.context.scene.render.engine = self._original_render_engine
 
-        # Apply mesh maps to the existing material.
-        material_layers.apply_mesh_maps()
+        # Remove mesh map baking materials and group nodes.
+        clean_mesh_map_assets()
+
+        # Apply mesh maps to the existing material of each baked object, and reset bake objects.
+        apply_bake_object_mesh_maps(self)
 
         # Unpause auto updates, mark baking mesh maps as complete.
         bpy.context.scene.pause_auto_updates = False
+        bake_isolation.end_bake_isolation()
 
         # Log the completion of baking mesh maps.
+        log_object_bake_times(self)
         end_bake_time = time.time()
         total_bake_time = end_bake_time - self._start_bake_time
         debug_logging.log_status("Baking mesh map(s) completed, total bake time: {0} seconds.".format(round(total_bake_time), 1), self, 'INFO')
@@ -1000,7 +1877,7 @@ class RYMAT_OT_open_mesh_map_folder(Operator):
 class RYMAT_OT_preview_mesh_map(Operator):
     bl_idname = "rymat.preview_mesh_map"
     bl_label = "Preview Mesh Map"
-    bl_description = "Replaces all material slots on the selected (active) object with a material used for baking the specified mesh map, then applies viewport and render settings to make the preview visible"
+    bl_description = "Replaces all material slots on the selected (active) object with a material displaying the specified baked mesh map. Mesh maps that aren't baked yet are previewed live with Cycles using the material used to bake them"
 
     mesh_map_type: StringProperty(default='AMBIENT_OCCLUSION')
 
@@ -1014,11 +1891,15 @@ class RYMAT_OT_preview_mesh_map(Operator):
 
         # Make sure there are no lingering existing mesh map assets.
         clean_mesh_map_assets()
+        remove_mesh_map_preview_material()
 
-        # Cache the render engine and material mode...
+        # Cache the render engine and viewport shading settings...
         # This allows them to be re-applied when the mesh map preview is disabled.
+        shading = bpy.context.space_data.shading
         bpy.context.scene["original_render_engine"] = bpy.context.scene.render.engine
-        bpy.context.scene["original_viewport_shading_mode"] = bpy.context.space_data.shading.type
+        bpy.context.scene["original_viewport_shading_mode"] = shading.type
+        bpy.context.scene["original_viewport_color_type"] = shading.color_type
+        bpy.context.scene["original_viewport_light"] = shading.light
 
         # Cache materials that are applied to the active object inside of the object...
         # this allows the materials to be re-applied when the mesh map preview is disabled.
@@ -1035,24 +1916,16 @@ class RYMAT_OT_preview_mesh_map(Operator):
                 else:
                     active_object["original_material_name_{0}".format(x)] = ""
 
-        # Append a material that will be used to preview the mesh map.
-        match self.mesh_map_type:
-            case 'AMBIENT_OCCLUSION':
-                mesh_map_material = blender_addon_utils.append_material('BakeAmbientOcclusion')
-
-            case 'CURVATURE':
-                mesh_map_material = blender_addon_utils.append_material('BakeCurvature')
-
-            case 'THICKNESS':
-                mesh_map_material = blender_addon_utils.append_material('BakeThickness')
-
-            case 'NORMALS':
-                mesh_map_material = blender_addon_utils.append_material('BakeNormals')
+        # Preview mesh maps that are already baked through a lightweight material displaying the baked image,
+        # only mesh maps that aren't baked yet are rendered live with Cycles.
+        mesh_map_image = get_meshmap_image(active_object.name, self.mesh_map_type)
+        if mesh_map_image == None and bpy.data.is_saved:
+            mesh_map_image = get_cached_mesh_map_image(get_meshmap_name(active_object.name, self.mesh_map_type))
 
-            case 'WORLD_SPACE_NORMALS':
-                mesh_map_material = blender_addon_utils.append_material('BakeWorldSpaceNormals')
-
-        active_object = bpy.context.active_object
+        if mesh_map_image:
+            mesh_map_material = create_mesh_map_preview_material(mesh_map_image)
+        else:
+            mesh_map_material = blender_addon_utils.append_material(get_meshmap_material_name(self.mesh_map_type))
 
         # If there is no material slots on the selected object, add one.
         if len(active_object.material_slots) <= 0:
@@ -1065,11 +1938,24 @@ class RYMAT_OT_preview_mesh_map(Operator):
                 active_object.material_slots[i].material = mesh_map_material
 
         # Apply viewport and render engine settings to allow the user to see the mesh map preview.
-        bpy.context.space_data.shading.type = 'RENDERED'
-        bpy.context.scene.render.engine = 'CYCLES'
+        if mesh_map_image:
+            baking_settings = bpy.context.scene.rymat_baking_settings
+            match baking_settings.mesh_map_preview_shading:
+                case 'SOLID':
+                    shading.type = 'SOLID'
+                    shading.color_type = 'TEXTURE'
+                    shading.light = 'FLAT'
+                case 'MATERIAL':
+                    shading.type = 'MATERIAL'
+            debug_logging.log_status("Previewing baked {0}.".format(mesh_map_image.name), self, type='INFO')
 
-        # Apply baking settings to the new material.
-        apply_baking_settings()
+        else:
+            shading.type = 'RENDERED'
+            bpy.context.scene.render.engine = 'CYCLES'
+
+            # Apply baking settings to the new material.
+            apply_baking_settings()
+            debug_logging.log_status("{0} isn't baked, previewing it live with Cycles.".format(get_meshmap_name(active_object.name, self.mesh_map_type)), self, type='INFO')
 
         return {'FINISHED'}
 
@@ -1084,6 +1970,7 @@ class RYMAT_OT_disable_mesh_map_preview(Operator):
 
     def execute(self, context):
         clean_mesh_map_assets()
+        remove_mesh_map_preview_material()
 
         # Re-apply materials and other settings used before the mesh map preview was toggled on...
         active_object = bpy.context.active_object
@@ -1119,9 +2006,111 @@ class RYMAT_OT_disable_mesh_map_preview(Operator):
             bpy.context.space_data.shading.type = scene['original_viewport_shading_mode']
             del scene['original_viewport_shading_mode']
 
+        if 'original_viewport_color_type' in scene_keys:
+            bpy.context.space_data.shading.color_type = scene['original_viewport_color_type']
+            del scene['original_viewport_color_type']
+
+        if 'original_viewport_light' in scene_keys:
+            bpy.context.space_data.shading.light = scene['original_viewport_light']
+            del scene['original_viewport_light']
+
         debug_logging.log_status("Disabled mesh map preview.", self, type='INFO')
         return {'FINISHED'}
 
+class RYMAT_OT_benchmark_bake_render_profile(Operator):
+    bl_idname = "rymat.benchmark_bake_render_profile"
+    bl_label = "Benchmark Bake Render Profile"
+    bl_description = "Bakes the specified mesh map for the active object at a small resolution using the scene's render settings, then using the optimized bake render profile, and reports both bake times"
+
+    mesh_map_type: StringProperty(default='AMBIENT_OCCLUSION')
+
+    @ classmethod
+    def poll(cls, context):
+        return context.active_object
+
+    def execute(self, context):
+        if blender_addon_utils.verify_bake_object(self) == False:
+            return {'CANCELLED'}
+
+        if bpy.app.is_job_running('OBJECT_BAKE') == True:
+            debug_logging.log_status("Bake job already in process.", self)
+            return {'CANCELLED'}
+
+        # Normal maps can't be baked without a high poly object, benchmark ambient occlusion instead.
+        mesh_map_type = self.mesh_map_type
+        if mesh_map_type == 'NORMALS':
+            mesh_map_type = 'AMBIENT_OCCLUSION'
+
+        # Remember settings changed for benchmarking.
+        scene = bpy.context.scene
+        active_object = bpy.context.active_object
+        original_material_names = [slot.material.name if slot.material else "" for slot in active_object.material_slots]
+        original_render_engine = scene.render.engine
+        original_use_selected_to_active = scene.render.bake.use_selected_to_active
+        original_margin = scene.render.bake.margin
+        scene.pause_auto_updates = True
+
+        # Apply a bake material that bakes to a small benchmarking image.
+        preload_mesh_map_assets()
+        bake_material = bpy.data.materials.get(get_meshmap_material_name(mesh_map_type))
+        benchmark_image = blender_addon_utils.create_data_image(BENCHMARK_BAKE_IMAGE_NAME, BENCHMARK_BAKE_IMAGE_SIZE, BENCHMARK_BAKE_IMAGE_SIZE, thirty_two_bit=True)
+        bake_image_node = bake_material.node_tree.nodes.get("BAKE_IMAGE")
+        bake_image_node.image = benchmark_image
+        bake_material.node_tree.nodes.active = bake_image_node
+
+        appended_material_slot = len(active_object.material_slots) <= 0
+        if appended_material_slot:
+            active_object.data.materials.append(bake_material)
+        else:
+            for material_slot in active_object.material_slots:
+                material_slot.material = bake_material
+
+        scene.render.engine = 'CYCLES'
+        scene.render.bake.use_selected_to_active = False
+        scene.render.bake.margin = 0
+        apply_baking_settings()
+        apply_mesh_map_quality(bpy.context.scene.rymat_baking_settings)
+
+        # Alternate between baking with the scene's render settings and with the bake render profile, keeping the fastest time for each.
+        bake_type = get_mesh_map_bake_type(mesh_map_type)
+        default_bake_time = math.inf
+        profiled_bake_time = math.inf
+        original_render_settings = {}
+        for i in range(0, BENCHMARK_BAKE_REPEATS):
+            start_time = time.time()
+            bpy.ops.object.bake(type=bake_type)
+            default_bake_time = min(default_bake_time, time.time() - start_time)
+
+            bake_render_profiles.apply_bake_render_profile(bake_type, original_render_settings)
+            start_time = time.time()
+            bpy.ops.object.bake(type=bake_type)
+            profiled_bake_time = min(profiled_bake_time, time.time() - start_time)
+            bake_render_profiles.restore_render_settings(original_render_settings)
+
+        # Restore the object's materials and scene settings.
+        if appended_material_slot:
+            active_object.data.materials.clear()
+        else:
+            for i, material_name in enumerate(original_material_names):
+                active_object.material_slots[i].material = bpy.data.materials.get(material_name)
+
+        bpy.data.images.remove(benchmark_image)
+        clean_mesh_map_assets()
+        scene.render.engine = original_render_engine
+        scene.render.bake.use_selected_to_active = original_use_selected_to_active
+        scene.render.bake.margin = original_margin
+        scene.pause_auto_updates = False
+
+        speed_up = default_bake_time / max(profiled_bake_time, 0.0001)
+        debug_logging.log_status("{0} bake benchmark ({1}px): scene render settings {2}s, bake render profile {3}s ({4}x faster).".format(
+            mesh_map_type,
+            BENCHMARK_BAKE_IMAGE_SIZE,
+            round(default_bake_time, 3),
+            round(profiled_bake_time, 3),
+            round(speed_up, 2)
+        ), self, type='INFO')
+        return {'FINISHED'}
+
 class RYMAT_OT_delete_mesh_map(Operator):
     bl_idname = "rymat.delete_mesh_map"
     bl_label = "Delete Mesh Map"
@@ -0,0 +1,244 @@
+# This file contains a profiler that measures the shader complexity of layers and masks in materials, to help find why a material compiles slowly or exceeds GPU texture sampler limits.
+
+import bpy
+from bpy.types import Operator
+from ..core import material_layers
+from ..core import layer_masks
+from ..core import layer_freezing
+from ..core import blender_addon_utils as bau
+from ..core import debug_logging
+from .. import preferences
+
+# Procedural texture nodes, these are evaluated per pixel and are more expensive to compile and render than most other nodes.
+PROCEDURAL_NODE_TYPES = (
+    'TEX_NOISE',
+    'TEX_VORONOI',
+    'TEX_MUSGRAVE',
+    'TEX_WAVE',
+    'TEX_MAGIC',
+    'TEX_BRICK',
+    'TEX_CHECKER',
+    'TEX_GRADIENT',
+    'TEX_WHITE_NOISE',
+    'TEX_GABOR'
+)
+
+# Node types that don't add instructions to compiled shaders.
+LAYOUT_NODE_TYPES = ('FRAME', 'REROUTE', 'GROUP_INPUT', 'GROUP_OUTPUT')
+
+# Name used for counts of layer nodes that aren't part of a material channel (i.e projection nodes).
+SHARED_NODES_NAME = "SHARED"
+
+# Complexity counts measured by the profiler, defined as (count name, label, addon preference budget property name).
+COMPLEXITY_BUDGETS = [
+    ('texture_samples', "Texture Samples", "texture_sample_budget"),
+    ('image_samplers', "Image Samplers", "image_sampler_budget"),
+    ('procedural_nodes', "Procedural Nodes", "procedural_node_budget"),
+    ('blur_nodes', "Blur Nodes", "blur_node_budget"),
+    ('nodes', "Nodes", "shader_node_budget")
+]
+
+_complexity_profiles = {}
+
+
+def new_complexity_counts():
+    '''Returns empty complexity counts.'''
+    return {
+        'texture_samples': 0,
+        'procedural_nodes': 0,
+        'blur_nodes': 0,
+        'nodes': 0,
+        'images': set()
+    }
+
+def add_complexity_counts(counts, other_counts):
+    '''Adds the provided complexity counts to the counts.'''
+    for count_name in ('texture_samples', 'procedural_nodes', 'blur_nodes', 'nodes'):
+        counts[count_name] += other_counts[count_name]
+    counts['images'] |= other_counts['images']
+
+def is_blur_node(node):
+    '''Returns true if the provided node is a blur filter node added by this add-on.'''
+    return node.bl_static_type == 'GROUP' and node.node_tree != None and node.node_tree.name.startswith("RY_") and "Blur" in node.node_tree.name
+
+def measure_node(node, counts, group_counts):
+    '''Adds the complexity of the provided node to the counts, nodes within group nodes are measured once per node group and re-used.'''
+    if node.bl_static_type in LAYOUT_NODE_TYPES:
+        return
+
+    counts['nodes'] += 1
+    match node.bl_static_type:
+        case 'TEX_IMAGE':
+            counts['texture_samples'] += 1
+            if node.image:
+                counts['images'].add(node.image.name)
+        case 'GROUP':
+            if is_blur_node(node):
+                counts['blur_nodes'] += 1
+            if node.node_tree:
+                add_complexity_counts(counts, measure_node_tree(node.node_tree, group_counts))
+        case _:
+            if node.bl_static_type in PROCEDURAL_NODE_TYPES:
+                counts['procedural_nodes'] += 1
+
+def measure_node_tree(node_tree, group_counts):
+    '''Returns the complexity counts of all nodes in the provided node tree (including nodes in group nodes).'''
+    counts = group_counts.get(node_tree.name)
+    if counts != None:
+        return counts
+
+    counts = new_complexity_counts()
+    group_counts[node_tree.name] = counts
+    for node in node_tree.nodes:
+        measure_node(node, counts, group_counts)
+    return counts
+
+def get_node_channel_name(node, static_channel_names):
+    '''Returns the static name of the material channel the provided layer node belongs to, or the shared nodes name for nodes that aren't part of a material channel.'''
+    channel_name = node.name.split('-')[0]
+    if channel_name in static_channel_names:
+        return channel_name
+    if node.parent and node.parent.name in static_channel_names:
+        return node.parent.name
+    return SHARED_NODES_NAME
+
+def profile_layer(material, layer_index, static_channel_names, group_counts):
+    '''Returns complexity counts for the layer at the provided index, in total, per material channel and for the layer's masks.'''
+    layer_profile = {
+        'total': new_complexity_counts(),
+        'channels': {},
+        'masks': new_complexity_counts()
+    }
+
+    layer_node_tree = material_layers.find_layer_node_tree(material, layer_index)
+    if layer_node_tree:
+        for node in layer_node_tree.nodes:
+            channel_name = get_node_channel_name(node, static_channel_names)
+            channel_counts = layer_profile['channels'].setdefault(channel_name, new_complexity_counts())
+            measure_node(node, channel_counts, group_counts)
+        for channel_counts in layer_profile['channels'].values():
+            add_complexity_counts(layer_profile['total'], channel_counts)
+
+    for mask_index in range(0, len(material_layers.get_layer_mask_ids(material, layer_index))):
+        mask_node_tree = layer_masks.find_mask_node_tree(material, layer_index, mask_index)
+        if mask_node_tree:
+            add_complexity_counts(layer_profile['masks'], measure_node_tree(mask_node_tree, group_counts))
+    add_complexity_counts(layer_profile['total'], layer_profile['masks'])
+    return layer_profile
+
+def profile_material(material):
+    '''Returns complexity counts for each layer in the provided material, and for all nodes compiled into the material's shader. Hidden and frozen layers aren't compiled, so they aren't included in the material total.'''
+    shader_info = bpy.context.scene.rymat_shader_info
+    static_channel_names = [bau.format_static_matchannel_name(channel.name) for channel in shader_info.material_channels]
+
+    group_counts = {}
+    material_profile = {
+        'layers': [],
+        'total': new_complexity_counts()
+    }
+
+    frozen_layer_count = layer_freezing.get_frozen_layer_count(material)
+    for layer_index in range(0, material_layers.count_layers(material)):
+        layer_profile = profile_layer(material, layer_index, static_channel_names, group_counts)
+        material_profile['layers'].append(layer_profile)
+
+        layer_node = material_layers.find_material_layer_node(material, 'LAYER', layer_index)
+        if bau.get_node_active(layer_node) and layer_index >= frozen_layer_count:
+            add_complexity_counts(material_profile['total'], layer_profile['total'])
+
+    # Image textures in the material node tree (i.e frozen layer caches) are also sampled.
+    for node in material.node_tree.nodes:
+        if node.bl_static_type == 'TEX_IMAGE' and node.name != 'BAKE_IMAGE':
+            measure_node(node, material_profile['total'], group_counts)
+
+    return material_profile
+
+def get_material_structure_signature(material):
+    '''Returns a signature of the structure of the provided material's layer stack, made of layer and mask IDs, the number of frozen layers, and node and link counts of the material, layer and mask node trees. Editing node values (i.e dragging sliders) doesn't change the signature.'''
+    layer_ids, mask_ids = material_layers.read_layer_stack_metadata(material)
+    node_trees = [material.node_tree]
+    for layer_index, layer_id in enumerate(layer_ids):
+        node_trees.append(material_layers.find_layer_node_tree(material, layer_index))
+        for mask_index in range(0, len(mask_ids.get(layer_id, []))):
+            node_trees.append(layer_masks.find_mask_node_tree(material, layer_index, mask_index))
+
+    return (
+        tuple(layer_ids),
+        tuple(tuple(mask_ids.get(layer_id, [])) for layer_id in layer_ids),
+        layer_freezing.get_frozen_layer_count(material),
+        tuple((len(node_tree.nodes), len(node_tree.links)) if node_tree else None for node_tree in node_trees)
+    )
+
+def get_material_complexity(material):
+    '''Returns the shader complexity profile of the provided material. Profiles are drawn in the user interface, so they're re-used until the structure of the material's layer stack changes (layers, masks, nodes or links are added, removed or re-linked).'''
+    structure_signature = get_material_structure_signature(material)
+    cached_profile = _complexity_profiles.get(material.name)
+    if cached_profile and cached_profile[0] == structure_signature:
+        return cached_profile[1]
+
+    material_profile = profile_material(material)
+    _complexity_profiles[material.name] = (structure_signature, material_profile)
+    return material_profile
+
+def get_complexity_count(counts, count_name):
+    '''Returns the value of the complexity count with the provided name, image samplers are counted as the number of unique images sampled.'''
+    if count_name == 'image_samplers':
+        return len(counts['images'])
+    return counts[count_name]
+
+def get_exceeded_budgets(material_profile):
+    '''Returns (label, count, budget) for each complexity budget defined in add-on preferences the provided material profile exceeds.'''
+    addon_preferences = bpy.context.preferences.addons[preferences.ADDON_NAME].preferences
+    exceeded_budgets = []
+    for count_name, label, budget_property_name in COMPLEXITY_BUDGETS:
+        count = get_complexity_count(material_profile['total'], count_name)
+        budget = getattr(addon_preferences, budget_property_name)
+        if count > budget:
+            exceeded_budgets.append((label, count, budget))
+    return exceeded_budgets
+
+def format_complexity_counts(counts):
+    '''Returns the provided complexity counts formatted for logging.'''
+    return ", ".join("{0}: {1}".format(label, get_complexity_count(counts, count_name)) for count_name, label, budget_property_name in COMPLEXITY_BUDGETS)
+
+def clear_complexity_profiles():
+    '''Clears stored shader complexity profiles.'''
+    _complexity_profiles.clear()
+
+
+#----------------------------- OPERATORS -----------------------------#
+
+
+class RYMAT_OT_profile_shader_complexity(Operator):
+    bl_idname = "rymat.profile_shader_complexity"
+    bl_label = "Profile Shader Complexity"
+    bl_description = "Counts texture samples, unique image samplers, procedural nodes, blur nodes and nodes for each layer, material channel and mask in the active material, then logs them and warns about shader complexity budgets the material exceeds"
+    bl_options = {'REGISTER'}
+
+    @ classmethod
+    def poll(cls, context):
+        return bau.verify_addon_active_material(context)
+
+    def execute(self, context):
+        active_material = bpy.context.active_object.active_material
+        clear_complexity_profiles()
+        material_profile = get_material_complexity(active_material)
+
+        for layer_index, layer_profile in enumerate(material_profile['layers']):
+            layer_node = material_layers.find_material_layer_node(active_material, 'LAYER', layer_index)
+            layer_name = layer_node.label if layer_node else str(layer_index)
+            debug_logging.log("Layer {0} ({1}) - {2}".format(layer_index, layer_name, format_complexity_counts(layer_profile['total'])))
+            for channel_name, channel_counts in layer_profile['channels'].items():
+                debug_logging.log("{0} - {1}".format(channel_name, format_complexity_counts(channel_counts)), sub_process=True)
+            if len(material_layers.get_layer_mask_ids(active_material, layer_index)) > 0:
+                debug_logging.log("Masks - {0}".format(format_complexity_counts(layer_profile['masks'])), sub_process=True)
+
+        exceeded_budgets = get_exceeded_budgets(material_profile)
+        if len(exceeded_budgets) > 0:
+            debug_logging.log_status("{0} exceeds shader complexity budgets: {1}.".format(
+                active_material.name,
+                ", ".join("{0} {1}/{2}".format(label, count, budget) for label, count, budget in exceeded_budgets)
+            ), self, type='WARNING')
+        else:
+            debug_logging.log_status("{0} shader complexity - {1}.".format(active_material.name, format_complexity_counts(material_profile['total'])), self, type='INFO')
+        return {'FINISHED'}
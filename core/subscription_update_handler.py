@@ -8,6 +8,7 @@ from ..core import mesh_map_baking
 from ..core import debug_logging
 from ..core import blender_addon_utils
 from ..core import shaders
+from ..core import update_dispatcher
 
 
 #----------------------------- SUBSCRIPTIONS -----------------------------#
@@ -52,7 +53,7 @@ def on_active_material_changed(scene):
             if bpy.types.Scene.previous_active_material_name != active_object.active_material.name:
                 sub_to_active_material_index(active_object)
                 sub_to_active_material_name(active_object)
-                material_layers.refresh_layer_stack(reason="Active material changed.", scene=scene)
+                update_dispatcher.request_update('LAYER_STACK', 'ACTIVE_MATERIAL_CHANGED', reason="Active material changed.")
                 bpy.types.Scene.previous_active_material_name = active_object.active_material.name
                 shaders.read_shader(active_object.active_material)
 
@@ -60,7 +61,7 @@ def on_active_material_changed(scene):
             if bpy.types.Scene.previous_active_material_name != "":
                 sub_to_active_material_index(active_object)
                 sub_to_active_material_name(active_object)
-                material_layers.refresh_layer_stack(reason="Active material changed.", scene=scene)
+                update_dispatcher.request_update('LAYER_STACK', 'ACTIVE_MATERIAL_CHANGED', reason="Active material changed.")
                 bpy.types.Scene.previous_active_material_name = ""
 
 def on_active_material_index_changed():
@@ -76,8 +77,7 @@ def on_active_material_index_changed():
 
         if active_object.active_material:
             if active_object.active_material.name != bpy.types.Scene.previous_active_material_name:
-                bpy.context.scene.rymat_layer_stack.selected_layer_index = 0
-                material_layers.refresh_layer_stack()
+                update_dispatcher.request_update('LAYER_STACK', 'ACTIVE_MATERIAL_INDEX_CHANGED', reason="Active material index changed.")
                 sub_to_active_material_index(active_object)
                 sub_to_active_material_name(active_object)
                 bpy.types.Scene.previous_active_material_name = active_object.active_material.name
@@ -85,14 +85,13 @@ def on_active_material_index_changed():
 
         else:
             if bpy.types.Scene.previous_active_material_name != "":
-                bpy.context.scene.rymat_layer_stack.selected_layer_index = 0
-                material_layers.refresh_layer_stack()
+                update_dispatcher.request_update('LAYER_STACK', 'ACTIVE_MATERIAL_INDEX_CHANGED', reason="Active material index changed.")
                 sub_to_active_material_index(active_object)
                 sub_to_active_material_name(active_object)
                 bpy.types.Scene.previous_active_material_name = ""
 
 def on_active_material_name_changed():
-    '''Updates layer and mask group node names associated with materials created with this add-on when the active material is renamed.'''
+    '''Updates layer, mask and mesh map group node names associated with materials created with this add-on when the active material is renamed.'''
     if bpy.context.scene.pause_auto_updates:
         return
     
@@ -100,23 +99,27 @@ def on_active_material_name_changed():
 
     previous_material_name = bpy.types.Scene.previous_active_material_name
     active_material = bpy.context.active_object.active_material
-    layer_count = material_layers.count_layers(active_material)
 
     # Rename all layer group nodes related to the renamed material.
-    for i in range(0, layer_count):
-        layer_node_tree = bpy.data.node_groups.get("{0}_{1}".format(previous_material_name, i))
+    for layer_key, mask_keys in material_layers.get_layer_stack_keys(active_material, previous_material_name):
+        layer_node_tree = bpy.data.node_groups.get(material_layers.format_layer_group_node_name(previous_material_name, layer_key))
         if layer_node_tree:
-            layer_node_tree.name = material_layers.format_layer_group_node_name(active_material.name, i)
+            layer_node_tree.name = material_layers.format_layer_group_node_name(active_material.name, layer_key)
 
         # Rename all mask group nodes related to the renamed material.
-        mask_count = layer_masks.count_masks(i, material_name=previous_material_name)
-        for c in range(0, mask_count):
-            mask_node_name = layer_masks.format_mask_name(i, c, previous_material_name)
+        for mask_key in mask_keys:
+            mask_node_name = layer_masks.format_mask_name(layer_key, mask_key, previous_material_name)
             mask_node = active_material.node_tree.nodes.get(mask_node_name)
             if mask_node:
-                mask_node.name = layer_masks.format_mask_name(i, c, active_material.name)
+                mask_node.name = layer_masks.format_mask_name(layer_key, mask_key, active_material.name)
                 mask_node.node_tree.name = mask_node.name
 
+    # Rename the mesh map node group shared by masks in the renamed material.
+    mesh_map_node_group = bpy.data.node_groups.get(material_layers.MESH_MAP_NODE_GROUP_NAME.format(previous_material_name))
+    if mesh_map_node_group:
+        mesh_map_node_group.name = material_layers.MESH_MAP_NODE_GROUP_NAME.format(active_material.name)
+
+    material_layers.invalidate_layer_node_index("renamed material")
     bpy.types.Scene.previous_active_material_name = active_material.name
     debug_logging.log("Updated group node names for all group nodes related to the renamed material.")
 
@@ -147,6 +150,11 @@ def on_active_object_name_changed():
             new_mesh_map_filepath = os.path.join(mesh_map_folder, new_mesh_map_name + ".png")
             os.rename(previous_mesh_map_filepath, new_mesh_map_filepath)
 
+        # Rename the bake hash saved with the mesh map, so the renamed mesh map can still be reused when re-baking.
+        previous_bake_hash_filepath = mesh_map_baking.get_mesh_map_bake_hash_path(previous_mesh_map_name)
+        if os.path.exists(previous_bake_hash_filepath):
+            os.rename(previous_bake_hash_filepath, mesh_map_baking.get_mesh_map_bake_hash_path(new_mesh_map_name))
+
     bpy.types.Scene.previous_object_name = bpy.context.view_layer.objects.active.name
     debug_logging.log("Updated mesh map names for renamed object.")
 
@@ -167,4 +175,4 @@ def on_active_object_changed():
             shaders.read_shader(active_object.active_material)
 
         # Refresh the number of layers in the layer stack.
-        material_layers.refresh_layer_stack("Active object changed.")
\ No newline at end of file
+        update_dispatcher.request_update('LAYER_STACK', 'ACTIVE_OBJECT_CHANGED', reason="Active object changed.")
\ No newline at end of file
@@ -0,0 +1,97 @@
+# This file contains a dispatcher that coalesces updates requested by depsgraph handlers and property subscription callbacks, running each update at most once after callbacks stop arriving.
+
+import bpy
+from ..core import material_layers
+from ..core import layer_masks
+from ..core import layer_freezing
+from ..core import debug_logging
+
+# Time (in seconds) to wait after the last requested update before running requested updates.
+# Depsgraph updates are sent continuously while dragging sliders, waiting until they stop avoids re-running updates for each step of the drag.
+UPDATE_DEBOUNCE_INTERVAL = 0.05
+
+# Updates the dispatcher can run, in the order they're run.
+# Refreshing the layer stack selects a layer, which requests refreshing mask slots, so mask slots are refreshed after the layer stack.
+DISPATCHED_UPDATES = ('LAYER_STACK', 'MASK_SLOTS', 'TRIPLANAR_SYNC', 'FROZEN_LAYERS', 'FROZEN_MASKS')
+
+_requested_updates = set()
+_running_updates = False
+_update_reasons = []
+_callbacks_received = {}
+_updates_executed = {}
+
+
+def request_update(update_name, callback_name, reason=""):
+    '''Marks the provided update as requested by the provided callback, the update runs once after callbacks stop requesting updates for the debounce interval.'''
+    _callbacks_received[callback_name] = _callbacks_received.get(callback_name, 0) + 1
+    _requested_updates.add(update_name)
+    if reason != "" and reason not in _update_reasons:
+        _update_reasons.append(reason)
+
+    # Updates requested while running updates are run in the same pass, or after the next debounce interval.
+    if _running_updates:
+        return
+
+    # Restart the debounce timer, so updates only run once requests stop arriving.
+    if bpy.app.timers.is_registered(run_requested_updates):
+        bpy.app.timers.unregister(run_requested_updates)
+    bpy.app.timers.register(run_requested_updates, first_interval=UPDATE_DEBOUNCE_INTERVAL)
+
+def run_update(update_name):
+    '''Runs the update with the provided name.'''
+    match update_name:
+        case 'LAYER_STACK':
+            material_layers.refresh_layer_stack(", ".join(_update_reasons))
+        case 'MASK_SLOTS':
+            layer_masks.refresh_mask_slots()
+        case 'TRIPLANAR_SYNC':
+            material_layers.shader_node_tree_update()
+        case 'FROZEN_LAYERS':
+            layer_freezing.update_frozen_layers()
+        case 'FROZEN_MASKS':
+            layer_freezing.update_frozen_masks()
+
+def run_requested_updates():
+    '''Runs all requested updates once, this is called by a timer after the debounce interval.'''
+    global _running_updates
+
+    # Avoid running auto updates during operations that require them to be paused (i.e mesh map baking, exporting textures).
+    if getattr(bpy.context.scene, "pause_auto_updates", False):
+        _requested_updates.clear()
+        _update_reasons.clear()
+        return None
+
+    executed_updates = []
+    _running_updates = True
+    try:
+        for update_name in DISPATCHED_UPDATES:
+            if update_name in _requested_updates:
+                _requested_updates.discard(update_name)
+                run_update(update_name)
+                _updates_executed[update_name] = _updates_executed.get(update_name, 0) + 1
+                executed_updates.append(update_name)
+    finally:
+        _running_updates = False
+        _update_reasons.clear()
+
+    debug_logging.log("Ran dispatched updates: {0} ({1} callbacks received, {2} updates executed in total).".format(
+        ", ".join(executed_updates).lower().replace('_', ' '),
+        sum(_callbacks_received.values()),
+        sum(_updates_executed.values())
+    ), sub_process=True)
+
+    # Run updates requested while running updates (if any) after another debounce interval.
+    if len(_requested_updates) > 0:
+        return UPDATE_DEBOUNCE_INTERVAL
+    return None
+
+def clear_requested_updates():
+    '''Discards all requested updates that haven't run yet.'''
+    _requested_updates.clear()
+    _update_reasons.clear()
+    if bpy.app.timers.is_registered(run_requested_updates):
+        bpy.app.timers.unregister(run_requested_updates)
+
+def get_update_dispatcher_statistics():
+    '''Returns the number of callbacks received (by callback name) and updates executed (by update name) by the update dispatcher.'''
+    return dict(_callbacks_received), dict(_updates_executed)
@@ -0,0 +1,509 @@
+# This file contains functions and operators for rasterizing mesh UVs into texel space, which is used to create UV island maps and texel coverage reports.
+
+import os
+import time
+import hashlib
+import numpy as np
+import bpy
+from bpy.types import Operator
+from ..core import blender_addon_utils as bau
+from ..core import texture_set_settings as tss
+from ..core import debug_logging
+
+# Maximum number of candidate texels tested against UV triangles at once while rasterizing.
+# This bounds peak memory use when rasterizing high resolution texel maps.
+RASTERIZE_TEXEL_BATCH_SIZE = 2000000
+
+# Maximum number of texel maps kept in memory, texel maps for 4K textures use a few hundred megabytes each.
+TEXEL_MAP_MEMORY_CACHE_SIZE = 2
+
+# Name of the folder created in the mesh map folder to store cached texel maps.
+TEXEL_MAP_CACHE_FOLDER = "Texel Map Cache"
+
+# Barycentric tolerance used to avoid gaps between texels that land exactly on shared triangle edges.
+BARYCENTRIC_EPSILON = 1e-6
+
+# Texel maps rasterized in this session, keyed by UV geometry hash.
+_texel_map_cache = {}
+
+
+#----------------------------- UV GEOMETRY FUNCTIONS -----------------------------#
+
+
+def read_uv_geometry(mesh_object):
+    '''Reads UV, triangle and vertex buffers from the evaluated mesh of the provided object. Returns None if the mesh has no UV map.'''
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    evaluated_object = mesh_object.evaluated_get(depsgraph)
+    mesh = evaluated_object.to_mesh()
+
+    uv_layer = mesh.uv_layers.active
+    if uv_layer == None:
+        evaluated_object.to_mesh_clear()
+        return None
+
+    mesh.calc_loop_triangles()
+    loop_count = len(mesh.loops)
+    triangle_count = len(mesh.loop_triangles)
+    vertex_count = len(mesh.vertices)
+
+    uvs = np.empty(loop_count * 2, dtype=np.float32)
+    uv_layer.data.foreach_get('uv', uvs)
+
+    triangle_loops = np.empty(triangle_count * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get('loops', triangle_loops)
+
+    triangle_material_indices = np.empty(triangle_count, dtype=np.int32)
+    mesh.loop_triangles.foreach_get('material_index', triangle_material_indices)
+
+    loop_vertex_indices = np.empty(loop_count, dtype=np.int32)
+    mesh.loops.foreach_get('vertex_index', loop_vertex_indices)
+
+    vertex_positions = np.empty(vertex_count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', vertex_positions)
+
+    evaluated_object.to_mesh_clear()
+
+    # Apply object rotation and scale to vertex positions so texel density is measured in world units.
+    world_matrix = np.array(mesh_object.matrix_world, dtype=np.float32)[:3, :3]
+    vertex_positions = vertex_positions.reshape(-1, 3) @ world_matrix.T
+
+    return {
+        "uvs": uvs.reshape(-1, 2),
+        "triangle_loops": triangle_loops.reshape(-1, 3),
+        "triangle_material_indices": triangle_material_indices,
+        "loop_vertex_indices": loop_vertex_indices,
+        "vertex_positions": vertex_positions
+    }
+
+def get_uv_geometry_hash(uv_geometry, width, height):
+    '''Returns a hash of the UV layout and triangulation of a mesh at the provided texel resolution.'''
+    uv_geometry_hash = hashlib.sha1()
+    uv_geometry_hash.update(np.array([width, height], dtype=np.int64).tobytes())
+    uv_geometry_hash.update(uv_geometry["uvs"].tobytes())
+    uv_geometry_hash.update(uv_geometry["triangle_loops"].tobytes())
+    return uv_geometry_hash.hexdigest()
+
+def get_uv_island_ids(uv_geometry):
+    '''Returns an island index for every triangle and the total island count. Triangles belong to the same UV island when they share a vertex with a matching UV coordinate.'''
+    uvs = uv_geometry["uvs"]
+    triangle_loops = uv_geometry["triangle_loops"]
+    if len(triangle_loops) == 0:
+        return np.empty(0, dtype=np.int32), 0
+
+    # Loops that share a vertex and UV coordinate are welded in UV space, give each welded loop group a single id.
+    rounded_uvs = np.round(uvs, 5)
+    loop_keys = np.empty(len(uvs), dtype=[('vertex', np.int32), ('u', np.float32), ('v', np.float32)])
+    loop_keys['vertex'] = uv_geometry["loop_vertex_indices"]
+    loop_keys['u'] = rounded_uvs[:, 0]
+    loop_keys['v'] = rounded_uvs[:, 1]
+    unique_keys, weld_ids = np.unique(loop_keys, return_inverse=True)
+    weld_ids = weld_ids.reshape(-1)
+
+    # Find connected welded loop groups using vectorized label propagation with pointer jumping.
+    triangle_welds = weld_ids[triangle_loops]
+    edges_a = np.concatenate((triangle_welds[:, 0], triangle_welds[:, 1]))
+    edges_b = np.concatenate((triangle_welds[:, 1], triangle_welds[:, 2]))
+    labels = np.arange(len(unique_keys))
+    while True:
+        edge_labels = np.minimum(labels[edges_a], labels[edges_b])
+        new_labels = labels.copy()
+        np.minimum.at(new_labels, edges_a, edge_labels)
+        np.minimum.at(new_labels, edges_b, edge_labels)
+        new_labels = new_labels[new_labels]
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+
+    # Compact island labels into a zero based range.
+    unique_islands, triangle_island_ids = np.unique(labels[triangle_welds[:, 0]], return_inverse=True)
+    return triangle_island_ids.reshape(-1).astype(np.int32), len(unique_islands)
+
+
+#----------------------------- TEXEL MAP FUNCTIONS -----------------------------#
+
+
+def rasterize_uv_triangles(uv_geometry, width, height):
+    '''Rasterizes UV triangles into texel space. Returns the triangle id (-1 for uncovered texels), barycentric coordinates and the number of overlapping triangles for every texel.'''
+    texel_count = width * height
+    triangle_ids = np.full(texel_count, -1, dtype=np.int32)
+    barycentrics = np.zeros((texel_count, 3), dtype=np.float32)
+    overlap_counts = np.zeros(texel_count, dtype=np.uint16)
+
+    triangle_loops = uv_geometry["triangle_loops"]
+    if len(triangle_loops) == 0:
+        return triangle_ids.reshape(height, width), barycentrics.reshape(height, width, 3), overlap_counts.reshape(height, width)
+
+    # Convert UV coordinates into texel space, texel centers sit at half texel offsets.
+    texel_uvs = uv_geometry["uvs"].astype(np.float64) * (width, height)
+    p0 = texel_uvs[triangle_loops[:, 0]]
+    p1 = texel_uvs[triangle_loops[:, 1]]
+    p2 = texel_uvs[triangle_loops[:, 2]]
+    edge_0 = p1 - p0
+    edge_1 = p2 - p0
+    denominators = edge_0[:, 0] * edge_1[:, 1] - edge_1[:, 0] * edge_0[:, 1]
+
+    # Calculate the texel bounds of each triangle clamped to the image, degenerate triangles cover no texels.
+    bounds_min = np.ceil(np.minimum(np.minimum(p0, p1), p2) - 0.5).astype(np.int64)
+    bounds_max = np.floor(np.maximum(np.maximum(p0, p1), p2) - 0.5).astype(np.int64)
+    bounds_min = np.maximum(bounds_min, 0)
+    bounds_max = np.minimum(bounds_max, (width - 1, height - 1))
+    box_widths = np.maximum(bounds_max[:, 0] - bounds_min[:, 0] + 1, 0)
+    box_heights = np.maximum(bounds_max[:, 1] - bounds_min[:, 1] + 1, 0)
+    candidate_counts = box_widths * box_heights
+    candidate_counts[np.abs(denominators) < 1e-12] = 0
+
+    # Test candidate texels in batches of whole triangles to keep memory bounded.
+    cumulative_counts = np.cumsum(candidate_counts)
+    triangle_count = len(triangle_loops)
+    start = 0
+    while start < triangle_count:
+        batch_offset = cumulative_counts[start - 1] if start > 0 else 0
+        end = int(np.searchsorted(cumulative_counts, batch_offset + RASTERIZE_TEXEL_BATCH_SIZE, side='right'))
+        end = min(max(end, start + 1), triangle_count)
+
+        counts = candidate_counts[start:end]
+        total_candidates = int(counts.sum())
+        if total_candidates > 0:
+            batch_triangles = np.repeat(np.arange(start, end), counts)
+            local_offsets = np.arange(total_candidates) - np.repeat(np.cumsum(counts) - counts, counts)
+            candidate_box_widths = np.repeat(box_widths[start:end], counts)
+            x = np.repeat(bounds_min[start:end, 0], counts) + local_offsets % candidate_box_widths
+            y = np.repeat(bounds_min[start:end, 1], counts) + local_offsets // candidate_box_widths
+
+            vx = x + 0.5 - p0[batch_triangles, 0]
+            vy = y + 0.5 - p0[batch_triangles, 1]
+            e0 = edge_0[batch_triangles]
+            e1 = edge_1[batch_triangles]
+            d = denominators[batch_triangles]
+            b1 = (vx * e1[:, 1] - e1[:, 0] * vy) / d
+            b2 = (e0[:, 0] * vy - vx * e0[:, 1]) / d
+            b0 = 1.0 - b1 - b2
+
+            inside = (b0 >= -BARYCENTRIC_EPSILON) & (b1 >= -BARYCENTRIC_EPSILON) & (b2 >= -BARYCENTRIC_EPSILON)
+            texel_indices = (y * width + x)[inside]
+            triangle_ids[texel_indices] = batch_triangles[inside]
+            barycentrics[texel_indices] = np.stack((b0[inside], b1[inside], b2[inside]), axis=-1)
+
+            # Only count texels strictly inside triangles as hits, so texels on edges shared by neighbouring triangles aren't reported as overlaps.
+            strictly_inside = (b0 > BARYCENTRIC_EPSILON) & (b1 > BARYCENTRIC_EPSILON) & (b2 > BARYCENTRIC_EPSILON)
+            hit_texels, hit_counts = np.unique((y * width + x)[strictly_inside], return_counts=True)
+            overlap_counts[hit_texels] += hit_counts.astype(np.uint16)
+
+        start = end
+
+    return triangle_ids.reshape(height, width), barycentrics.reshape(height, width, 3), overlap_counts.reshape(height, width)
+
+def get_texel_map_cache_path(uv_geometry_hash):
+    '''Returns the file path for a cached texel map with the provided UV geometry hash. Returns an empty string if the blend file isn't saved.'''
+    if not bau.check_blend_saved():
+        return ""
+
+    mesh_map_folder = bau.get_texture_folder_path(folder='MESH_MAPS')
+    cache_folder = os.path.join(mesh_map_folder, TEXEL_MAP_CACHE_FOLDER)
+    if os.path.exists(cache_folder) == False:
+        os.mkdir(cache_folder)
+    return os.path.join(cache_folder, "{0}.npz".format(uv_geometry_hash))
+
+def get_texel_map(mesh_object, width, height):
+    '''Returns the texel map for the provided object at the provided resolution. Texel maps are read from the memory or disk cache when the UV geometry is unchanged, otherwise they are rasterized and cached.'''
+    uv_geometry = read_uv_geometry(mesh_object)
+    if uv_geometry == None:
+        return None
+
+    uv_geometry_hash = get_uv_geometry_hash(uv_geometry, width, height)
+
+    # Use a texel map already in memory.
+    texel_map = _texel_map_cache.get(uv_geometry_hash)
+    if texel_map:
+        debug_logging.log("Using texel map from memory for: {0}".format(mesh_object.name), sub_process=True)
+        texel_map["uv_geometry"] = uv_geometry
+        return texel_map
+
+    # Read a texel map cached to disk.
+    start_time = time.time()
+    cache_path = get_texel_map_cache_path(uv_geometry_hash)
+    if cache_path != "" and os.path.exists(cache_path):
+        with np.load(cache_path) as cached_data:
+            texel_map = {
+                "hash": uv_geometry_hash,
+                "triangle_ids": cached_data["triangle_ids"],
+                "barycentrics": cached_data["barycentrics"],
+                "overlap_counts": cached_data["overlap_counts"]
+            }
+        debug_logging.log("Loaded cached texel map for {0} in {1} seconds.".format(mesh_object.name, round(time.time() - start_time, 3)))
+
+    # Rasterize a new texel map and cache it to disk.
+    else:
+        triangle_ids, barycentrics, overlap_counts = rasterize_uv_triangles(uv_geometry, width, height)
+        texel_map = {
+            "hash": uv_geometry_hash,
+            "triangle_ids": triangle_ids,
+            "barycentrics": barycentrics,
+            "overlap_counts": overlap_counts
+        }
+        debug_logging.log("Rasterized texel map for {0} in {1} seconds.".format(mesh_object.name, round(time.time() - start_time, 3)))
+
+        if cache_path != "":
+            np.savez_compressed(cache_path, triangle_ids=triangle_ids, barycentrics=barycentrics, overlap_counts=overlap_counts)
+
+    # Keep the texel map in memory, removing the oldest texel maps from memory.
+    while len(_texel_map_cache) >= TEXEL_MAP_MEMORY_CACHE_SIZE:
+        _texel_map_cache.pop(next(iter(_texel_map_cache)))
+    _texel_map_cache[uv_geometry_hash] = texel_map
+
+    texel_map["uv_geometry"] = uv_geometry
+    return texel_map
+
+def clear_texel_map_cache():
+    '''Removes all texel maps held in memory.'''
+    _texel_map_cache.clear()
+
+
+#----------------------------- UV PADDING FUNCTIONS -----------------------------#
+
+
+def get_uv_coverage_mask(texel_map, material_index=-1):
+    '''Returns a boolean (height, width) array marking texels covered by UVs. If a material index is provided, only texels covered by triangles using that material are marked.'''
+    triangle_ids = texel_map["triangle_ids"]
+    coverage_mask = triangle_ids >= 0
+    if material_index >= 0:
+        triangle_material_indices = texel_map["uv_geometry"]["triangle_material_indices"]
+        coverage_mask[coverage_mask] = triangle_material_indices[triangle_ids[coverage_mask]] == material_index
+    return coverage_mask
+
+def shift_texels(texels, offset_y, offset_x, fill_value, shifted_texels):
+    '''Writes the provided (height, width) array shifted by the provided texel offset into shifted_texels, filling texels shifted in from outside the image.'''
+    height, width = texels.shape
+    shifted_texels.fill(fill_value)
+    source_y = slice(max(0, -offset_y), min(height, height - offset_y))
+    source_x = slice(max(0, -offset_x), min(width, width - offset_x))
+    target_y = slice(max(0, offset_y), min(height, height + offset_y))
+    target_x = slice(max(0, offset_x), min(width, width + offset_x))
+    shifted_texels[target_y, target_x] = texels[source_y, source_x]
+
+def pad_uv_islands(pixels, coverage_mask, padding):
+    '''Extends pixels on the edges of UV islands outwards into uncovered pixels up to the provided padding distance (in pixels) using a jump flood. Pixels are provided as a (height, width, channels) array and edited in place.'''
+    height, width = coverage_mask.shape
+    if padding <= 0 or not np.any(coverage_mask) or np.all(coverage_mask):
+        return pixels
+
+    # Each texel stores the coordinates of the nearest covered texel found so far, covered texels are their own nearest texel.
+    texel_y, texel_x = np.indices((height, width), dtype=np.int32)
+    nearest_x = np.where(coverage_mask, texel_x, -1).astype(np.int32)
+    nearest_y = np.where(coverage_mask, texel_y, -1).astype(np.int32)
+    nearest_distances = np.where(coverage_mask, 0, np.iinfo(np.int32).max).astype(np.int32)
+
+    candidate_x = np.empty_like(nearest_x)
+    candidate_y = np.empty_like(nearest_y)
+
+    # Jump flood with halving step sizes, starting from the smallest power of two that covers the padding distance.
+    # A final single texel step is repeated to correct the small errors jump flooding can make.
+    step_sizes = []
+    step = 1 << int(np.ceil(np.log2(max(padding, 1))))
+    while step >= 1:
+        step_sizes.append(step)
+        step //= 2
+    step_sizes.append(1)
+
+    for step in step_sizes:
+        for offset_y in (-step, 0, step):
+            for offset_x in (-step, 0, step):
+                if offset_x == 0 and offset_y == 0:
+                    continue
+                shift_texels(nearest_x, offset_y, offset_x, -1, candidate_x)
+                shift_texels(nearest_y, offset_y, offset_x, -1, candidate_y)
+                candidate_distances = (candidate_x - texel_x) ** 2 + (candidate_y - texel_y) ** 2
+                closer = (candidate_x >= 0) & (candidate_distances < nearest_distances)
+                nearest_x[closer] = candidate_x[closer]
+                nearest_y[closer] = candidate_y[closer]
+                nearest_distances[closer] = candidate_distances[closer]
+
+    # Copy pixels from the nearest covered texel into uncovered texels within the padding distance.
+    padded_texels = (~coverage_mask) & (nearest_distances <= padding * padding)
+    pixels[padded_texels] = pixels[nearest_y[padded_texels], nearest_x[padded_texels]]
+    return pixels
+
+def pad_image_uv_islands(image, mesh_object, padding, material_index=-1):
+    '''Pads UV islands in the provided image using the UV coverage of the active UV map of the provided object.'''
+    start_time = time.time()
+    width, height = image.size
+    texel_map = get_texel_map(mesh_object, width, height)
+    if texel_map == None:
+        debug_logging.log("Skipped UV padding for {0}, {1} has no UV map.".format(image.name, mesh_object.name), message_type='WARNING')
+        return
+
+    pixels = np.empty(width * height * image.channels, dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    pixels = pixels.reshape(height, width, image.channels)
+    pad_uv_islands(pixels, get_uv_coverage_mask(texel_map, material_index), padding)
+    image.pixels.foreach_set(pixels.reshape(-1))
+    debug_logging.log("Padded UV islands for {0} in {1} seconds.".format(image.name, round(time.time() - start_time, 3)), sub_process=True)
+
+
+#----------------------------- ISLAND MAP & COVERAGE FUNCTIONS -----------------------------#
+
+
+def get_island_id_map_name(mesh_name):
+    '''Returns the image name for the UV island ID map of the provided mesh.'''
+    return "{0}_IslandID".format(mesh_name)
+
+def get_island_colors(island_count):
+    '''Returns a distinct RGB color for each UV island index.'''
+    # Step through hues with the golden ratio so neighbouring island indices are easy to tell apart.
+    island_indices = np.arange(island_count, dtype=np.float64)
+    colors = np.empty((island_count, 3), dtype=np.float32)
+    colors[:, 0] = (island_indices * 0.618033988749895 + 0.1) % 1.0
+    colors[:, 1] = (island_indices * 0.381966011250105 + 0.5) % 1.0
+    colors[:, 2] = (island_indices * 0.7548776662466927 + 0.3) % 1.0
+    return colors
+
+def create_island_id_map(mesh_object, width, height):
+    '''Creates (or replaces) an image that stores a distinct color for each UV island of the provided object. Returns None if the object has no UV map.'''
+    texel_map = get_texel_map(mesh_object, width, height)
+    if texel_map == None:
+        return None
+
+    triangle_island_ids, island_count = get_uv_island_ids(texel_map["uv_geometry"])
+    triangle_ids = texel_map["triangle_ids"].reshape(-1)
+    covered = triangle_ids >= 0
+
+    island_colors = get_island_colors(island_count)
+    pixels = np.zeros((width * height, 4), dtype=np.float32)
+    pixels[covered, :3] = island_colors[triangle_island_ids[triangle_ids[covered]]]
+    pixels[:, 3] = 1.0
+
+    island_map_image = bau.create_data_image(
+        get_island_id_map_name(mesh_object.name),
+        image_width=width,
+        image_height=height,
+        alpha_channel=False,
+        thirty_two_bit=False,
+        data=True,
+        delete_existing=True
+    )
+    island_map_image.pixels.foreach_set(pixels.reshape(-1))
+    island_map_image.colorspace_settings.name = 'Non-Color'
+    island_map_image.use_fake_user = True
+
+    # Save the island map next to the other mesh maps.
+    if bau.check_blend_saved():
+        mesh_map_folder = bau.get_texture_folder_path(folder='MESH_MAPS')
+        island_map_image.filepath_raw = "{0}/{1}.{2}".format(mesh_map_folder, island_map_image.name, 'png')
+        island_map_image.file_format = 'PNG'
+        island_map_image.save()
+
+    debug_logging.log("Created UV island ID map with {0} islands for: {1}".format(island_count, mesh_object.name))
+    return island_map_image
+
+def get_uv_coverage_report(texel_map):
+    '''Returns texel coverage, overlap and texel density statistics for the provided texel map.'''
+    uv_geometry = texel_map["uv_geometry"]
+    triangle_ids = texel_map["triangle_ids"]
+    height, width = triangle_ids.shape
+    texel_count = width * height
+
+    # Measure UV area in texels and surface area in world units for each triangle.
+    triangle_loops = uv_geometry["triangle_loops"]
+    texel_uvs = uv_geometry["uvs"].astype(np.float64) * (width, height)
+    uv_edge_0 = texel_uvs[triangle_loops[:, 1]] - texel_uvs[triangle_loops[:, 0]]
+    uv_edge_1 = texel_uvs[triangle_loops[:, 2]] - texel_uvs[triangle_loops[:, 0]]
+    uv_areas = 0.5 * np.abs(uv_edge_0[:, 0] * uv_edge_1[:, 1] - uv_edge_1[:, 0] * uv_edge_0[:, 1])
+
+    triangle_positions = uv_geometry["vertex_positions"][uv_geometry["loop_vertex_indices"][triangle_loops]].astype(np.float64)
+    surface_areas = 0.5 * np.linalg.norm(np.cross(triangle_positions[:, 1] - triangle_positions[:, 0], triangle_positions[:, 2] - triangle_positions[:, 0]), axis=1)
+
+    # Texel density is the square root of texels per square world unit, which gives texels per world unit.
+    triangle_island_ids, island_count = get_uv_island_ids(uv_geometry)
+    island_uv_areas = np.bincount(triangle_island_ids, weights=uv_areas, minlength=island_count)
+    island_surface_areas = np.bincount(triangle_island_ids, weights=surface_areas, minlength=island_count)
+    valid_islands = island_surface_areas > 0
+    island_densities = np.zeros(island_count, dtype=np.float64)
+    island_densities[valid_islands] = np.sqrt(island_uv_areas[valid_islands] / island_surface_areas[valid_islands])
+
+    total_surface_area = surface_areas.sum()
+    average_density = 0.0
+    if total_surface_area > 0:
+        average_density = float(np.sqrt(uv_areas.sum() / total_surface_area))
+
+    covered_texels = int(np.count_nonzero(triangle_ids >= 0))
+    overlapping_texels = int(np.count_nonzero(texel_map["overlap_counts"] > 1))
+    return {
+        "width": width,
+        "height": height,
+        "island_count": island_count,
+        "coverage": covered_texels / texel_count,
+        "overlap": overlapping_texels / texel_count,
+        "average_texel_density": average_density,
+        "min_texel_density": float(island_densities[valid_islands].min()) if np.any(valid_islands) else 0.0,
+        "max_texel_density": float(island_densities[valid_islands].max()) if np.any(valid_islands) else 0.0
+    }
+
+
+#----------------------------- OPERATORS -----------------------------#
+
+
+class RYMAT_OT_bake_island_id_map(Operator):
+    bl_idname = "rymat.bake_island_id_map"
+    bl_label = "Bake UV Island ID Map"
+    bl_description = "Creates an image for the active object that fills each UV island with a distinct color at the texture set resolution. The image can be used as a mask to select individual UV islands"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    # Disable when there is no active object.
+    @ classmethod
+    def poll(cls, context):
+        return context.active_object
+
+    def execute(self, context):
+        active_object = context.active_object
+        if active_object.type != 'MESH':
+            debug_logging.log_status("Active object must be a mesh to bake a UV island ID map.", self, type='ERROR')
+            return {'FINISHED'}
+
+        island_map_image = create_island_id_map(active_object, tss.get_texture_width(), tss.get_texture_height())
+        if island_map_image == None:
+            debug_logging.log_status("Active object has no UV map.", self, type='ERROR')
+            return {'FINISHED'}
+
+        debug_logging.log_status("Created UV island ID map: {0}".format(island_map_image.name), self, type='INFO')
+        return {'FINISHED'}
+
+class RYMAT_OT_report_uv_coverage(Operator):
+    bl_idname = "rymat.report_uv_coverage"
+    bl_label = "Report UV Coverage"
+    bl_description = "Reports the percentage of texels covered by UVs, overlapping UVs, UV island count and texel density for the active object at the texture set resolution"
+    bl_options = {'REGISTER'}
+
+    # Disable when there is no active object.
+    @ classmethod
+    def poll(cls, context):
+        return context.active_object
+
+    def execute(self, context):
+        active_object = context.active_object
+        if active_object.type != 'MESH':
+            debug_logging.log_status("Active object must be a mesh to report UV coverage.", self, type='ERROR')
+            return {'FINISHED'}
+
+        texel_map = get_texel_map(active_object, tss.get_texture_width(), tss.get_texture_height())
+        if texel_map == None:
+            debug_logging.log_status("Active object has no UV map.", self, type='ERROR')
+            return {'FINISHED'}
+
+        report = get_uv_coverage_report(texel_map)
+        debug_logging.log("UV coverage report for {0} ({1}x{2}):".format(active_object.name, report["width"], report["height"]))
+        debug_logging.log("    UV Islands: {0}".format(report["island_count"]))
+        debug_logging.log("    Texel Coverage: {0}%".format(round(report["coverage"] * 100, 2)))
+        debug_logging.log("    Overlapping Texels: {0}%".format(round(report["overlap"] * 100, 2)))
+        debug_logging.log("    Average Texel Density: {0} px/m".format(round(report["average_texel_density"], 2)))
+        debug_logging.log("    Island Texel Density Range: {0} - {1} px/m".format(round(report["min_texel_density"], 2), round(report["max_texel_density"], 2)))
+        debug_logging.log_status(
+            "UV coverage: {0}%, overlap: {1}%, islands: {2}, texel density: {3} px/m.".format(
+                round(report["coverage"] * 100, 2),
+                round(report["overlap"] * 100, 2),
+                report["island_count"],
+                round(report["average_texel_density"], 2)
+            ),
+            self,
+            type='INFO'
+        )
+        return {'FINISHED'}
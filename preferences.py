@@ -67,6 +67,47 @@ class AddonPreferences(AddonPreferences):
         default=True
     )
 
+    show_shader_complexity: BoolProperty(
+        name="Show Shader Complexity",
+        description="If on, the number of texture samples used by each layer will be shown in the layer stack, and warnings will be shown when the active material exceeds shader complexity budgets",
+        default=True
+    )
+
+    texture_sample_budget: IntProperty(
+        name="Texture Sample Budget",
+        description="Maximum number of texture samples compiled into a material's shader before a warning is shown. Triplanar projection uses 3 samples per image, hex-grid triplanar projection uses 9",
+        default=64,
+        min=1
+    )
+
+    image_sampler_budget: IntProperty(
+        name="Image Sampler Budget",
+        description="Maximum number of unique images sampled by a material's shader before a warning is shown. Each unique image uses a GPU texture sampler, shaders that use more samplers than the GPU supports fail to compile",
+        default=24,
+        min=1
+    )
+
+    procedural_node_budget: IntProperty(
+        name="Procedural Node Budget",
+        description="Maximum number of procedural texture nodes (noise, voronoi, etc) compiled into a material's shader before a warning is shown",
+        default=32,
+        min=1
+    )
+
+    blur_node_budget: IntProperty(
+        name="Blur Node Budget",
+        description="Maximum number of blur filter nodes compiled into a material's shader before a warning is shown",
+        default=8,
+        min=1
+    )
+
+    shader_node_budget: IntProperty(
+        name="Shader Node Budget",
+        description="Maximum number of nodes (including nodes inside node groups) compiled into a material's shader before a warning is shown",
+        default=2000,
+        min=1
+    )
+
     #----------------------------- ADDON PREFERENCE MENU -----------------------------#
     def draw(self, context):
         layout = self.layout
@@ -79,4 +120,13 @@ class AddonPreferences(AddonPreferences):
         # Draw other preferences.
         layout.label(text="Other")
         layout.prop(self, "beginner_help")
-        layout.prop(self, "experimental_features")
\ No newline at end of file
+        layout.prop(self, "experimental_features")
+
+        # Draw shader complexity budgets.
+        layout.label(text="Shader Complexity")
+        layout.prop(self, "show_shader_complexity")
+        layout.prop(self, "texture_sample_budget")
+        layout.prop(self, "image_sampler_budget")
+        layout.prop(self, "procedural_node_budget")
+        layout.prop(self, "blur_node_budget")
+        layout.prop(self, "shader_node_budget")
\ No newline at end of file
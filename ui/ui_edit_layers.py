@@ -10,6 +10,8 @@ from ..core import texture_set_settings as tss
 from ..core import shaders
 from ..core import blender_addon_utils as bau
 from ..core import material_filters
+from ..core import layer_freezing
+from ..core import shader_complexity
 from .. import preferences
 
 STANDARD_UI_SPLIT = 0.4
@@ -469,8 +471,9 @@ def draw_mask_projection(layout):
 def draw_mask_mesh_maps(layout, selected_layer_index, selected_mask_index):
     '''Draws un-editable mesh maps used in the selected mask.'''
     drew_title = False
+    active_material = bpy.context.active_object.active_material
     for mesh_map_name in mesh_map_baking.MESH_MAP_TYPES:
-        mesh_map_texture_node = layer_masks.get_mask_node(mesh_map_name, selected_layer_index, selected_mask_index)
+        mesh_map_texture_node = material_layers.get_mask_mesh_map_texture_node(active_material, selected_layer_index, selected_mask_index, mesh_map_name)
         if mesh_map_texture_node:
             if not drew_title:
                 row = layout.row()
@@ -675,6 +678,10 @@ class MaterialPropertiesPanel(Panel):
         addon_preferences = bpy.context.preferences.addons[preferences.ADDON_NAME].preferences
         if addon_preferences.experimental_features:
             row.operator("rymat.merge_with_layer_below", icon='TRIA_DOWN_BAR', text="")
+        if layer_freezing.get_frozen_layer_data(context.active_object.active_material) == None:
+            row.operator("rymat.freeze_layers", icon='FREEZE', text="")
+        else:
+            row.operator("rymat.unfreeze_layers", icon='FREEZE', text="", depress=True)
         row.operator("rymat.isolate_material_channel", text="", icon='MATERIAL')
         row.operator("rymat.show_compiled_material", text="", icon='SHADING_RENDERED')
         row.operator("rymat.delete_layer", icon='TRASH', text="")
@@ -691,6 +698,15 @@ class MaterialPropertiesPanel(Panel):
             sort_reverse=True
         )
 
+        # Draw warnings for shader complexity budgets the active material exceeds.
+        if addon_preferences.show_shader_complexity and bau.verify_addon_material(context.active_object.active_material):
+            material_profile = shader_complexity.get_material_complexity(context.active_object.active_material)
+            for label, count, budget in shader_complexity.get_exceeded_budgets(material_profile):
+                row = layout.row(align=True)
+                row.alert = True
+                row.label(text="{0} over budget ({1} / {2})".format(label, count, budget), icon='ERROR')
+                row.operator("rymat.profile_shader_complexity", text="", icon='INFO')
+
         # Draw properties for the selected material layer.
         layer_count = material_layers.count_layers()
         if layer_count > 0:
@@ -773,6 +789,7 @@ class RYMAT_OT_add_layer_mask_menu(Operator):
         col.operator("rymat.add_edge_wear_mask", text="Edge Wear")
         col.operator("rymat.add_ambient_occlusion_mask", text="Ambient Occlusion")
         col.operator("rymat.add_curvature_mask", text="Curvature")
+        col.operator("rymat.add_island_id_mask", text="Island ID")
         col.operator("rymat.add_thickness_mask", text="Thickness")
         col.operator("rymat.add_world_space_normals_mask", text="World Space Normals")
 
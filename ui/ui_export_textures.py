@@ -90,10 +90,20 @@ def draw_export_textures_ui(self, context):
     row = second_column.row()
     row.prop(baking_settings, "uv_padding", text="")
 
+    row = first_column.row()
+    row.label(text="Post Bake Padding")
+    row = second_column.row()
+    row.prop(baking_settings, "post_bake_padding", text="")
+
     row = first_column.row()
     row.label(text="Samples")
     row = second_column.row()
     row.prop(texture_export_settings, "samples", text="")
+
+    row = first_column.row()
+    row.label(text="Denoise")
+    row = second_column.row()
+    row.prop(texture_export_settings, "denoise", text="")
     
     active_object = bpy.context.active_object
     if active_object:
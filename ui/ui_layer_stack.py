@@ -5,6 +5,9 @@ from bpy.types import Menu
 import bpy.utils.previews       # Imported for loading texture previews as icons.
 from ..core import material_layers
 from ..core import layer_masks
+from ..core import layer_freezing
+from ..core import shader_complexity
+from .. import preferences
 from ..core import blender_addon_utils
 
 class LayerBlendingModeSubMenu(Menu):
@@ -12,7 +15,7 @@ class LayerBlendingModeSubMenu(Menu):
     bl_label = "Layer Blending Mode Sub Menu"
 
     def draw(self, context):
-        layer_index = int(context.layer_node.name)
+        layer_index = material_layers.find_layer_index(context.active_object.active_material, context.layer_node.name)
         layout = self.layout
 
         operator = layout.operator("rymat.set_layer_blending_mode", text="Mix")
@@ -107,8 +110,7 @@ class RYMAT_UL_layer_list(bpy.types.UIList):
         self.use_filter_reverse = True
 
         if self.layout_type in {'DEFAULT', 'COMPACT'}:
-            layers = bpy.context.scene.rymat_layers
-            item_index = layers.find(item.name)
+            item_index = index
             layer_node = material_layers.get_material_layer_node('LAYER', item_index)
 
             # Don't draw layer properties if there is no layer node.
@@ -130,6 +132,10 @@ class RYMAT_UL_layer_list(bpy.types.UIList):
                 operator = row.operator("rymat.toggle_hide_layer", text="", emboss=False, icon='HIDE_ON')
                 operator.layer_index = item_index
 
+            # If the layer is replaced by frozen layer cache images, draw a freeze icon.
+            if layer_freezing.is_layer_frozen(context.active_object.active_material, item_index):
+                row.label(text="", icon='FREEZE')
+
             # If the layer is masked, draw a mask icon.
             mask_node = layer_masks.get_mask_node('MASK', item_index, 0)
             if mask_node:
@@ -140,6 +146,13 @@ class RYMAT_UL_layer_list(bpy.types.UIList):
 
             # Draw layer opacity.
             row = second_column.row(align=True)
+
+            # Draw the number of texture samples the layer uses.
+            addon_preferences = bpy.context.preferences.addons[preferences.ADDON_NAME].preferences
+            if addon_preferences.show_shader_complexity:
+                material_profile = shader_complexity.get_material_complexity(context.active_object.active_material)
+                if item_index < len(material_profile['layers']):
+                    row.label(text=str(material_profile['layers'][item_index]['total']['texture_samples']), icon='TEXTURE')
             selected_material_channel_name = bpy.context.scene.rymat_layer_stack.selected_material_channel
             opacity_layer_node = material_layers.get_material_layer_node(
                 'OPACITY', 
@@ -64,6 +64,7 @@ def draw_mesh_map_previews(layout):
     row.alignment = 'RIGHT'
     row.scale_x = 1.5
     row.scale_y = 1.5
+    row.prop(bpy.context.scene.rymat_baking_settings, "mesh_map_preview_shading", text="")
     row.operator("rymat.disable_mesh_map_preview", text="", icon='BACK')
 
     # Draw an operator to preview all mesh maps.
@@ -78,6 +79,16 @@ def draw_mesh_map_previews(layout):
             operator = row.operator("rymat.preview_mesh_map", text=mesh_map_name)
             operator.mesh_map_type = mesh_map_type
 
+def draw_uv_island_tools(layout):
+    '''Draws operators for creating UV island maps and reporting UV coverage.'''
+    row = layout.row()
+    row.separator()
+    layout.label(text="UV ISLANDS")
+
+    row = layout.row(align=True)
+    row.operator("rymat.bake_island_id_map", text="Bake Island ID Map")
+    row.operator("rymat.report_uv_coverage", text="UV Coverage Report")
+
 def draw_mesh_map_settings(layout, baking_settings):
     '''Draws settings for mesh map baking.'''
 
@@ -93,6 +104,18 @@ def draw_mesh_map_settings(layout, baking_settings):
     first_column = split.column()
     second_column = split.column()
 
+    row = first_column.row()
+    row.label(text="Cage Upscale")
+    row = second_column.row(align=True)
+    row.prop(baking_settings, "cage_upscale", text="")
+    row.prop(baking_settings, "cage_relative_to_bounding_box", text="", icon='OBJECT_ORIGIN')
+    row.prop(baking_settings, "cage_average_split_normals", text="", icon='NORMALS_VERTEX_FACE')
+
+    row = first_column.row()
+    row.label(text="Bake Objects")
+    row = second_column.row()
+    row.prop(baking_settings, "batch_bake_objects", text="")
+
     match baking_settings.cage_mode:
         case 'NO_CAGE':
             row = first_column.row()
@@ -101,15 +124,18 @@ def draw_mesh_map_settings(layout, baking_settings):
             row.prop(bpy.context.scene.render.bake, "cage_extrusion", text="")
 
         case 'MANUAL_CAGE':
-            row = first_column.row()
-            row.label(text="Cage Object")
-            row = second_column.row(align=True)
-            row.prop(bpy.context.scene.render.bake, "cage_object", text="")
-    
-    row = first_column.row()
-    row.label(text="High Poly Object")
-    row = second_column.row()
-    row.prop(baking_settings, "high_poly_object", text="", slider=True)
+            if baking_settings.batch_bake_objects == 'ACTIVE_OBJECT':
+                row = first_column.row()
+                row.label(text="Cage Object")
+                row = second_column.row(align=True)
+                row.prop(bpy.context.scene.render.bake, "cage_object", text="")
+
+    # High poly and cage objects are paired to selected objects by name suffix when baking selected objects.
+    if baking_settings.batch_bake_objects == 'ACTIVE_OBJECT':
+        row = first_column.row()
+        row.label(text="High Poly Object")
+        row = second_column.row()
+        row.prop(baking_settings, "high_poly_object", text="", slider=True)
 
     layout.separator()
     row = layout.row()
@@ -136,6 +162,16 @@ def draw_mesh_map_settings(layout, baking_settings):
     row = second_column.row()
     row.prop(baking_settings, "mesh_map_upscaling_multiplier", text="")
 
+    row = first_column.row()
+    row.label(text="AA Filter")
+    row = second_column.row()
+    row.prop(baking_settings, "mesh_map_anti_aliasing_filter", text="")
+
+    row = first_column.row()
+    row.label(text="AA Tile Size")
+    row = second_column.row()
+    row.prop(baking_settings, "mesh_map_bake_tile_size", text="")
+
     row = first_column.row()
     row.label(text="Mesh Map Quality")
     row = second_column.row()
@@ -146,6 +182,32 @@ def draw_mesh_map_settings(layout, baking_settings):
     row = second_column.row()
     row.prop(baking_settings, "uv_padding", text="")
 
+    row = first_column.row()
+    row.label(text="Post Bake Padding")
+    row = second_column.row()
+    row.prop(baking_settings, "post_bake_padding", text="")
+
+    row = first_column.row()
+    row.label(text="Denoise")
+    row = second_column.row()
+    row.prop(baking_settings, "denoise_mesh_maps", text="")
+
+    row = first_column.row()
+    row.label(text="Use Bake Cache")
+    row = second_column.row()
+    row.prop(baking_settings, "use_bake_cache", text="")
+
+    row = first_column.row()
+    row.label(text="Isolate Bakes")
+    row = second_column.row()
+    row.prop(baking_settings, "use_bake_isolation", text="")
+
+    row = first_column.row()
+    row.label(text="Bake Render Profile")
+    row = second_column.row(align=True)
+    row.prop(baking_settings, "use_bake_render_profiles", text="")
+    row.operator("rymat.benchmark_bake_render_profile", text="", icon='TIME')
+
     # Ambient Occlusion Settings
     layout.separator()
     layout.label(text="AMBIENT OCCLUSION")
@@ -240,5 +302,6 @@ def draw_mesh_map_section_ui(self, context):
     ui_render_devices.draw_render_device_settings(layout)
 
     draw_mesh_map_status(layout, baking_settings)
+    draw_uv_island_tools(layout)
     #draw_mesh_map_previews(layout)
     draw_mesh_map_settings(layout, baking_settings)